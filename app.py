@@ -12,7 +12,7 @@ import html
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from chatbot import GA4Chatbot
-from fuzzy_matcher import DimensionMetricMatcher, EditorMatcher, AuthorMatcher
+from fuzzy_matcher import DimensionMetricMatcher, EditorMatcher, AuthorMatcher, match_memo_stats
 from ga4_client import BRAND_PROPERTIES
 
 # Sayfa ayarlari
@@ -157,21 +157,29 @@ with st.sidebar:
     if st.button("🔄 Chatbot'u Baslat/Yenile", use_container_width=True):
         with st.spinner("Chatbot yukleniyor..."):
             try:
-                # Secili marka ile chatbot baslat
-                from ga4_client import GA4Client
-                client = GA4Client(brand=st.session_state.selected_brand)
-                st.session_state.chatbot = GA4Chatbot()
-                st.session_state.chatbot.client = client  # Client'i degistir
+                # Secili marka ile chatbot baslat - client ve matcher'lar ayni markaya bagli
+                # Sonuclar oturum boyunca mesajlarda saklandigi icin compact dtype'lar acik
+                st.session_state.chatbot = GA4Chatbot(
+                    brand=st.session_state.selected_brand,
+                    compact_dtypes=True
+                )
                 # Editor ve Author matcher'lari chatbot'tan al
                 st.session_state.editor_matcher = st.session_state.chatbot.editor_matcher
                 st.session_state.author_matcher = st.session_state.chatbot.author_matcher
-                st.success(f"Chatbot basariyla yuklendi! ({client.brand_name})")
+                st.success(f"Chatbot basariyla yuklendi! ({st.session_state.chatbot.client.brand_name})")
             except Exception as e:
                 st.error(f"Hata: {str(e)}")
 
     if st.session_state.chatbot:
         brand_info = BRAND_PROPERTIES.get(st.session_state.selected_brand, {})
         st.success(f"✅ Aktif: {brand_info.get('name', 'Bilinmeyen')}")
+        memory_stats = st.session_state.chatbot.client.memory_stats
+        if memory_stats["frames"]:
+            saved_mb = st.session_state.chatbot.client.memory_saved / (1024 * 1024)
+            st.caption(f"💾 Bellek tasarrufu: {saved_mb:.2f} MB ({memory_stats['frames']} tablo)")
+        memo_stats = match_memo_stats()
+        if memo_stats["hits"] + memo_stats["misses"]:
+            st.caption(f"🧠 Eslestirme onbellegi: %{memo_stats['hit_rate'] * 100:.0f} isabet ({memo_stats['entries']} kayit)")
     else:
         st.warning("⚠️ Chatbot baslatilmadi")
 
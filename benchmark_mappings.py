@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+ga4_mappings arama fonksiyonları için mikro benchmark
+
+Indeksli get_dimension_info / get_metric_info / get_api_name_from_tr /
+get_tr_name_from_api fonksiyonlarını eski doğrusal tarama sürümleriyle
+karşılaştırır: önce tüm isimler için sonuçların aynı olduğunu doğrular,
+sonra çağrı başına süreleri ölçer.
+
+Kullanım:
+    python benchmark_mappings.py
+"""
+
+import timeit
+
+from ga4_mappings import (
+    DIMENSIONS,
+    METRICS,
+    CUSTOM_DIMENSIONS,
+    CUSTOM_METRICS,
+    get_dimension_info,
+    get_metric_info,
+    get_api_name_from_tr,
+    get_tr_name_from_api,
+)
+
+
+# =============================================================================
+# REFERANS - eski doğrusal tarama sürümleri
+# =============================================================================
+
+def linear_dimension_info(name):
+    for source in (DIMENSIONS, CUSTOM_DIMENSIONS):
+        for key, value in source.items():
+            if key == name or value["api_name"] == name or value["tr_name"] == name:
+                return value
+    return None
+
+
+def linear_metric_info(name):
+    for source in (METRICS, CUSTOM_METRICS):
+        for key, value in source.items():
+            if key == name or value["api_name"] == name or value["tr_name"] == name:
+                return value
+    return None
+
+
+def linear_api_name_from_tr(tr_name):
+    for source in (DIMENSIONS, CUSTOM_DIMENSIONS, METRICS, CUSTOM_METRICS):
+        for key, value in source.items():
+            if value["tr_name"].lower() == tr_name.lower():
+                return value["api_name"]
+    return None
+
+
+def linear_tr_name_from_api(api_name):
+    clean_api_name = api_name.replace("customEvent:", "")
+    for source in (DIMENSIONS, CUSTOM_DIMENSIONS, METRICS, CUSTOM_METRICS):
+        for key, value in source.items():
+            if value["api_name"] == api_name or key == clean_api_name:
+                return value["tr_name"]
+    return api_name
+
+
+PAIRS = [
+    ("get_dimension_info", get_dimension_info, linear_dimension_info),
+    ("get_metric_info", get_metric_info, linear_metric_info),
+    ("get_api_name_from_tr", get_api_name_from_tr, linear_api_name_from_tr),
+    ("get_tr_name_from_api", get_tr_name_from_api, linear_tr_name_from_api),
+]
+
+
+def sample_names() -> list:
+    """Tüm anahtarlar, API adları, Türkçe adlar ve birkaç olmayan isim"""
+    names = []
+    for source in (DIMENSIONS, CUSTOM_DIMENSIONS, METRICS, CUSTOM_METRICS):
+        for key, value in source.items():
+            names.extend([key, value["api_name"], value["tr_name"], value["tr_name"].upper()])
+    names.extend(["customEvent:editor", "olmayanAlan", "", "Sayfa görüntüleme"])
+    return names
+
+
+def verify(names: list) -> int:
+    """Indeksli ve doğrusal sürümlerin aynı sonucu verdiğini doğrular"""
+    mismatches = 0
+    for label, fast, slow in PAIRS:
+        for name in names:
+            if fast(name) is not slow(name) and fast(name) != slow(name):
+                mismatches += 1
+                print(f"  [FARK] {label}({name!r}): {fast(name)!r} != {slow(name)!r}")
+    return mismatches
+
+
+def bench(names: list, repeat: int = 5):
+    """Her fonksiyon için çağrı başına ortalama süreyi ölçer"""
+    print(f"\n{'Fonksiyon':<24}{'Doğrusal (µs)':>16}{'Indeksli (µs)':>16}{'Hızlanma':>12}")
+    print("-" * 68)
+    for label, fast, slow in PAIRS:
+        slow_time = min(timeit.repeat(lambda: [slow(n) for n in names], number=1, repeat=repeat))
+        fast_time = min(timeit.repeat(lambda: [fast(n) for n in names], number=1, repeat=repeat))
+        per_slow = slow_time / len(names) * 1e6
+        per_fast = fast_time / len(names) * 1e6
+        print(f"{label:<24}{per_slow:>16.2f}{per_fast:>16.3f}{per_slow / per_fast:>11.0f}x")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("GA4 MAPPINGS ARAMA BENCHMARK")
+    print("=" * 60)
+
+    names = sample_names()
+    print(f"\nÖrnek isim sayısı: {len(names)}")
+
+    mismatches = verify(names)
+    print(f"Sonuç farkı: {mismatches}")
+
+    bench(names)
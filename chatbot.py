@@ -12,8 +12,13 @@ import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 from ga4_client import GA4Client
-from ga4_mappings import QUICK_QUERIES, DIMENSIONS, METRICS, CUSTOM_DIMENSIONS, CUSTOM_METRICS
-from fuzzy_matcher import EditorMatcher, AuthorMatcher, DimensionMetricMatcher
+from ga4_filters import date_range_values
+from ga4_transport import request_deadline
+from ga4_mappings import QUICK_QUERIES, DIMENSIONS, METRICS, CUSTOM_DIMENSIONS, CUSTOM_METRICS, get_tr_name_from_api
+from fuzzy_matcher import EditorMatcher, AuthorMatcher, DimensionMetricMatcher, NameMatchEngine, AUTHOR_MATCH_MIN_SCORE
+
+# Hizli menu on yuklemesine alinmayan komutlar (Realtime API batchRunReports kapsaminda degil)
+QUICK_PREFETCH_EXCLUDED = {"19"}
 
 # Turkce gun isimleri
 TURKISH_DAY_NAMES = {
@@ -38,15 +43,20 @@ TURKISH_DAY_NAMES = {
 class GA4Chatbot:
     """GA4 Chatbot - Keyword tabanli soru anlama"""
 
-    def __init__(self, brand: str = None):
+    def __init__(self, brand: str = None, query_timeout: float = 45.0, compact_dtypes: bool = False):
         """
         Chatbot'u baslat
 
         Args:
             brand: Marka adi ("hurriyet", "vatan", "cnnturk", "fanatik", "kanald", "milliyet", "posta")
                    None ise varsayilan olarak Hurriyet kullanilir
+            query_timeout: Bir kullanici sorgusunun tum GA4 cagrilari (yeniden denemeler dahil)
+                   icin saniye cinsinden sure siniri
+            compact_dtypes: Sonuc DataFrame'lerinde az degerli dimension'lari "category",
+                   metric'leri kucuk sayisal tiplerde tut (web arayuzunde bellek icin)
         """
-        self.client = GA4Client(brand=brand)
+        self.client = GA4Client(brand=brand, compact_dtypes=compact_dtypes)
+        self.query_timeout = query_timeout
         self.brand = brand or "hurriyet"
         self.editor_matcher = EditorMatcher(self.client)
         self.author_matcher = AuthorMatcher(self.client)
@@ -58,6 +68,7 @@ class GA4Chatbot:
             "date_range": {"start": "yesterday", "end": "yesterday"},
             "pending_disambiguation": None  # Editor/yazar secimi bekliyor mu?
         }
+        self._quick_prefetch_key = None  # Hizli menu raporlarinin toplu cekildigi (marka, gun)
 
         # Tarih pattern'leri - kapsamli Turkce tarih ifadeleri
         # NOT: Daha spesifik pattern'ler (hafta sonu gibi) once tanimlanmali
@@ -334,6 +345,16 @@ class GA4Chatbot:
                 ],
                 "handler": self._handle_popular_editors
             },
+            # cross_tab category/editor/device intent'lerinden once - "editorlerin kategori dagilimi"
+            "cross_tab": {
+                "patterns": [
+                    r"edit[oö]r\w*\s*(ve|x|×|/)?\s*kategori",
+                    r"kategori\w*\s*(ve|x|×|/)\s*edit[oö]r",
+                    r"cihaz\w*\s*(ve|x|×|/)?\s*kanal",
+                    r"kanal\w*\s*(ve|x|×|/)\s*cihaz",
+                ],
+                "handler": self._handle_cross_tab
+            },
             "top_pages": {
                 "patterns": [
                     r"en\s*[c,ç]ok\s*okunan",
@@ -581,7 +602,7 @@ class GA4Chatbot:
             "16": ("Giris sayfalari (dun)", lambda: self._handle_landing_pages("dun")),
             "17": ("Cikis sayfalari (dun)", lambda: self._handle_exit_pages("dun")),
             "18": ("Yeni vs Geri donen (dun)", lambda: self._handle_new_vs_returning("dun")),
-            "19": ("Anlik durum (bugun)", lambda: self._handle_real_time("bugun")),
+            "19": ("Anlik durum (son 30 dakika)", lambda: self._handle_real_time("simdi")),
         }
 
     def switch_brand(self, brand: str) -> bool:
@@ -623,8 +644,10 @@ class GA4Chatbot:
 
         # Tum sutunlarda (not set) ve bos degerleri kontrol et
         for col in result_df.columns:
-            # Sadece object (string) sutunlarinda filtrele
-            if result_df[col].dtype == 'object':
+            # Sadece metin sutunlarinda filtrele (object, string veya compact modda category)
+            col_dtype = result_df[col].dtype
+            if (col_dtype == 'object' or pd.api.types.is_string_dtype(col_dtype)
+                    or isinstance(col_dtype, pd.CategoricalDtype)):
                 # (not set), bos string, None degerleri filtrele
                 mask = ~(
                     (result_df[col] == "(not set)") |
@@ -634,6 +657,10 @@ class GA4Chatbot:
                 )
                 result_df = result_df[mask]
 
+            # Filtrelenen degerler kategori listesinde kalmasin
+            if isinstance(col_dtype, pd.CategoricalDtype):
+                result_df[col] = result_df[col].cat.remove_unused_categories()
+
         return result_df.reset_index(drop=True)
 
     def _add_percentage_columns(self, df: pd.DataFrame, exclude_cols: List[str] = None) -> pd.DataFrame:
@@ -1305,6 +1332,20 @@ class GA4Chatbot:
 
         return comparison
 
+    def _wants_period_delta(self, query: str) -> bool:
+        """
+        Sorgu sirali tabloyu onceki doneme gore degisimiyle mi istiyor?
+
+        Ornek sorgular:
+        - "en cok okunan haberler gecen haftaya gore"
+        - "populer editorler onceki doneme gore degisim"
+        """
+        query_lower = query.lower()
+        return bool(re.search(
+            r"(?:ge[cç]en|[oö]nceki)\s*(?:hafta|g[uü]n|ay|d[oö]nem)\w*\s*g[oö]re|de[gğ]i[sş]im",
+            query_lower
+        ))
+
     def _extract_publish_date_range(self, query: str) -> Optional[Tuple[str, str]]:
         """
         Sorgudan yayin tarihi araligini cikar.
@@ -1827,6 +1868,22 @@ class GA4Chatbot:
         category = self._extract_category(query)
         limit = self._extract_limit(query)
 
+        title = "En Cok Okunan Sayfalar"
+        if category:
+            title += f" ({category})"
+
+        # Onceki doneme gore degisim - iki donem tek istekte
+        if self._wants_period_delta(query):
+            df = self.client.compare_ranked(
+                dimensions=["pagePath"],
+                metrics=["screenPageViews", "totalUsers", "sessions"],
+                current_start=start_date,
+                current_end=end_date,
+                limit=limit,
+                filters={"cat1": category} if category else None
+            )
+            return self._format_dataframe(df, title + " - Onceki Doneme Gore", add_percentages=False)
+
         df = self.client.get_top_pages(
             start_date=start_date,
             end_date=end_date,
@@ -1834,10 +1891,6 @@ class GA4Chatbot:
             category=category
         )
 
-        title = "En Cok Okunan Sayfalar"
-        if category:
-            title += f" ({category})"
-
         return self._format_dataframe(df, title)
 
     def _handle_traffic_sources(self, query: str) -> str:
@@ -1913,6 +1966,37 @@ class GA4Chatbot:
 
         return self._format_dataframe(df, "Editor Performansi")
 
+    def _handle_cross_tab(self, query: str) -> str:
+        """Capraz tablo (editor x kategori, kanal x cihaz) - GA4 pivot raporu"""
+        start_date, end_date = self._extract_date_range(query)
+        limit = self._extract_limit(query) or 15
+
+        if re.search(r"edit[oö]r", query.lower()):
+            # Satirlar: en cok goruntulenen editorler, sutunlar: en buyuk kategoriler
+            df = self.client.run_pivot(
+                rows=["editor"],
+                columns=["cat1"],
+                metrics=["screenPageViews"],
+                start_date=start_date,
+                end_date=end_date,
+                row_limit=limit,
+                column_limit=8
+            )
+            title = "Editorlerin Kategori Dagilimi (Sayfa Goruntuleme)"
+        else:
+            df = self.client.run_pivot(
+                rows=["sessionDefaultChannelGroup"],
+                columns=["deviceCategory"],
+                metrics=["sessions"],
+                start_date=start_date,
+                end_date=end_date,
+                row_limit=limit,
+                column_limit=5
+            )
+            title = "Kanal x Cihaz (Oturum)"
+
+        return self._format_dataframe(df, title, add_percentages=False)
+
     def _handle_device_breakdown(self, query: str) -> str:
         """Cihaz dagilimi"""
         start_date, end_date = self._extract_date_range(query)
@@ -2201,29 +2285,30 @@ class GA4Chatbot:
         return self._format_dataframe(df, "Yeni vs Geri Donen Kullanicilar")
 
     def _handle_real_time(self, query: str) -> str:
-        """Anlik durum (bugunun verisi)"""
-        df = self.client.run_query(
-            dimensions=[],
-            metrics=["activeUsers", "sessions", "screenPageViews", "newUsers"],
-            start_date="today",
-            end_date="today",
-            return_type="list"
-        )
+        """Anlik durum - GA4 Realtime API (son 30 dakika, tum oturumlarca paylasilan kisa sureli onbellek)"""
+        summary = self.client.get_realtime_summary()
 
-        if not df:
+        if not summary:
             return "Veri bulunamadi."
 
-        data = df[0]
-
         output = []
         output.append("\n" + "="*50)
-        output.append("  ANLIK DURUM (Bugun)")
+        output.append("  ANLIK DURUM (Son 30 dakika)")
         output.append("="*50 + "\n")
 
-        output.append(f"  Aktif Kullanici:       {self._format_number(data.get('Aktif Kullanici', 0))}")
-        output.append(f"  Oturum Sayisi:         {self._format_number(data.get('Oturum Sayisi', 0))}")
-        output.append(f"  Sayfa Goruntuleme:     {self._format_number(data.get('Sayfa Goruntuleme', 0))}")
-        output.append(f"  Yeni Kullanici:        {self._format_number(data.get('Yeni Kullanici', 0))}")
+        output.append(f"  Aktif Kullanici:       {self._format_number(summary.get(get_tr_name_from_api('activeUsers'), 0))}")
+        output.append(f"  Sayfa Goruntuleme:     {self._format_number(summary.get(get_tr_name_from_api('screenPageViews'), 0))}")
+        output.append(f"  Etkinlik Sayisi:       {self._format_number(summary.get(get_tr_name_from_api('eventCount'), 0))}")
+
+        # Su an en cok okunan sayfalar (sayfa basligi / ekran adi)
+        df = self.client.run_realtime_report(
+            dimensions=["unifiedScreenName"],
+            metrics=["activeUsers"],
+            order_by="activeUsers",
+            limit=10
+        )
+        if not df.empty:
+            output.append(self._format_dataframe(df, "Su An En Cok Okunanlar", add_percentages=False))
 
         return "\n".join(output)
 
@@ -2307,6 +2392,17 @@ class GA4Chatbot:
         start_date, end_date = self._extract_date_range(query)
         limit = self._extract_limit(query)
 
+        # Onceki doneme gore degisim - iki donem tek istekte
+        if self._wants_period_delta(query):
+            df = self.client.compare_ranked(
+                dimensions=["editor"],
+                metrics=["screenPageViews", "totalUsers", "sessions"],
+                current_start=start_date,
+                current_end=end_date,
+                limit=limit
+            )
+            return self._format_dataframe(df, "En Populer Editorler - Onceki Doneme Gore", add_percentages=False)
+
         # Jenerik "editor" kullan - GA4Client marka bazli cozecek
         df = self.client.run_query(
             dimensions=["editor"],
@@ -2394,6 +2490,9 @@ class GA4Chatbot:
             return f"'{person_name}' isimli editor bulunamadi."
 
         # Tip belirtilmemis - once editor, sonra yazar dene
+        # (CSV'de yoksa iki liste de gerekebilir; birbirinden bagimsiz, tek batch'te cekilir)
+        if self.editor_matcher.csv_match(person_name) is None:
+            self._prefetch_rosters()
         editor_result = self.editor_matcher.find_editor(person_name)
 
         if editor_result["status"] in ["single", "multiple"]:
@@ -2413,7 +2512,8 @@ class GA4Chatbot:
     def _find_author_in_ga4(self, search_name: str, start_date: str, end_date: str) -> Optional[str]:
         """
         GA4'ten yazarlari cekip aranan ismi bul.
-        CSV olmadigi icin dogrudan GA4'teki vauthor dimension'indan arama yapar.
+        CSV olmadigi icin dogrudan GA4'teki author dimension'indan arama yapar;
+        tam/icerme/baslangic eslesmesi yoksa TF-IDF motoruna (NameMatchEngine) duser.
 
         Args:
             search_name: Aranan yazar ismi (orn: "muberra", "ahmet")
@@ -2462,19 +2562,18 @@ class GA4Chatbot:
             # Ilk kolon yazar olabilir
             author_col = df.columns[0]
 
+        authors = [str(author) for author in df[author_col].unique() if author and author != "(not set)"]
+
         # Yazarlar arasinda ara
         best_match = None
         best_score = 0
 
-        for author in df[author_col].unique():
-            if not author or author == "(not set)":
-                continue
-
-            author_normalized = normalize(str(author))
+        for author in authors:
+            author_normalized = normalize(author)
 
             # Tam eslesme
             if search_normalized == author_normalized:
-                return str(author)
+                return author
 
             # Icinde gecme (contains)
             if search_normalized in author_normalized:
@@ -2482,16 +2581,23 @@ class GA4Chatbot:
                 score = len(search_normalized) / len(author_normalized)
                 if score > best_score:
                     best_score = score
-                    best_match = str(author)
+                    best_match = author
 
             # Baslangic eslesmesi
             if author_normalized.startswith(search_normalized):
                 score = 0.9  # Baslangic eslesmesi yuksek skor
                 if score > best_score:
                     best_score = score
-                    best_match = str(author)
+                    best_match = author
 
-        return best_match
+        if best_match:
+            return best_match
+
+        # Bulunamadiysa bulanik arama (yazim hatasi vb.) - ayni yazar listesi icin motor tekrar kurulmaz
+        matches = NameMatchEngine.for_names(authors).search(
+            search_name, top_k=1, min_score=AUTHOR_MATCH_MIN_SCORE
+        )
+        return matches[0][0] if matches else None
 
     def _get_person_scorecard(self, person_code: str, person_type: str, start_date: str, end_date: str) -> str:
         """
@@ -3167,85 +3273,37 @@ Hizli erisim icin 'yardim' yazin veya numara girin.
                     if dotted not in [c.lower() for c in codes_to_query]:
                         codes_to_query.append(dotted)
 
-        # Tum kod varyasyonlari icin toplam deger hesapla
-        total_value = 0
-        found_any_data = False
-
-        for code in codes_to_query:
-            # Filtre olustur
-            filters = {dimension: code}
-
-            # Newstype filtresi varsa ekle (video, galeri, vb.)
-            if newstype_filter:
-                filters["newstype"] = newstype_filter
-
-            # Yayin tarihi filtresi varsa ekle
-            if publish_date_range:
-                pub_start, pub_end = publish_date_range
-                # publisheddate filtresi - tarih araliginda yayinlanan icerikler
-                # GA4'te tarih araligi filtresi icin birden fazla deger gerekebilir
-                # Simdilik tek tarih veya tarih araligi icin farkli sorgular yapacagiz
-
-                if pub_start == pub_end:
-                    # Tek gun
-                    filters["publisheddate"] = pub_start
-                else:
-                    # Tarih araligi - publisheddate dimension'i ile birlikte sorgu yapacagiz
-                    # ve sonuclari filtreleyecegiz
-                    pass  # Asagida ozel islem yapilacak
-
-            # Yayin tarihi araligi varsa ozel sorgu
-            if publish_date_range and publish_date_range[0] != publish_date_range[1]:
-                pub_start, pub_end = publish_date_range
-                # publisheddate dimension'i ile sorgu yap ve filtreleme uygula
-                pub_filters = {dimension: code}
-                # Newstype filtresi varsa ekle
-                if newstype_filter:
-                    pub_filters["newstype"] = newstype_filter
+        # Tum kod varyasyonlari tek istekte - IN listesi, toplam API tarafinda hesaplanir
+        filters = {dimension: {"in": codes_to_query}}
 
-                df = self.client.run_query(
-                    dimensions=["publisheddate"],
-                    metrics=[metric],
-                    start_date=start_date,
-                    end_date=end_date,
-                    filters=pub_filters,
-                    return_type="list"
-                )
+        # Newstype filtresi varsa ekle (video, galeri, vb.)
+        if newstype_filter:
+            filters["newstype"] = newstype_filter
 
-                if df:
-                    for row in df:
-                        # publisheddate sutununu bul - farkli formatlarda gelebilir
-                        published_date = None
-                        for key in row.keys():
-                            key_lower = key.lower()
-                            if 'publish' in key_lower or 'yayin' in key_lower or 'yayın' in key_lower:
-                                published_date = row[key]
-                                break
-
-                        # Tarih araliginda mi kontrol et
-                        if published_date and pub_start <= str(published_date) <= pub_end:
-                            found_any_data = True
-                            for key, val in row.items():
-                                if isinstance(val, (int, float)):
-                                    total_value += val
+        # Yayin tarihi filtresi - aralik ise gunlerin IN listesi, tek gun ise tam eslesme
+        if publish_date_range:
+            pub_start, pub_end = publish_date_range
+            if pub_start != pub_end:
+                filters["publisheddate"] = {"in": date_range_values(pub_start, pub_end)}
             else:
-                # Normal sorgu veya tek gun yayin tarihi
-                df = self.client.run_query(
-                    dimensions=[],
-                    metrics=[metric],
-                    start_date=start_date,
-                    end_date=end_date,
-                    filters=filters,
-                    return_type="list"
-                )
+                filters["publisheddate"] = pub_start
+
+        rows = self.client.run_query(
+            dimensions=[],
+            metrics=[metric],
+            start_date=start_date,
+            end_date=end_date,
+            filters=filters,
+            return_type="list"
+        )
 
-                if df:
-                    found_any_data = True
-                    # Tum satirlardaki degerleri topla
-                    for row in df:
-                        for key, val in row.items():
-                            if isinstance(val, (int, float)) and key != 'Tarih':
-                                total_value += val
+        # Toplam deger
+        total_value = 0
+        found_any_data = bool(rows)
+        for row in rows or []:
+            for key, val in row.items():
+                if isinstance(val, (int, float)):
+                    total_value += val
 
         if not found_any_data:
             return f"'{person_name}' icin veri bulunamadi."
@@ -3409,6 +3467,15 @@ Hizli erisim icin 'yardim' yazin veya numara girin.
             return f"{start_date} - {end_date}"
 
     def process_query(self, query: str) -> str:
+        """
+        Kullanici sorgusunu isle.
+        Sorgunun yaptigi tum GA4 cagrilari query_timeout suresi icinde bitmek zorunda;
+        deadline asagidaki tum cagrilara (sayfalar, batch, yeniden denemeler) tasinir.
+        """
+        with request_deadline(self.query_timeout):
+            return self._process_query(query)
+
+    def _process_query(self, query: str) -> str:
         """Kullanici sorgusunu isle"""
         query = query.strip()
 
@@ -3418,6 +3485,7 @@ Hizli erisim icin 'yardim' yazin veya numara girin.
 
         # Hizli komut mu?
         if query in self.quick_commands:
+            self._prefetch_quick_commands()
             _, handler = self.quick_commands[query]
             return handler()
 
@@ -3518,6 +3586,49 @@ Hizli erisim icin 'yardim' yazin veya numara girin.
 
         return self._format_dataframe(df, f"{title_prefix}: {resolved}")
 
+    def _prefetch_quick_commands(self):
+        """
+        Hizli menudeki bagimsiz raporlari tek seferde (batchRunReports) onbellege alir.
+        Handler'lar once toplama modunda calisir - run_query API'ye gitmez, parametreleri
+        toplanir; spec'ler run_batch ile en az sayida RPC'de cekilir. Marka basina gunde
+        bir kez yapilir, sonraki hizli komutlar onbellekten doner.
+        """
+        key = (self.brand, datetime.now().strftime("%Y-%m-%d"))
+        if self._quick_prefetch_key == key:
+            return
+        self._quick_prefetch_key = key
+
+        # Toplama sirasinda handler'larin yan etkileri (son tablo, bekleyen secim) geri alinir
+        saved_dataframe = self.last_dataframe
+        saved_pending = self.context["pending_disambiguation"]
+        with self.client.collect_queries() as specs:
+            for command, (_, handler) in self.quick_commands.items():
+                if command in QUICK_PREFETCH_EXCLUDED:
+                    continue
+                try:
+                    handler()
+                except Exception:
+                    pass
+        self.last_dataframe = saved_dataframe
+        self.context["pending_disambiguation"] = saved_pending
+
+        try:
+            self.client.run_batch(specs)
+        except Exception as e:
+            print(f"[UYARI] Hizli menu raporlari toplu cekilemedi: {str(e)}")
+
+    def _prefetch_rosters(self):
+        """Editor ve yazar listeleri ikisi de yuklu degilse tek batch isteginde ceker"""
+        with self.client.collect_queries() as specs:
+            self.editor_matcher.load_editors()
+            self.author_matcher.load_editors()
+        if len(specs) < 2:
+            return
+        try:
+            self.client.run_batch(specs)
+        except Exception as e:
+            print(f"[UYARI] Editor/yazar listeleri toplu cekilemedi: {str(e)}")
+
     def _show_help(self) -> str:
         """Yardim mesaji"""
         output = []
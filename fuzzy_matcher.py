@@ -16,10 +16,32 @@ Kullanim:
     metric = dm_matcher.find_metric("kac kisi")
 """
 
+import copy
 import re
-from typing import Dict, List, Optional, Tuple, Union
+import threading
+from collections import defaultdict, deque
+from types import MappingProxyType
+import numpy as np
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Union
 from difflib import SequenceMatcher
 
+from ga4_cache import ResponseCache
+
+
+# Eslestirme sonuclari icin surec geneli memo ayarlari - ayni sorgular ("goruntuleme",
+# "cansu", "spor") farkli oturumlarda binlerce kez tekrar eder. Anahtarlar index/roster
+# surumunu icerdigi icin roster degisince eski kayitlar kendiliginden gecersiz kalir
+MATCH_MEMO_MAX_ENTRIES = 4096
+MATCH_MEMO_TTL = 24 * 60 * 60
+
+# Isim eslestirme motoru (TF-IDF) ayarlari
+# - NAME_NGRAM_RANGE: vektorlestirmede kullanilan karakter n-gram uzunluklari
+# - NAME_MATCH_CANDIDATES: find_editor'da kurallar bos donerse alinacak en benzer aday sayisi
+# - AUTHOR_MATCH_MIN_SCORE: _find_author_in_ga4'te kabul edilen minimum benzerlik
+NAME_NGRAM_RANGE = (2, 3)
+NAME_MATCH_CANDIDATES = 30
+AUTHOR_MATCH_MIN_SCORE = 0.5
+
 
 # =============================================================================
 # TURKCE ALIAS TANIMLARI - Gunluk dil karsiliklari
@@ -259,11 +281,221 @@ METRIC_ALIASES = {
 }
 
 
+class MatchMemo:
+    """
+    Saf eslestirme fonksiyonlari icin thread-safe, boyut sinirli memo.
+    Sonuclar kopyalanarak saklanir ve dondurulur; cagiran sonucu degistirse de
+    memodaki kayit bozulmaz. "Bulunamadi" (None) sonuclari da saklanir.
+    """
+
+    def __init__(self, max_entries: int = MATCH_MEMO_MAX_ENTRIES):
+        self._cache = ResponseCache(max_entries=max_entries)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Kayit varsa kopyasini, yoksa compute() sonucunu (saklayarak) dondurur"""
+        entry = self._cache.get(key)
+        if entry is not None:
+            return copy.deepcopy(entry[0])
+
+        result = compute()
+        self._cache.set(key, (copy.deepcopy(result),), ttl=MATCH_MEMO_TTL)
+        return result
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self) -> Dict:
+        """Kayit sayisi, isabet/iska sayilari ve isabet orani"""
+        return self._cache.stats()
+
+
+# Tum matcher orneklerinin paylastigi memo
+match_memo = MatchMemo()
+
+
+def match_memo_stats() -> Dict:
+    """Surec geneli eslestirme memo istatistikleri"""
+    return match_memo.stats()
+
+
+class NgramIndex:
+    """
+    Alias'lar uzerinde karakter n-gram indexi - tum tabloyu taramadan aday uretir.
+
+    - Icerik (substring) adaylari trigram ters indexinden gelir (posting kesisimi)
+    - Fuzzy adaylari karakter sayisi matrisinden: SequenceMatcher.ratio() en fazla
+      quick_ratio (ortak karakter sayisi) kadar olabilir; bu ust sinir tek numpy
+      isleminde tum alias'lar icin hesaplanir, ratio sadece siniri yetenlere calisir
+    - Alias'lar eklenme sirasindaki numaralariyla tutulur ki esit skorlarda
+      tam taramayla ayni alias secilsin
+    """
+
+    def __init__(self, aliases: List[str], n: int = 3):
+        """
+        Args:
+            aliases: Indexlenecek alias'lar (kucuk harf, sirali)
+            n: Gram uzunlugu
+        """
+        self.n = n
+        self.aliases = list(aliases)
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._gram_counts: List[int] = []
+        self._short: List[int] = []
+
+        for alias_id, alias in enumerate(self.aliases):
+            grams = self._grams(alias)
+            for gram in grams:
+                self._postings[gram].append(alias_id)
+            self._gram_counts.append(len(grams))
+            if not grams:
+                self._short.append(alias_id)
+
+        # Fuzzy ust siniri icin alias x karakter sayisi matrisi
+        alphabet = sorted({char for alias in self.aliases for char in alias})
+        self._char_columns = {char: column for column, char in enumerate(alphabet)}
+        self._char_counts = np.zeros((len(self.aliases), len(alphabet)), dtype=np.int32)
+        for alias_id, alias in enumerate(self.aliases):
+            for char in alias:
+                self._char_counts[alias_id, self._char_columns[char]] += 1
+        self._lengths = np.array([len(alias) for alias in self.aliases], dtype=np.int64)
+
+    def _grams(self, text: str) -> set:
+        """Metnin n-gram kumesi"""
+        return {text[i:i + self.n] for i in range(len(text) - self.n + 1)}
+
+    def containment_candidates(self, query: str) -> List[int]:
+        """
+        query'yi iceren veya query'nin icerdigi alias'lar (sirali alias numaralari).
+
+        - query alias'in icindeyse alias query'nin tum gram'larini tasir
+          (posting listelerinin kesisimi)
+        - alias query'nin icindeyse alias'in tum gram'lari query'de vardir
+          (alias basina ortak gram sayisi == alias'in gram sayisi)
+        - n'den kisa alias'lar her zaman aday; n'den kisa sorguda tum alias'lar taranir
+        """
+        query_grams = self._grams(query)
+        if not query_grams:
+            return [alias_id for alias_id, alias in enumerate(self.aliases) if query in alias or alias in query]
+
+        postings = sorted((self._postings.get(gram, []) for gram in query_grams), key=len)
+        containing = set(postings[0])
+        for posting in postings[1:]:
+            if not containing:
+                break
+            containing.intersection_update(posting)
+
+        hits: Dict[int, int] = defaultdict(int)
+        for posting in postings:
+            for alias_id in posting:
+                hits[alias_id] += 1
+        contained = {alias_id for alias_id, count in hits.items() if count == self._gram_counts[alias_id]}
+
+        candidates = containing | contained | set(self._short)
+        return sorted(alias_id for alias_id in candidates
+                      if query in self.aliases[alias_id] or self.aliases[alias_id] in query)
+
+    def fuzzy_candidates(self, query: str, min_score: float) -> List[Tuple[int, float]]:
+        """
+        ratio() ust siniri min_score'a ulasan alias'lar.
+
+        Returns:
+            [(alias_no, ust_sinir), ...] - ust sinira gore azalan, esitlikte alias sirasina gore
+        """
+        query_columns = defaultdict(int)
+        for char in query:
+            if char in self._char_columns:
+                query_columns[self._char_columns[char]] += 1
+        if not query_columns:
+            return []
+
+        columns = list(query_columns)
+        overlap = np.minimum(self._char_counts[:, columns], np.array(list(query_columns.values()))).sum(axis=1)
+        bounds = 2.0 * overlap / (self._lengths + len(query))
+
+        candidate_ids = np.flatnonzero(bounds >= min_score)
+        order = np.lexsort((candidate_ids, -bounds[candidate_ids]))
+        return [(int(candidate_ids[k]), float(bounds[candidate_ids[k]])) for k in order]
+
+
+class AhoCorasick:
+    """
+    Coklu desen arama otomati (Aho-Corasick).
+    Tum desenler tek trie'de tutulur; metin tek gecisle taranir ve her desenin
+    tum gecisleri bulunur - maliyet desen sayisindan bagimsiz, metin uzunluguyla dogrusal.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, object]]):
+        """
+        Args:
+            patterns: (desen, etiket) ciftleri - ayni desen birden fazla etiket tasiyabilir
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, object]]] = [[]]
+
+        for pattern, payload in patterns:
+            if not pattern:
+                continue
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                node = next_node
+            self._output[node].append((len(pattern), payload))
+
+        # Basarisizlik baglantilari - genislik oncelikli
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                if self._fail[child] == child:
+                    self._fail[child] = 0
+                # Sonek olan desenlerin ciktilari da bu dugumde biter
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, object]]:
+        """Metindeki tum desen gecislerini (baslangic, bitis, etiket) olarak uretir"""
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                for length, payload in output[node]:
+                    yield position + 1 - length, position + 1, payload
+
+
 class DimensionMetricMatcher:
     """Turkce gunluk dil ile dimension/metric eslemesi yapar"""
 
-    def __init__(self):
-        """Matcher'i baslat ve alias index'lerini olustur"""
+    # Cumleden cikarimda dikkate alinan minimum alias uzunlugu
+    MIN_EXTRACT_ALIAS_LENGTH = 3
+
+    # Tum dimension ve metric alias'lari uzerindeki otomat - surecte bir kez kurulur
+    _automaton: Optional[AhoCorasick] = None
+    _automaton_lock = threading.Lock()
+
+    def __init__(self, word_boundary: bool = False):
+        """
+        Matcher'i baslat ve alias index'lerini olustur
+
+        Args:
+            word_boundary: Cumleden cikarimda alias'lar sadece kelime basinda eslesir
+                ("bugun" icindeki "gun" sayilmaz); sag taraf serbest kalir ki Turkce
+                ekli halleri ("kategoride", "sayfalari") yine eslessin
+        """
+        self.word_boundary = word_boundary
         self._dimension_index: Dict[str, str] = {}
         self._metric_index: Dict[str, str] = {}
         self._build_indexes()
@@ -286,6 +518,27 @@ class DimensionMetricMatcher:
             for alias in aliases:
                 self._metric_index[alias.lower()] = api_name
 
+        # Fuzzy arama icin trigram ters indexleri
+        self._dimension_ngrams = NgramIndex(list(self._dimension_index))
+        self._metric_ngrams = NgramIndex(list(self._metric_index))
+
+        # Memo anahtarlarindaki index surumu - alias tablolari degisirse degisir
+        self.index_version = hash((tuple(self._dimension_index.items()), tuple(self._metric_index.items())))
+
+        # Cumleden cikarim icin Aho-Corasick otomati (alias tablolari modul sabiti)
+        with self._automaton_lock:
+            if DimensionMetricMatcher._automaton is None:
+                DimensionMetricMatcher._automaton = self._build_automaton()
+
+    def _build_automaton(self) -> AhoCorasick:
+        """Dimension ve metric alias'larindan tek otomat kurar (etiket: (tur, api_adi, alias))"""
+        patterns = []
+        for kind, index in (("dimension", self._dimension_index), ("metric", self._metric_index)):
+            for alias, api_name in index.items():
+                if len(alias) >= self.MIN_EXTRACT_ALIAS_LENGTH:
+                    patterns.append((alias, (kind, api_name, alias)))
+        return AhoCorasick(patterns)
+
     def _normalize_query(self, query: str) -> str:
         """Sorguyu normalize et (kucuk harf, fazla bosluk temizle)"""
         query = query.lower().strip()
@@ -309,51 +562,10 @@ class DimensionMetricMatcher:
             {"api_name": "deviceCategory", "score": 0.95, "matched_alias": "cihaz"}
             veya None
         """
-        query = self._normalize_query(query)
-
-        # 1. Tam esleme kontrolu
-        if query in self._dimension_index:
-            return {
-                "api_name": self._dimension_index[query],
-                "score": 1.0,
-                "matched_alias": query,
-                "match_type": "exact"
-            }
-
-        # 2. Icerik kontrolu (query bir alias'in icinde mi?)
-        best_match = None
-        best_score = 0
-
-        for alias, api_name in self._dimension_index.items():
-            # Alias query'yi icerir mi veya query alias'i icerir mi?
-            if query in alias or alias in query:
-                # Uzunluk oranina gore skor
-                score = min(len(query), len(alias)) / max(len(query), len(alias))
-                score = max(score, 0.7)  # Minimum 0.7
-
-                if score > best_score:
-                    best_score = score
-                    best_match = {
-                        "api_name": api_name,
-                        "score": score,
-                        "matched_alias": alias,
-                        "match_type": "contains"
-                    }
-
-        # 3. Fuzzy esleme
-        if best_score < threshold:
-            for alias, api_name in self._dimension_index.items():
-                score = self._similarity_score(query, alias)
-                if score > best_score and score >= threshold:
-                    best_score = score
-                    best_match = {
-                        "api_name": api_name,
-                        "score": score,
-                        "matched_alias": alias,
-                        "match_type": "fuzzy"
-                    }
-
-        return best_match if best_score >= threshold else None
+        key = ("find_dimension", self.index_version, self._normalize_query(query), threshold)
+        return match_memo.get_or_compute(
+            key, lambda: self._find_in_index(query, self._dimension_index, self._dimension_ngrams, threshold)
+        )
 
     def find_metric(self, query: str, threshold: float = 0.6) -> Optional[Dict]:
         """
@@ -367,43 +579,69 @@ class DimensionMetricMatcher:
             {"api_name": "totalUsers", "score": 0.95, "matched_alias": "kac kisi"}
             veya None
         """
+        key = ("find_metric", self.index_version, self._normalize_query(query), threshold)
+        return match_memo.get_or_compute(
+            key, lambda: self._find_in_index(query, self._metric_index, self._metric_ngrams, threshold)
+        )
+
+    def _find_in_index(
+        self,
+        query: str,
+        index: Dict[str, str],
+        ngrams: NgramIndex,
+        threshold: float
+    ) -> Optional[Dict]:
+        """
+        Alias index'inde tam / icerik / fuzzy esleme yapar.
+        Icerik ve fuzzy adimlari sadece trigram indexinden gelen adaylari skorlar.
+        """
         query = self._normalize_query(query)
 
-        # 1. Tam esleme
-        if query in self._metric_index:
+        # 1. Tam esleme kontrolu
+        if query in index:
             return {
-                "api_name": self._metric_index[query],
+                "api_name": index[query],
                 "score": 1.0,
                 "matched_alias": query,
                 "match_type": "exact"
             }
 
-        # 2. Icerik kontrolu
+        # 2. Icerik kontrolu (query bir alias'in icinde mi veya alias query'nin icinde mi?)
         best_match = None
         best_score = 0
 
-        for alias, api_name in self._metric_index.items():
-            if query in alias or alias in query:
-                score = min(len(query), len(alias)) / max(len(query), len(alias))
-                score = max(score, 0.7)
-
-                if score > best_score:
-                    best_score = score
-                    best_match = {
-                        "api_name": api_name,
-                        "score": score,
-                        "matched_alias": alias,
-                        "match_type": "contains"
-                    }
+        for alias_id in ngrams.containment_candidates(query):
+            alias = ngrams.aliases[alias_id]
+            # Uzunluk oranina gore skor
+            score = min(len(query), len(alias)) / max(len(query), len(alias))
+            score = max(score, 0.7)  # Minimum 0.7
+
+            if score > best_score:
+                best_score = score
+                best_match = {
+                    "api_name": index[alias],
+                    "score": score,
+                    "matched_alias": alias,
+                    "match_type": "contains"
+                }
 
-        # 3. Fuzzy esleme
+        # 3. Fuzzy esleme - adaylar ust sinira gore azalan sirada gelir; sinir mevcut
+        # en iyi skorun altina dusunce kalanlar gecemez. Esit skorda alias sirasi
+        # kucuk olan kazanir (tam taramadaki ilk eslesme)
         if best_score < threshold:
-            for alias, api_name in self._metric_index.items():
+            best_id = None
+            for alias_id, bound in ngrams.fuzzy_candidates(query, threshold):
+                if best_id is not None and bound < best_score:
+                    break
+                alias = ngrams.aliases[alias_id]
                 score = self._similarity_score(query, alias)
-                if score > best_score and score >= threshold:
+                if score < threshold:
+                    continue
+                if score > best_score or (score == best_score and best_id is not None and alias_id < best_id):
                     best_score = score
+                    best_id = alias_id
                     best_match = {
-                        "api_name": api_name,
+                        "api_name": index[alias],
                         "score": score,
                         "matched_alias": alias,
                         "match_type": "fuzzy"
@@ -421,22 +659,7 @@ class DimensionMetricMatcher:
         Returns:
             [{"api_name": "veditor", ...}, {"api_name": "vcat1", ...}]
         """
-        query = self._normalize_query(query)
-        found = []
-        found_apis = set()
-
-        # Her alias'i kontrol et
-        for alias, api_name in self._dimension_index.items():
-            if len(alias) >= 3 and alias in query and api_name not in found_apis:
-                found.append({
-                    "api_name": api_name,
-                    "score": 0.9,
-                    "matched_alias": alias,
-                    "match_type": "extract"
-                })
-                found_apis.add(api_name)
-
-        return found
+        return self._extract_from_query(query)["dimension"]
 
     def extract_metrics_from_query(self, query: str) -> List[Dict]:
         """
@@ -448,19 +671,49 @@ class DimensionMetricMatcher:
         Returns:
             [{"api_name": "totalUsers", ...}, {"api_name": "screenPageViews", ...}]
         """
+        return self._extract_from_query(query)["metric"]
+
+    def _extract_from_query(self, query: str) -> Dict[str, List[Dict]]:
+        """
+        Cumledeki dimension ve metric alias'larini tek gecisle bulur.
+
+        - Ust uste binen eslesmelerde en uzun alias kazanir ("sayfa goruntuleme"
+          metric'i icindeki "sayfa" ayrica pagePath olarak sayilmaz)
+        - Sonuclar cumledeki siraya gore, her api_name bir kez doner
+
+        Returns:
+            {"dimension": [...], "metric": [...]}
+        """
         query = self._normalize_query(query)
-        found = []
-        found_apis = set()
 
-        for alias, api_name in self._metric_index.items():
-            if len(alias) >= 3 and alias in query and api_name not in found_apis:
-                found.append({
+        matches = {}
+        for start, end, payload in self._automaton.iter_matches(query):
+            if self.word_boundary and start > 0 and query[start - 1].isalnum():
+                continue
+            matches.setdefault((start, end), []).append(payload)
+
+        # En uzun eslesmeden baslayarak cakismayanlari sec
+        taken = [False] * len(query)
+        selected = []
+        for start, end in sorted(matches, key=lambda span: (span[0] - span[1], span[0])):
+            if any(taken[start:end]):
+                continue
+            taken[start:end] = [True] * (end - start)
+            selected.append((start, end))
+
+        found = {"dimension": [], "metric": []}
+        found_apis = {"dimension": set(), "metric": set()}
+        for span in sorted(selected):
+            for kind, api_name, alias in matches[span]:
+                if api_name in found_apis[kind]:
+                    continue
+                found[kind].append({
                     "api_name": api_name,
                     "score": 0.9,
                     "matched_alias": alias,
                     "match_type": "extract"
                 })
-                found_apis.add(api_name)
+                found_apis[kind].add(api_name)
 
         return found
 
@@ -479,8 +732,9 @@ class DimensionMetricMatcher:
                 "raw_query": "..."
             }
         """
-        dimensions = self.extract_dimensions_from_query(query)
-        metrics = self.extract_metrics_from_query(query)
+        extracted = self._extract_from_query(query)
+        dimensions = extracted["dimension"]
+        metrics = extracted["metric"]
 
         # Potansiyel filtreler (basit keyword extraction)
         filters = {}
@@ -515,8 +769,14 @@ class DimensionMetricMatcher:
                 "confidence": "high" | "medium" | "low"
             }
         """
-        dims = self.extract_dimensions_from_query(query)
-        mets = self.extract_metrics_from_query(query)
+        key = ("suggest", self.index_version, self.word_boundary, self._normalize_query(query), top_n)
+        return match_memo.get_or_compute(key, lambda: self._suggest_for_query(query, top_n))
+
+    def _suggest_for_query(self, query: str, top_n: int) -> Dict:
+        """suggest_for_query'nin memo'suz hesaplamasi"""
+        extracted = self._extract_from_query(query)
+        dims = extracted["dimension"]
+        mets = extracted["metric"]
 
         # Eger hicbir sey bulunamazsa, sorguyu kelime kelime dene
         if not dims and not mets:
@@ -547,6 +807,194 @@ class DimensionMetricMatcher:
         }
 
 
+# Isim normalizasyonu: Turkce karakterler ASCII'ye, ayiricilar bosluga
+# (buyuk harfler lower()'dan once cevrilir - "İ".lower() iki karakter uretir)
+_NAME_FOLD = str.maketrans({
+    'ç': 'c', 'Ç': 'c', 'ğ': 'g', 'Ğ': 'g', 'ı': 'i', 'İ': 'i',
+    'ö': 'o', 'Ö': 'o', 'ş': 's', 'Ş': 's', 'ü': 'u', 'Ü': 'u',
+    '.': ' ', '_': ' ', '-': ' '
+})
+
+
+class NameMatchEngine:
+    """
+    Karakter n-gram TF-IDF isim eslestirme motoru.
+
+    Roster kodlari ve gercek isimler bir kez seyrek TF-IDF matrisine cevrilir
+    (sutun bazli: gram -> [belge no], [agirlik]). Sorgu skoru tek seyrek matris-vektor
+    carpimi (np.bincount) ve top-k secimiyle (np.argpartition) hesaplanir; Python
+    dongusu sadece sorgunun gram'lari kadardir, roster buyudukce gecikme sabit kalir.
+
+    Bir anahtar (editor kodu) birden fazla metinle temsil edilebilir (kod, gercek isim);
+    anahtarin skoru metinlerinin en yuksek kosinus benzerligidir.
+    """
+
+    # Ayni isim listesi icin kurulan motorlar (ör. _find_author_in_ga4'un yazar listesi)
+    _engines = ResponseCache(max_entries=32)
+
+    def __init__(self, entries: Iterable[Tuple[str, str]], ngram_range: Tuple[int, int] = NAME_NGRAM_RANGE):
+        """
+        Args:
+            entries: (metin, anahtar) ciftleri - ör. ("Cemile Gelgec", "c.gelgec")
+            ngram_range: (min, max) karakter n-gram uzunlugu
+        """
+        self.ngram_range = ngram_range
+        self.keys: List[str] = []
+        key_ids: Dict[str, int] = {}
+        document_keys = []
+        documents = []
+
+        for text, key in entries:
+            grams = self._gram_counts(text)
+            if not grams:
+                continue
+            if key not in key_ids:
+                key_ids[key] = len(self.keys)
+                self.keys.append(key)
+            document_keys.append(key_ids[key])
+            documents.append(grams)
+
+        self._document_keys = np.array(document_keys, dtype=np.int64)
+
+        # IDF (sklearn'deki smooth_idf ile ayni): log((1 + N) / (1 + df)) + 1
+        document_frequency = defaultdict(int)
+        for grams in documents:
+            for gram in grams:
+                document_frequency[gram] += 1
+        total = len(documents)
+        self._idf = {gram: float(np.log((1 + total) / (1 + df)) + 1) for gram, df in document_frequency.items()}
+
+        # L2 normalize belge vektorleri, sutun bazli seyrek saklama
+        columns = defaultdict(list)
+        for document_id, grams in enumerate(documents):
+            weights = self._weights(grams)
+            for gram, weight in weights.items():
+                columns[gram].append((document_id, weight))
+
+        self._vocabulary: Dict[str, Tuple[int, int]] = {}
+        rows, values = [], []
+        for gram, cells in columns.items():
+            start = len(rows)
+            for document_id, weight in cells:
+                rows.append(document_id)
+                values.append(weight)
+            self._vocabulary[gram] = (start, len(rows))
+        self._rows = np.array(rows, dtype=np.int64)
+        self._values = np.array(values, dtype=np.float64)
+
+    @classmethod
+    def for_names(cls, names: Iterable[str]) -> "NameMatchEngine":
+        """Her ismin kendisini anahtar kabul eden motor (ayni liste icin tekrar kurulmaz)"""
+        names = tuple(names)
+        engine = cls._engines.get(names)
+        if engine is None:
+            engine = cls((name, name) for name in names)
+            cls._engines.set(names, engine, ttl=MATCH_MEMO_TTL)
+        return engine
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Turkce karakterleri ASCII'ye cevirir, ayiricilari bosluga, kucuk harfe indirir"""
+        return " ".join(str(text).translate(_NAME_FOLD).lower().split())
+
+    def _gram_counts(self, text: str) -> Dict[str, int]:
+        """Metnin (bas/son bosluklu) n-gram sayilari"""
+        text = self.normalize(text)
+        if not text:
+            return {}
+        padded = f" {text} "
+        counts = defaultdict(int)
+        for n in range(self.ngram_range[0], self.ngram_range[1] + 1):
+            for i in range(len(padded) - n + 1):
+                counts[padded[i:i + n]] += 1
+        return counts
+
+    def _weights(self, grams: Dict[str, int]) -> Dict[str, float]:
+        """Alt-lineer TF x IDF, L2 normalize (sozlukte olmayan gram'lar atlanir)"""
+        weights = {gram: (1 + np.log(count)) * self._idf[gram] for gram, count in grams.items() if gram in self._idf}
+        norm = float(np.sqrt(sum(w * w for w in weights.values())))
+        if not norm:
+            return {}
+        return {gram: w / norm for gram, w in weights.items()}
+
+    def search(self, query: str, top_k: int = 10, min_score: float = 0.0) -> List[Tuple[str, float]]:
+        """
+        Sorguya en benzer anahtarlar.
+
+        Args:
+            query: Aranan isim/kod
+            top_k: Dondurulecek maksimum anahtar sayisi
+            min_score: Minimum kosinus benzerligi
+
+        Returns:
+            [(anahtar, skor), ...] - skora gore azalan
+        """
+        query_weights = self._weights(self._gram_counts(query))
+        if not query_weights or not self.keys:
+            return []
+
+        # Seyrek matris-vektor carpimi: sorgunun gram sutunlarindaki (belge, agirlik) ciftleri
+        slices = [self._vocabulary[gram] for gram in query_weights]
+        index = np.concatenate([np.arange(start, end) for start, end in slices])
+        factors = np.repeat([query_weights[gram] for gram in query_weights], [end - start for start, end in slices])
+        document_scores = np.bincount(self._rows[index], weights=self._values[index] * factors,
+                                      minlength=len(self._document_keys))
+
+        # Anahtar skoru = metinlerinin en yuksegi
+        key_scores = np.zeros(len(self.keys))
+        np.maximum.at(key_scores, self._document_keys, document_scores)
+
+        candidates = np.flatnonzero(key_scores >= max(min_score, 1e-12))
+        if len(candidates) > top_k:
+            candidates = candidates[np.argpartition(-key_scores[candidates], top_k - 1)[:top_k]]
+        candidates = candidates[np.lexsort((candidates, -key_scores[candidates]))]
+        return [(self.keys[i], round(float(key_scores[i]), 6)) for i in candidates]
+
+
+class CharCountIndex:
+    """
+    Metin listesinin karakter sayilari (satir: metin, sutun: karakter) - SequenceMatcher
+    benzerligi icin vektorel ust sinir.
+
+    ratio(a, b) = 2 * M / (len(a) + len(b)) ve eslesen karakter sayisi M, iki metnin
+    ortak karakter sayisini (coklu kume kesisimi) gecemez (difflib'deki quick_ratio).
+    Bu sinir tum metinler icin tek matris islemiyle hesaplanir; siniri esigi gecmeyen
+    metnin ratio'su da esigi gecemez, skorlanmadan elenebilir.
+    """
+
+    def __init__(self, texts: List[Optional[str]]):
+        """
+        Args:
+            texts: Metinler (None veya bos metin hicbir sorguyla eslesmez)
+        """
+        alphabet = sorted({char for text in texts if text for char in text})
+        self._columns = {char: i for i, char in enumerate(alphabet)}
+        self._counts = np.zeros((len(texts), len(alphabet)), dtype=np.int32)
+        self._lengths = np.zeros(len(texts), dtype=np.int64)
+        for row, text in enumerate(texts):
+            for char in text or "":
+                self._counts[row, self._columns[char]] += 1
+            self._lengths[row] = len(text or "")
+
+    def common_counts(self, query: str) -> np.ndarray:
+        """Her metnin sorguyla ortak karakter sayisi"""
+        vector = np.zeros(len(self._columns), dtype=np.int32)
+        for char in query:
+            column = self._columns.get(char)
+            if column is not None:
+                vector[column] += 1
+        return np.minimum(self._counts, vector).sum(axis=1)
+
+    def ratio_above(self, query: str, threshold: float) -> np.ndarray:
+        """ratio'su threshold'u gecebilecek metinlerin maskesi (ust sinir > threshold)"""
+        bound = 2.0 * self.common_counts(query) / np.maximum(self._lengths + len(query), 1)
+        return (self._lengths > 0) & (bound > threshold)
+
+    def may_contain(self, query: str) -> np.ndarray:
+        """Sorguyu alt metin olarak icerebilecek metinlerin maskesi (tum karakterleri var)"""
+        return (self._lengths > 0) & (self.common_counts(query) >= len(query))
+
+
 class EditorMatcher:
     """Editor ve yazar isimlerini fuzzy matching ile esler - CSV dosyasindan gercek isimlerle"""
 
@@ -589,6 +1037,7 @@ class EditorMatcher:
         self._dot_variation_map: Dict[str, str] = {}  # Noktasiz kod -> orijinal kod (o.yenilmez icin)
         self._last_fetch_date: str = None
         self._csv_loaded: bool = False
+        self._roster_tables: Optional[Dict] = None  # Roster basina bir kez kurulan arama tablolari
 
     def _normalize_turkish(self, text: str) -> str:
         """Turkce karakterleri ASCII'ye donustur"""
@@ -720,6 +1169,7 @@ class EditorMatcher:
                 ]
 
                 self._last_fetch_date = today
+                self._build_roster_tables()
                 print(f"[OK] {len(self._editor_list)} editor yuklendi")
 
         except Exception as e:
@@ -727,6 +1177,80 @@ class EditorMatcher:
 
         return self._editor_list
 
+    def csv_match(self, query: str) -> Optional[str]:
+        """Sorgu CSV'deki bir gercek isimle (Turkce karaktersiz) eslesiyorsa username'i"""
+        self._load_csv_mapping()
+        return self._name_to_user_map.get(self._normalize_turkish(query.strip()))
+
+    def load_editors(self) -> List[str]:
+        """Editor listesini yukler (gunde bir kez GA4'ten cekilir, sonra bellekten)"""
+        return self._fetch_editors()
+
+    def _build_roster_tables(self) -> Dict:
+        """
+        Yuklenen roster icin degismez arama tablolarini kurar (roster basina bir kez).
+
+        - by_lower: kucuk harf kod -> kod (tam esleme ve noktali sorgunun noktasiz hali)
+        - by_dotless: "x.yyy" kodlarinin noktasiz hali -> kod (noktasiz sorgu icin)
+        - parts: kod -> parcalanmis kod - skorlama her sorguda yeniden parse etmez
+        - part_counts: isim/soyisim/tek parca kod parcalarinin CharCountIndex'leri ve bas harf
+          -> satir listesi (kural adaylarini tum roster'da vektorel on eleme, bkz. _rule_candidates)
+        - order: kod -> roster sirasi (esit skorlarda roster sirasi korunur)
+        - engine: kodlar ve CSV'deki gercek isimler uzerinde TF-IDF motoru (aday uretimi)
+        - version: marka + kod listesi + CSV eslesmelerinden memo surumu; yenilenen roster
+          farkliysa eski memo kayitlari eslesmez, ayni roster'i yukleyen oturumlar paylasir
+
+        Tablolar yeni nesneler olarak tek seferde atanir; eszamanli find_editor cagrilari
+        ya eski ya yeni roster'i tutarli sekilde gorur.
+        """
+        editors = self._editor_list
+        by_lower = {}
+        by_dotless = {}
+        for editor in editors:
+            editor_lower = editor.lower()
+            by_lower.setdefault(editor_lower, editor)
+            if len(editor_lower) > 2 and editor_lower[1] == '.' and editor_lower.count('.') == 1:
+                by_dotless.setdefault(editor_lower.replace('.', ''), editor)
+
+        parts = {editor: self._parse_editor_code(editor) for editor in editors}
+        initial_rows = defaultdict(list)
+        for row, editor in enumerate(editors):
+            if "initial" in parts[editor]:
+                initial_rows[parts[editor]["initial"]].append(row)
+
+        self._roster_tables = {
+            "editors": editors,
+            "by_lower": MappingProxyType(by_lower),
+            "by_dotless": MappingProxyType(by_dotless),
+            "parts": MappingProxyType({editor: MappingProxyType(parts[editor]) for editor in editors}),
+            "part_counts": {
+                field: CharCountIndex([parts[editor].get(field) for editor in editors])
+                for field in ("name", "surname", "full")
+            },
+            "initial_rows": MappingProxyType({
+                initial: np.array(rows, dtype=np.int64) for initial, rows in initial_rows.items()
+            }),
+            "order": MappingProxyType({editor: i for i, editor in enumerate(editors)}),
+            "engine": NameMatchEngine(self._engine_entries(editors)),
+            "version": hash((
+                type(self).__name__,
+                getattr(self.client, "property_id", None),
+                tuple(editors),
+                len(self._name_to_user_map)
+            ))
+        }
+        return self._roster_tables
+
+    def _engine_entries(self, editors: List[str]) -> List[Tuple[str, str]]:
+        """Motor icin (metin, kod) ciftleri: her kodun kendisi ve varsa CSV'deki gercek ismi"""
+        entries = []
+        for editor in editors:
+            entries.append((editor, editor))
+            real_name = self.get_real_name(editor)
+            if real_name:
+                entries.append((real_name, editor))
+        return entries
+
     def get_real_name(self, username: str) -> Optional[str]:
         """
         Username'den gercek ismi al
@@ -844,18 +1368,20 @@ class EditorMatcher:
         """
         return SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
 
-    def _match_score(self, code: str, query_parts: Dict) -> Tuple[float, str]:
+    def _match_score(self, code: str, query_parts: Dict, code_parts: Dict = None) -> Tuple[float, str]:
         """
         Bir editor kodu ile sorgu arasindaki esleme skorunu hesapla
 
         Args:
             code: Editor kodu
             query_parts: Parcalanmis sorgu
+            code_parts: Onceden parcalanmis kod (roster tablolarindan; yoksa parse edilir)
 
         Returns:
             (skor, aciklama) tuple'i
         """
-        code_parts = self._parse_editor_code(code)
+        if code_parts is None:
+            code_parts = self._parse_editor_code(code)
         score = 0.0
         reason = ""
 
@@ -935,6 +1461,45 @@ class EditorMatcher:
 
         return score, reason
 
+    def _rule_candidates(self, query_parts: Dict, tables: Dict) -> List[str]:
+        """
+        _match_score'un sifirdan buyuk skor verebilecegi kodlar (roster sirasiyla).
+
+        Her kural bir bas harf esitligi, bir icerme ya da bir SequenceMatcher esigi ister;
+        bas harf satirlari tablodan, icerme ve benzerlik esikleri CharCountIndex ust
+        siniriyla tum roster icin numpy ile bulunur. Elenen kodlarin skoru zaten 0'dir.
+
+        Args:
+            query_parts: Parcalanmis sorgu (_parse_query)
+            tables: Roster tablolari (_build_roster_tables)
+
+        Returns:
+            Aday editor kodlari
+        """
+        counts = tables["part_counts"]
+
+        if "name" in query_parts and "surname" in query_parts:
+            q_name = query_parts["name"]
+            q_surname = query_parts["surname"]
+            mask = counts["name"].ratio_above(q_name, 0.7) & counts["surname"].ratio_above(q_surname, 0.7)
+            mask |= counts["full"].may_contain(q_name) | counts["full"].may_contain(q_surname)
+            mask |= counts["full"].ratio_above(q_name + q_surname, 0.6)
+            initial = q_name[0]
+        elif "name_or_surname" in query_parts:
+            q_term = query_parts["name_or_surname"]
+            mask = counts["name"].ratio_above(q_term, 0.7) | counts["surname"].ratio_above(q_term, 0.7)
+            mask |= counts["full"].ratio_above(q_term, 0.6) | counts["full"].may_contain(q_term)
+            initial = q_term[0]
+        else:
+            return []
+
+        rows = tables["initial_rows"].get(initial)
+        if rows is not None:
+            mask[rows] = True
+
+        editors = tables["editors"]
+        return [editors[row] for row in np.flatnonzero(mask)]
+
     def find_editor(
         self,
         query: str,
@@ -956,14 +1521,9 @@ class EditorMatcher:
                 "message": "Kullaniciya gosterilecek mesaj"
             }
         """
-        # CSV mapping'i yukle (oncelikli kaynak)
-        self._load_csv_mapping()
-
-        # ONCE CSV'den gercek isim -> username eslesmesini kontrol et
-        # Sorguyu normalize et (Turkce karaktersiz arama icin)
-        query_normalized = self._normalize_turkish(query.strip())
-        if query_normalized in self._name_to_user_map:
-            username = self._name_to_user_map[query_normalized]
+        # ONCE CSV'den gercek isim -> username eslesmesini kontrol et (oncelikli kaynak)
+        username = self.csv_match(query)
+        if username is not None:
             real_name = self._user_to_name_map.get(username.lower(), query)
             return {
                 "status": "single",
@@ -971,8 +1531,6 @@ class EditorMatcher:
                 "message": f"Editor bulundu: {username} ({real_name})"
             }
 
-        query_lower = query.lower().strip()
-
         # Editor listesini al
         editors = self._fetch_editors()
 
@@ -983,9 +1541,30 @@ class EditorMatcher:
                 "message": "Editor listesi alinamadi. Lutfen daha sonra tekrar deneyin."
             }
 
+        # Roster tablolari - liste disaridan degistirildiyse yeniden kurulur
+        tables = self._roster_tables
+        if tables is None or tables["editors"] is not editors:
+            tables = self._build_roster_tables()
+
+        # Roster uzerindeki esleme saf bir fonksiyon - sonuc roster surumuyle memolanir
+        key = ("find_editor", tables["version"], query.strip(), threshold, max_results)
+        return match_memo.get_or_compute(
+            key, lambda: self._find_in_roster(query, tables, threshold, max_results)
+        )
+
+    def _find_in_roster(
+        self,
+        query: str,
+        tables: Dict,
+        threshold: float,
+        max_results: int
+    ) -> Dict:
+        """find_editor'in roster tablolari uzerindeki (memo'suz) esleme adimlari"""
+        query_lower = query.lower().strip()
+
         # Sorguyu dogrudan eslestirmeyi dene
-        if query_lower in [e.lower() for e in editors]:
-            exact = next(e for e in editors if e.lower() == query_lower)
+        exact = tables["by_lower"].get(query_lower)
+        if exact is not None:
             return {
                 "status": "single",
                 "matches": [{"code": exact, "score": 1.0, "reason": "Tam esleme"}],
@@ -995,23 +1574,15 @@ class EditorMatcher:
         # Dot variation kontrolu (o.yenilmez -> oyenilmez veya tersi)
         # GA4'teki kod CSV'de farkli formatta olabilir
         if '.' in query_lower:
-            without_dot = query_lower.replace('.', '')
-            if without_dot in [e.lower() for e in editors]:
-                exact = next(e for e in editors if e.lower() == without_dot)
-                return {
-                    "status": "single",
-                    "matches": [{"code": exact, "score": 1.0, "reason": "Nokta varyasyonu eslesmesi"}],
-                    "message": f"Editor bulundu: {exact}"
-                }
+            exact = tables["by_lower"].get(query_lower.replace('.', ''))
         elif len(query_lower) > 1:
-            dotted = query_lower[0] + '.' + query_lower[1:]
-            if dotted in [e.lower() for e in editors]:
-                exact = next(e for e in editors if e.lower() == dotted)
-                return {
-                    "status": "single",
-                    "matches": [{"code": exact, "score": 1.0, "reason": "Nokta varyasyonu eslesmesi"}],
-                    "message": f"Editor bulundu: {exact}"
-                }
+            exact = tables["by_dotless"].get(query_lower)
+        if exact is not None:
+            return {
+                "status": "single",
+                "matches": [{"code": exact, "score": 1.0, "reason": "Nokta varyasyonu eslesmesi"}],
+                "message": f"Editor bulundu: {exact}"
+            }
 
         # Sorguyu parcala
         query_parts = self._parse_query(query)
@@ -1023,10 +1594,11 @@ class EditorMatcher:
                 "message": "Gecersiz sorgu. Lutfen bir isim veya soyisim girin."
             }
 
-        # Tum editorleri skorla
+        # Kural bazli skor, kurallardan birini saglayabilecek kodlarda hesaplanir
+        # (sonuc tum roster'i skorlamakla ayni - single/multiple karari degismez)
         scored = []
-        for editor in editors:
-            score, reason = self._match_score(editor, query_parts)
+        for editor in self._rule_candidates(query_parts, tables):
+            score, reason = self._match_score(editor, query_parts, tables["parts"][editor])
             if score >= threshold:
                 scored.append({
                     "code": editor,
@@ -1034,8 +1606,20 @@ class EditorMatcher:
                     "reason": reason
                 })
 
-        # Skora gore sirala
-        scored.sort(key=lambda x: x["score"], reverse=True)
+        # Kurallar bir sey bulamadiysa TF-IDF motorundan en benzer adaylar
+        # (kod veya gercek isim uzerinden - ör. gercek isimde yazim hatasi)
+        if not scored:
+            for editor, similarity in tables["engine"].search(
+                query, top_k=NAME_MATCH_CANDIDATES, min_score=threshold
+            ):
+                scored.append({
+                    "code": editor,
+                    "score": round(similarity, 3),
+                    "reason": "Isim benzerligi"
+                })
+
+        # Skora gore sirala (esit skorlarda roster sirasi)
+        scored.sort(key=lambda x: (-x["score"], tables["order"][x["code"]]))
 
         # Sonuclari sinirla
         scored = scored[:max_results]
@@ -1101,7 +1685,7 @@ class EditorMatcher:
 
 
 class AuthorMatcher(EditorMatcher):
-    """Yazar isimlerini fuzzy matching ile esler (Editor matcher'in vauthor versiyonu)"""
+    """Yazar isimlerini fuzzy matching ile esler (Editor matcher'in author versiyonu)"""
 
     def _fetch_editors(self, force_refresh: bool = False) -> List[str]:
         """
@@ -1115,7 +1699,7 @@ class AuthorMatcher(EditorMatcher):
 
         try:
             df = self.client.run_query(
-                dimensions=["vauthor"],
+                dimensions=["author"],
                 metrics=["screenPageViews"],
                 start_date="30daysAgo",
                 end_date="yesterday",
@@ -1134,6 +1718,7 @@ class AuthorMatcher(EditorMatcher):
                 ]
 
                 self._last_fetch_date = today
+                self._build_roster_tables()
                 print(f"[OK] {len(self._editor_list)} yazar yuklendi")
 
         except Exception as e:
@@ -1261,6 +1846,18 @@ if __name__ == "__main__":
                 print(f"    - {m['code']}: {m['score']} ({m['reason']})")
         print()
 
+    # Aday on elemesi, skoru sifirdan buyuk olan hicbir kodu dusurmemeli
+    print("\n--- Kural Adayi On Eleme Testi ---\n")
+
+    tables = editor_matcher._roster_tables
+    for query in editor_tests + ["c", "kara", "yilmz", "gelgec cemile", "ozturk"]:
+        query_parts = editor_matcher._parse_query(query)
+        candidates = set(editor_matcher._rule_candidates(query_parts, tables))
+        missed = [code for code in tables["editors"]
+                  if code not in candidates and editor_matcher._match_score(code, query_parts)[0] > 0]
+        print(f"  '{query}' -> {len(candidates)}/{len(tables['editors'])} aday, "
+              f"{'OK' if not missed else f'HATA - atlanan: {missed}'}")
+
     print("\n" + "=" * 60)
     print("TESTLER TAMAMLANDI")
     print("=" * 60)
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Google Analytics 4 - Apache Arrow Çıktısı
+GA4Client sütunlarını (sütun adı -> numpy dizisi) pyarrow.Table'a çeviren,
+pandas'a kopyasız aktaran ve Parquet / Arrow IPC dosyalarına yazan yardımcılar
+
+pyarrow opsiyoneldir; sadece bu modülün fonksiyonları çağrıldığında yüklenir.
+
+Kullanım:
+    from ga4_arrow import arrow_to_pandas, write_parquet, write_ipc
+
+    table = client.run_query(["pagePath"], ["screenPageViews"], return_type="arrow")
+    df = arrow_to_pandas(table)
+    write_parquet(table, "/tmp/sayfalar.parquet")
+
+    # Büyük raporları sayfa sayfa, tamamını bellekte tutmadan yazma
+    chunks = client.stream_query(["pagePath", "pageTitle"], ["screenPageViews"],
+                                 limit=200000, chunk_type="arrow")
+    write_parquet(chunks, "/tmp/sayfalar.parquet")
+"""
+
+import json
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+
+def require_pyarrow():
+    """pyarrow modülünü döndürür; kurulu değilse açıklayıcı ImportError fırlatır"""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Arrow/Parquet çıktısı için pyarrow gerekli: pip install pyarrow")
+    return pyarrow
+
+
+def columns_to_arrow(
+    columns: Dict[str, np.ndarray],
+    dictionary_columns: Iterable[str] = (),
+    metadata: Optional[Dict] = None
+):
+    """
+    Sütunları pyarrow.Table'a çevirir.
+
+    - dictionary_columns içindeki (dimension) sütunlar sözlük kodlamalı string olur;
+      tekrar eden değerler (kanal, cihaz, kategori ...) bir kez saklanır
+    - int64/float64 metric dizileri kopyalanmadan Arrow tamponuna sarılır
+    - Tipi bilinmeyen (object) metric'ler string kalır
+
+    Args:
+        columns: Sütun adı -> numpy dizisi
+        dictionary_columns: Sözlük kodlanacak sütun adları
+        metadata: Şemaya JSON olarak eklenecek bilgiler (ör. dimension/metric listesi)
+
+    Returns:
+        pyarrow.Table
+    """
+    pa = require_pyarrow()
+    dictionary_columns = set(dictionary_columns)
+
+    arrays = []
+    for name, values in columns.items():
+        if name in dictionary_columns:
+            arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+        elif values.dtype == object:
+            arrays.append(pa.array(values, type=pa.string()))
+        else:
+            arrays.append(pa.array(values))
+
+    schema_metadata = None
+    if metadata:
+        schema_metadata = {f"ga4.{key}": json.dumps(value, ensure_ascii=False) for key, value in metadata.items()}
+
+    return pa.Table.from_arrays(arrays, names=list(columns.keys()), metadata=schema_metadata)
+
+
+def arrow_to_pandas(table, self_destruct: bool = False):
+    """
+    pyarrow.Table'ı DataFrame'e çevirir.
+    Sütunlar ayrı bloklarda tutulur (split_blocks) - null içermeyen sayısal sütunlar
+    Arrow tamponunu kopyalamadan paylaşır; sözlük kodlamalı sütunlar Categorical olur.
+
+    Args:
+        table: pyarrow.Table
+        self_destruct: True ise dönüşüm sırasında Arrow belleği serbest bırakılır
+            (tablo sonrasında kullanılamaz, tepe bellek yarıya iner)
+
+    Returns:
+        pandas DataFrame
+    """
+    return table.to_pandas(split_blocks=True, self_destruct=self_destruct)
+
+
+def _tables(data) -> Iterable:
+    """Tek tabloyu veya tablo iterator'ını (stream_query parçaları) tablo akışına çevirir"""
+    pa = require_pyarrow()
+    if isinstance(data, (pa.Table, pa.RecordBatch)):
+        return [data]
+    return data
+
+
+def write_parquet(data, path: str, compression: str = "zstd") -> int:
+    """
+    Tabloyu veya tablo parçalarını tek bir Parquet dosyasına yazar.
+    Parçalar geldikçe yazılır; tüm sonuç bellekte birleştirilmez.
+
+    Args:
+        data: pyarrow.Table veya Table iterator'ı (ör. stream_query(chunk_type="arrow"))
+        path: Hedef dosya yolu
+        compression: Parquet sıkıştırma algoritması
+
+    Returns:
+        Yazılan satır sayısı
+    """
+    require_pyarrow()
+    import pyarrow.parquet as pq
+
+    writer = None
+    rows = 0
+    try:
+        for table in _tables(data):
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema, compression=compression)
+            writer.write(table)
+            rows += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def write_ipc(data, path: str) -> int:
+    """
+    Tabloyu veya tablo parçalarını Arrow IPC stream formatında yazar.
+    Stream formatı her parçanın kendi dimension sözlüğünü taşımasına izin verir;
+    okumak için pyarrow.ipc.open_stream(path).read_all() kullanılır.
+
+    Args:
+        data: pyarrow.Table veya Table iterator'ı (ör. stream_query(chunk_type="arrow"))
+        path: Hedef dosya yolu
+
+    Returns:
+        Yazılan satır sayısı
+    """
+    pa = require_pyarrow()
+
+    writer = None
+    rows = 0
+    with pa.OSFile(path, "wb") as sink:
+        try:
+            for table in _tables(data):
+                if writer is None:
+                    writer = pa.ipc.new_stream(sink, table.schema)
+                writer.write(table)
+                rows += table.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+    return rows
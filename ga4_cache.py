@@ -0,0 +1,581 @@
+# -*- coding: utf-8 -*-
+"""
+Google Analytics 4 - Yanıt Önbelleği
+GA4Client.run_query sonuçlarını bellekte (LRU) ve diskte (SQLite) tutan önbellekler
+ve eşzamanlı özdeş istekleri birleştiren single-flight katmanı
+
+Kullanım:
+    from ga4_cache import ResponseCache, ReportStore, SingleFlight, ttl_for_range
+
+    # Süreç içi bellek önbelleği
+    cache = ResponseCache(max_entries=256)
+    cache.set(key, value, ttl=ttl_for_range("2024-01-01", "2024-01-07"))
+    value = cache.get(key)
+
+    # Süreçler arası paylaşılan disk önbelleği (kapanmış tarih aralıkları için)
+    store = ReportStore("/tmp/ga4_cache/reports.sqlite")
+    store.put("hurriyet", "297156524", key, columns, ttl=TTL_HISTORICAL)
+    columns = store.get("hurriyet", "297156524", key)
+
+    # Aynı anda gelen özdeş istekleri tek API çağrısında birleştirme
+    flight = SingleFlight()
+    columns = flight.do(key, lambda: fetch(key))
+"""
+
+import asyncio
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+import numpy as np
+
+
+# Tazelik süreleri (saniye)
+# - Bugünü içeren aralıklar: veri sürekli değişiyor, kısa süre tut
+# - Dün: GA4 işleme gecikmesi nedeniyle birkaç saat daha değişebilir
+# - Kapanmış geçmiş günler: veri artık değişmiyor, uzun süre tut
+# - Gerçek zamanlı rapor: son 30 dakika, saniyeler içinde eskir ama tüm oturumlar paylaşır
+# - Property şeması (getMetadata): custom tanımlar nadiren değişir, günde bir yenile
+TTL_REALTIME = 15
+TTL_TODAY = 120
+TTL_RECENT = 60 * 60
+TTL_HISTORICAL = 24 * 60 * 60
+TTL_METADATA = 24 * 60 * 60
+
+# Disk önbelleği ayarları
+# GA4_CACHE_DIR ile dizin değiştirilebilir, GA4_DISK_CACHE=0 ile kapatılabilir
+DEFAULT_CACHE_DIR = os.environ.get(
+    "GA4_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".ga4_cache")
+)
+DEFAULT_STORE_MAX_BYTES = 256 * 1024 * 1024
+
+
+def resolve_concrete_date(date_str: str, now: datetime = None) -> str:
+    """
+    GA4 tarih ifadesini somut YYYY-MM-DD tarihine çevirir.
+
+    Args:
+        date_str: "today", "yesterday", "7daysAgo" veya "2024-01-15"
+        now: Referans zaman (varsayılan: şimdi)
+
+    Returns:
+        YYYY-MM-DD formatında tarih (çözülemezse girdinin kendisi)
+    """
+    now = now or datetime.now()
+
+    if date_str == "today":
+        return now.strftime("%Y-%m-%d")
+    if date_str == "yesterday":
+        return (now - timedelta(days=1)).strftime("%Y-%m-%d")
+    if date_str.endswith("daysAgo"):
+        try:
+            days = int(date_str[:-len("daysAgo")])
+            return (now - timedelta(days=days)).strftime("%Y-%m-%d")
+        except ValueError:
+            return date_str
+
+    return date_str
+
+
+def is_closed_range(end_date: str, now: datetime = None) -> bool:
+    """
+    Tarih aralığı kapanmış mı (bugünü içermiyor mu) kontrol eder.
+
+    Args:
+        end_date: Somut bitiş tarihi (YYYY-MM-DD)
+        now: Referans zaman (varsayılan: şimdi)
+
+    Returns:
+        Aralık bugünden önce bitiyorsa True
+    """
+    now = now or datetime.now()
+    try:
+        datetime.strptime(end_date, "%Y-%m-%d")
+    except ValueError:
+        return False
+    return end_date < now.strftime("%Y-%m-%d")
+
+
+def rows_to_columns(rows: List[Dict]) -> Dict[str, list]:
+    """Satır sözlükleri listesini sütun sözlüğüne çevirir"""
+    if not rows:
+        return {}
+    return {name: [row.get(name) for row in rows] for name in rows[0].keys()}
+
+
+def columns_to_rows(columns: Dict[str, Any]) -> List[Dict]:
+    """Sütun sözlüğünü satır sözlükleri listesine çevirir (numpy tipleri Python tiplerine döner)"""
+    if not columns:
+        return []
+    names = list(columns.keys())
+    values = [
+        col.tolist() if isinstance(col, np.ndarray) else list(col)
+        for col in columns.values()
+    ]
+    return [dict(zip(names, row)) for row in zip(*values)]
+
+
+def concat_columns(parts: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """Aynı şemadaki sütun sözlüklerini sırayla birleştirir"""
+    if not parts:
+        return {}
+    if len(parts) == 1:
+        return parts[0]
+    return {name: np.concatenate([part[name] for part in parts]) for name in parts[0].keys()}
+
+
+def column_length(columns: Dict[str, Any]) -> int:
+    """Sütun sözlüğündeki satır sayısı"""
+    for values in columns.values():
+        return len(values)
+    return 0
+
+
+def ttl_for_range(start_date: str, end_date: str, now: datetime = None) -> int:
+    """
+    Tarih aralığının tazeliğine göre önbellek süresini belirler.
+
+    Args:
+        start_date: Somut başlangıç tarihi (YYYY-MM-DD)
+        end_date: Somut bitiş tarihi (YYYY-MM-DD)
+        now: Referans zaman (varsayılan: şimdi)
+
+    Returns:
+        Saniye cinsinden TTL
+    """
+    now = now or datetime.now()
+    today = now.strftime("%Y-%m-%d")
+    yesterday = (now - timedelta(days=1)).strftime("%Y-%m-%d")
+
+    # Çözülemeyen tarih - güvenli tarafta kal
+    try:
+        datetime.strptime(end_date, "%Y-%m-%d")
+    except ValueError:
+        return TTL_TODAY
+
+    if end_date >= today:
+        return TTL_TODAY
+    if end_date >= yesterday:
+        return TTL_RECENT
+    return TTL_HISTORICAL
+
+
+class ResponseCache:
+    """Thread-safe, boyut sınırlı ve TTL destekli LRU önbellek"""
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Önbelleği başlatır.
+
+        Args:
+            max_entries: Tutulacak maksimum kayıt sayısı
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Kaydı getirir, süresi dolmuşsa siler.
+
+        Returns:
+            Kayıtlı değer veya None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            # En son kullanılan olarak işaretle
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: int):
+        """
+        Kaydı ekler; kapasite aşılırsa en eski kaydı çıkarır.
+
+        Args:
+            key: Önbellek anahtarı
+            value: Saklanacak değer
+            ttl: Saniye cinsinden geçerlilik süresi
+        """
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Tüm kayıtları siler"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """Önbellek istatistiklerini döndürür"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class SingleFlight:
+    """
+    Aynı anahtarlı eşzamanlı çağrıları tek çalıştırmada birleştirir (thread-safe).
+
+    İlk çağıran (lider) fonksiyonu çalıştırır; o sırada aynı anahtarla gelen diğer
+    çağıranlar bekler ve liderin sonucunu (veya hatasını) alır. Çağrı bitince anahtar
+    silinir - sonuçlar saklanmaz, bu iş ResponseCache'e aittir.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, dict] = {}
+        self.leaders = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        fn'i anahtar için en fazla bir kez eşzamanlı çalıştırır.
+
+        Args:
+            key: Çağrı anahtarı (ör: çözümlenmiş sorgu anahtarı)
+            fn: Argümansız çağrılacak fonksiyon
+
+        Returns:
+            fn sonucu (bekleyen tüm çağıranlara aynı nesne döner)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = {"event": threading.Event(), "result": None, "error": None}
+                self._calls[key] = call
+                self.leaders += 1
+                leader = True
+            else:
+                self.shared += 1
+                leader = False
+
+        if not leader:
+            call["event"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"]
+
+        try:
+            call["result"] = fn()
+        except BaseException as e:
+            call["error"] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call["event"].set()
+
+        return call["result"]
+
+    def stats(self) -> Dict:
+        """Birleştirme istatistiklerini döndürür"""
+        with self._lock:
+            return {"in_flight": len(self._calls), "leaders": self.leaders, "shared": self.shared}
+
+
+class AsyncSingleFlight:
+    """
+    SingleFlight'ın asyncio sürümü - aynı event loop'taki eşzamanlı coroutine'leri birleştirir.
+    Anahtar çalışan loop ile birlikte tutulur; farklı loop'lar birbirini beklemez.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.leaders = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable]) -> Any:
+        """
+        fn() coroutine'ini anahtar için en fazla bir kez eşzamanlı await eder.
+
+        Args:
+            key: Çağrı anahtarı
+            fn: Argümansız çağrıldığında coroutine döndüren fonksiyon
+
+        Returns:
+            Coroutine sonucu
+        """
+        loop = asyncio.get_running_loop()
+        call_key = (loop, key)
+
+        task = self._calls.get(call_key)
+        if task is not None:
+            self.shared += 1
+        else:
+            # Çağrı ayrı bir görevde çalışır: lider iptal edilse de (wait_for, deadline)
+            # diğer bekleyenler için devam eder
+            task = asyncio.ensure_future(fn())
+            self._calls[call_key] = task
+            self.leaders += 1
+            task.add_done_callback(lambda done: self._finish(call_key, done))
+
+        # shield: bekleyen iptal edilirse sadece o bekleyen vazgeçer, ortak çağrı sürer
+        return await asyncio.shield(task)
+
+    def _finish(self, call_key: tuple, task: asyncio.Future):
+        """Biten çağrıyı kayıttan siler"""
+        if self._calls.get(call_key) is task:
+            del self._calls[call_key]
+        # Bekleyen kalmadıysa "exception was never retrieved" uyarısı çıkmasın
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict:
+        """Birleştirme istatistiklerini döndürür"""
+        return {"in_flight": len(self._calls), "leaders": self.leaders, "shared": self.shared}
+
+
+class ReportStore:
+    """
+    SQLite tabanlı, süreçler arası paylaşılan rapor deposu.
+
+    - Her kayıt marka ve property bazında anahtarlanır
+    - Sütunlar numpy dizileri olarak sıkıştırılmış .npz formatında saklanır
+    - WAL modu sayesinde aynı anda birden fazla okuyucu ve yazıcı çalışabilir
+    - Toplam boyut max_bytes'ı aşınca en uzun süredir kullanılmayan kayıtlar silinir
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_STORE_MAX_BYTES):
+        """
+        Depoyu başlatır.
+
+        Args:
+            path: SQLite dosyasının yolu
+            max_bytes: Maksimum toplam payload boyutu
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS reports (
+                    cache_key TEXT PRIMARY KEY,
+                    brand TEXT,
+                    property_id TEXT NOT NULL,
+                    columns TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_reports_access ON reports(last_access)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_reports_property ON reports(brand, property_id)")
+        conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Her işlem için ayrı bağlantı - thread ve süreç güvenliği için"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA busy_timeout=30000")
+        return conn
+
+    @staticmethod
+    def _hash_key(brand: Optional[str], property_id: str, key: Hashable) -> str:
+        """Anahtarı marka ve property ile birlikte sabit uzunluklu hash'e çevirir"""
+        raw = repr((brand, property_id, key)).encode("utf-8")
+        return hashlib.sha256(raw).hexdigest()
+
+    @staticmethod
+    def _encode(columns: Dict[str, Any]) -> tuple:
+        """Sütunları sıkıştırılmış npz payload'ına çevirir"""
+        names = list(columns.keys())
+        arrays = {}
+        for i, name in enumerate(names):
+            array = np.asarray(columns[name])
+            if array.dtype == object:
+                array = array.astype(str)
+            arrays[f"c{i}"] = array
+
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, **arrays)
+        return json.dumps(names, ensure_ascii=False), buffer.getvalue()
+
+    @staticmethod
+    def _decode(names_json: str, payload: bytes) -> Dict[str, np.ndarray]:
+        """npz payload'ını sütun sözlüğüne çevirir"""
+        names = json.loads(names_json)
+        columns = {}
+        with np.load(io.BytesIO(payload), allow_pickle=False) as data:
+            for i, name in enumerate(names):
+                array = data[f"c{i}"]
+                # Metin sütunları bellekteki gibi object dizisi olarak döner
+                columns[name] = array.astype(object) if array.dtype.kind == "U" else array
+        return columns
+
+    def get(self, brand: Optional[str], property_id: str, key: Hashable) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Kaydı getirir.
+
+        Returns:
+            Sütun sözlüğü veya None (yoksa ya da süresi dolmuşsa)
+        """
+        cache_key = self._hash_key(brand, property_id, key)
+        now = time.time()
+
+        conn = self._connect()
+        try:
+            with conn:
+                row = conn.execute(
+                    "SELECT columns, payload, expires_at FROM reports WHERE cache_key = ?",
+                    (cache_key,)
+                ).fetchone()
+
+                if row is None:
+                    return None
+
+                if row[2] <= now:
+                    conn.execute("DELETE FROM reports WHERE cache_key = ?", (cache_key,))
+                    return None
+
+                conn.execute(
+                    "UPDATE reports SET last_access = ? WHERE cache_key = ?",
+                    (now, cache_key)
+                )
+        finally:
+            conn.close()
+
+        return self._decode(row[0], row[1])
+
+    def put(self, brand: Optional[str], property_id: str, key: Hashable, columns: Dict[str, Any], ttl: int):
+        """
+        Kaydı ekler ve gerekirse boyut sınırına göre eski kayıtları siler.
+
+        Args:
+            brand: Marka anahtarı
+            property_id: GA4 Property ID
+            key: Önbellek anahtarı
+            columns: Sütun adı -> değerler
+            ttl: Saniye cinsinden geçerlilik süresi
+        """
+        if ttl <= 0:
+            return
+
+        cache_key = self._hash_key(brand, property_id, key)
+        names_json, payload = self._encode(columns)
+        now = time.time()
+
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO reports VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (cache_key, brand, property_id, names_json, payload,
+                     len(payload), now, now + ttl, now)
+                )
+                self._evict(conn, now)
+        finally:
+            conn.close()
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        """Süresi dolan kayıtları ve boyut sınırını aşan en eski kayıtları siler"""
+        conn.execute("DELETE FROM reports WHERE expires_at <= ?", (now,))
+
+        total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM reports").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        to_delete = []
+        for cache_key, size in conn.execute(
+            "SELECT cache_key, size_bytes FROM reports ORDER BY last_access ASC"
+        ):
+            if total <= self.max_bytes:
+                break
+            to_delete.append((cache_key,))
+            total -= size
+
+        conn.executemany("DELETE FROM reports WHERE cache_key = ?", to_delete)
+
+    def clear(self, brand: Optional[str] = None, property_id: str = None):
+        """Kayıtları siler (marka/property verilirse sadece onları)"""
+        conn = self._connect()
+        try:
+            with conn:
+                if property_id is not None:
+                    conn.execute(
+                        "DELETE FROM reports WHERE brand IS ? AND property_id = ?",
+                        (brand, property_id)
+                    )
+                else:
+                    conn.execute("DELETE FROM reports")
+        finally:
+            conn.close()
+
+    def stats(self) -> Dict:
+        """Depo istatistiklerini döndürür"""
+        conn = self._connect()
+        try:
+            count, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM reports"
+            ).fetchone()
+        finally:
+            conn.close()
+        return {"entries": count, "size_bytes": total, "max_bytes": self.max_bytes}
+
+
+_default_store: Optional[ReportStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_default_report_store() -> Optional[ReportStore]:
+    """
+    Süreç genelinde varsayılan disk deposunu döndürür (ilk kullanımda oluşturulur).
+
+    Returns:
+        ReportStore veya None (GA4_DISK_CACHE=0 ise ya da dizin yazılamıyorsa)
+    """
+    global _default_store
+
+    if os.environ.get("GA4_DISK_CACHE", "1") == "0":
+        return None
+
+    with _default_store_lock:
+        if _default_store is None:
+            try:
+                _default_store = ReportStore(os.path.join(DEFAULT_CACHE_DIR, "reports.sqlite"))
+            except Exception as e:
+                print(f"[UYARI] Disk onbellegi acilamadi: {str(e)}")
+                return None
+        return _default_store
@@ -20,10 +20,18 @@ Kullanım:
     )
 """
 
+import asyncio
+import contextvars
 import os
+import threading
+import time
 import pandas as pd
+import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Union
+from typing import AsyncIterator, Iterator, List, Dict, Optional, Union
 
 # Marka Property ID'leri ve Custom Dimension Prefix'leri
 BRAND_PROPERTIES = {
@@ -161,20 +169,92 @@ BRAND_PROPERTIES = {
         }
     },
 }
-from google.analytics.data_v1beta import BetaAnalyticsDataClient
-from google.oauth2 import service_account
+
+# GA4 Data API'nin tek istekte döndürebileceği maksimum satır sayısı
+MAX_PAGE_SIZE = 250000
+
+# batchRunReports ile tek istekte gönderilebilecek maksimum rapor sayısı
+MAX_BATCH_SIZE = 5
+
+# Tek run_report isteğinde gönderilebilecek maksimum tarih aralığı sayısı
+MAX_DATE_RANGES = 4
+
+# Az sayıda farklı değer alan dimension'lar - compact modda "category" dtype'ı ile tutulur
+# (cat1 / newstype markaya göre customEvent adına çözülür)
+LOW_CARDINALITY_DIMENSIONS = [
+    "deviceCategory", "sessionDefaultChannelGroup", "browser", "cat1", "newstype", "dateRange"
+]
+
+# Gerçek zamanlı raporun kapsayabildiği dakika sayısı (standart property)
+REALTIME_MAX_MINUTES = 30
+
+# Günlük parça önbelleğinde eksik günler için tek seferde çekilecek maksimum satır.
+# Aşılırsa (ör. 30 gün x pagePath) sorgu parçalanmadan doğrudan çalışır
+PARTITION_MAX_ROWS = 100000
+
+# Parçalama sadece tüm satırları isteyen sorgularda (limit bu değer veya üstü - run_query
+# varsayılanı) ya da satır sayısı gün sayısıyla sınırlı olanlarda (sadece date / toplam)
+# yapılır. Top-N sorgularında (limit=10) parçalar tüm dimension x gün satırlarını çekerdi
+PARTITION_MIN_LIMIT = 10000
+
+# Jenerik custom dimension adları - marka prefix'i ile customEvent adına çözülür
+# (property şeması yüklenince gerçek adlar getMetadata'dan keşfedilir)
+GENERIC_CUSTOM_DIMENSIONS = [
+    "cat1", "cat2", "cat3", "cat4", "newsid", "editor",
+    "author", "authortype", "publisheddate", "newstype", "tag"
+]
+
+# Şema (getMetadata) çekilemezse tekrar denemeden önce beklenecek süre (saniye)
+SCHEMA_RETRY_SECONDS = 300
+
+# Compact modda int32'ye indirilecek metric'lerin mutlak değer sınırı.
+# int32 sınırının 1000'de biri - yüzde (x100) hesapları ve sütun toplamları taşmasın
+INT32_SAFE_LIMIT = 2 ** 31 // 1000
+
 from google.analytics.data_v1beta.types import (
     DateRange,
+    MinuteRange,
     Metric,
     Dimension,
     FilterExpression,
-    Filter,
-    FilterExpressionList,
     RunReportRequest,
+    BatchRunReportsRequest,
     OrderBy,
+    Pivot,
     MetricType
 )
 
+from ga4_cache import (
+    ResponseCache,
+    SingleFlight,
+    AsyncSingleFlight,
+    column_length,
+    columns_to_rows,
+    concat_columns,
+    get_default_report_store,
+    is_closed_range,
+    resolve_concrete_date,
+    ttl_for_range,
+    TTL_METADATA,
+    TTL_REALTIME
+)
+from ga4_transport import (
+    LatencyTracker,
+    QuotaExceededError,
+    QuotaScheduler,
+    RequestTimeoutError,
+    RetryPolicy,
+    async_call_with_retry,
+    call_with_retry,
+    context_map,
+    find_credentials_path,
+    get_async_transport_client,
+    get_credentials,
+    get_transport_client
+)
+from ga4_arrow import columns_to_arrow
+from ga4_filters import compile_filters, filter_field_names
+from ga4_metadata import PropertySchema, get_default_metadata_store
 from ga4_mappings import (
     DIMENSIONS,
     METRICS,
@@ -183,18 +263,64 @@ from ga4_mappings import (
     get_api_name_from_tr,
     get_dimension_info,
     get_metric_info,
+    is_additive_metric,
     QUICK_QUERIES
 )
 
 
+# collect_queries bloğundaki run_query çağrılarının toplandığı sözlük (blok dışında None)
+_query_collector = contextvars.ContextVar("ga4_query_collector", default=None)
+
+
 class GA4Client:
     """Google Analytics 4 API Client"""
 
+    # Süreç genelinde paylaşılan yanıt önbelleği - anahtar property ID içerdiği için
+    # farklı markalar ve oturumlar aynı önbelleği güvenle kullanabilir
+    response_cache = ResponseCache(max_entries=256)
+
+    # Günlük parça önbelleği - her gün ayrı kayıt olduğu için daha fazla girdi tutar;
+    # parçalamaya uygun olmadığı görülen (çok satırlı) sorgu tipleri partition_skip'te
+    partition_cache = ResponseCache(max_entries=4096)
+    partition_skip = set()
+
+    # Gerçek zamanlı rapor önbelleği - TTL_REALTIME saniye; marka başına tek yoklama
+    # aynı anda "şu an kaç kişi var" soran tüm oturumlara hizmet eder
+    realtime_cache = ResponseCache(max_entries=128)
+
+    # Disk deposu - None ise süreç genelindeki varsayılan depo kullanılır
+    report_store = None
+
+    # Property şemaları (getMetadata) - property başına süreçte bir kez yüklenir,
+    # diskte JSON olarak TTL_METADATA süresince tutulur (None ise varsayılan depo)
+    schemas: Dict[str, PropertySchema] = {}
+    schema_failures: Dict[str, float] = {}
+    metadata_store = None
+
+    # Süreç genelinde eşzamanlı özdeş istekleri birleştiren katman - aynı anda
+    # aynı sorguyu gönderen oturumlar tek RPC'nin sonucunu paylaşır
+    in_flight = SingleFlight()
+
+    # Süreç genelinde property kotası takibi ve öncelik kuyruğu - tüm API çağrıları
+    # buradan geçer (öncelik: ga4_transport.request_priority)
+    scheduler = QuotaScheduler()
+
+    # Geçici hatalarda yeniden deneme ayarları (örnek bazında __init__ ile değiştirilebilir)
+    retry_policy = RetryPolicy()
+
+    # Metot bazında başarılı çağrı süreleri - hedge eşiği (p95) buradan hesaplanır
+    latency_trackers: Dict[str, LatencyTracker] = {}
+
     def __init__(
         self,
         credentials_path: str = None,
         property_id: str = None,
-        brand: str = None
+        brand: str = None,
+        page_size: int = 10000,
+        max_page_workers: int = 4,
+        retry_policy: RetryPolicy = None,
+        compact_dtypes: bool = False,
+        validate_schema: bool = True
     ):
         """
         GA4 Client'ı başlatır.
@@ -203,7 +329,31 @@ class GA4Client:
             credentials_path: Service account JSON dosyasının yolu
             property_id: GA4 Property ID (doğrudan belirtilirse brand yerine kullanılır)
             brand: Marka adı ("hurriyet", "vatan", vb.)
+            page_size: Sayfa başına satır sayısı (en fazla MAX_PAGE_SIZE)
+            max_page_workers: Sayfaları paralel çekecek maksimum thread sayısı
+            retry_policy: Yeniden deneme/hedge ayarları (None ise sınıf varsayılanı)
+                Örnek: RetryPolicy(hedge=True) - p95'i aşan çağrılara yedek istek
+            compact_dtypes: DataFrame sonuçlarında az değerli dimension'ları "category",
+                metric'leri güvenli en küçük sayısal tipte tut (uzun oturumlu arayüz için)
+            validate_schema: İstekleri göndermeden önce property şemasına göre doğrula
+                ve marka custom dimension'larını şemadan keşfet (bkz. get_schema)
         """
+        # Sayfalama ayarları
+        self.page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+        self.max_page_workers = max(1, max_page_workers)
+
+        # Compact DataFrame ayarı ve kazanılan bellek istatistiği
+        self.compact_dtypes = compact_dtypes
+        self.memory_stats = {"frames": 0, "bytes_before": 0, "bytes_after": 0}
+        self._memory_stats_lock = threading.Lock()
+
+        if retry_policy is not None:
+            self.retry_policy = retry_policy
+
+        # Şema doğrulaması - custom dimension'lar şema ilk yüklendiğinde güncellenir
+        self.validate_schema = validate_schema
+        self._applied_schema = None
+
         # Credentials
         self.credentials_path = credentials_path or self._find_credentials()
 
@@ -264,6 +414,27 @@ class GA4Client:
             print(f"Mevcut markalar: {', '.join(BRAND_PROPERTIES.keys())}")
             return False
 
+    def for_brand(self, brand: str) -> "GA4Client":
+        """
+        Aynı credentials ve gRPC kanalı üzerinde başka bir marka için client döndürür.
+        Mevcut client değişmez; markalar arası paralel sorgular için kullanılır.
+
+        Args:
+            brand: Marka adı
+
+        Returns:
+            Yeni (aynı sınıftan) client görünümü
+        """
+        return type(self)(
+            credentials_path=self.credentials_path,
+            brand=brand,
+            page_size=self.page_size,
+            max_page_workers=self.max_page_workers,
+            retry_policy=self.retry_policy,
+            compact_dtypes=self.compact_dtypes,
+            validate_schema=self.validate_schema
+        )
+
     def get_custom_dimension(self, generic_name: str) -> str:
         """
         Jenerik custom dimension adını marka bazlı API adına çevirir.
@@ -279,32 +450,126 @@ class GA4Client:
         # Prefix ile dene
         return f"customEvent:{self.prefix}{generic_name}"
 
-    def _find_credentials(self) -> str:
-        """Credentials dosyasını bul"""
-        # Önce aynı klasörde ara
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        for file in os.listdir(current_dir):
-            if file.endswith('.json') and 'service' not in file.lower():
-                # JSON dosyasını kontrol et
-                try:
-                    import json
-                    with open(os.path.join(current_dir, file), 'r') as f:
-                        data = json.load(f)
-                        if data.get('type') == 'service_account':
-                            return os.path.join(current_dir, file)
-                except:
-                    continue
+    def get_schema(self, force_refresh: bool = False) -> Optional[PropertySchema]:
+        """
+        Property şemasını (geçerli dimension/metric adları) döndürür.
+        Sıra: süreç belleği -> disk (TTL_METADATA) -> getMetadata çağrısı.
+        Aynı anda gelen istekler tek çağrıda birleşir; çağrı başarısız olursa
+        SCHEMA_RETRY_SECONDS boyunca tekrar denenmez.
+
+        Args:
+            force_refresh: Önbellekleri yoksay ve şemayı yeniden çek
+
+        Returns:
+            PropertySchema veya None (şema alınamadıysa - doğrulama atlanır)
+        """
+        if not force_refresh:
+            schema = self._cached_schema()
+            if schema is not None or not self._schema_fetch_due():
+                return schema
+
+        try:
+            return self.in_flight.do(("metadata", self.property_id), self._fetch_schema)
+        except Exception as e:
+            self.schema_failures[self.property_id] = time.monotonic()
+            print(f"[UYARI] Property semasi alinamadi ({self.property_id}): {str(e)}")
+            return None
+
+    def _fetch_schema(self) -> PropertySchema:
+        """getMetadata çağrısı yapar, şemayı belleğe ve diske yazar"""
+        response = self._call_api("get_metadata", {"name": f"properties/{self.property_id}/metadata"})
+        schema = PropertySchema.from_response(self.property_id, response)
+        self._store_schema(schema)
+        return schema
+
+    def _store_schema(self, schema: PropertySchema):
+        """Şemayı süreç belleğine ve disk deposuna yazar"""
+        self.schemas[self.property_id] = schema
+        self.schema_failures.pop(self.property_id, None)
+
+        store = self._get_metadata_store()
+        if store is not None:
+            try:
+                store.put(schema)
+            except Exception as e:
+                print(f"[UYARI] Property semasi diske yazilamadi: {str(e)}")
+
+    def _memory_schema(self) -> Optional[PropertySchema]:
+        """Süreç belleğindeki güncel şema (diske veya API'ye gitmez)"""
+        schema = self.schemas.get(self.property_id)
+        if schema is not None and time.time() - schema.fetched_at <= TTL_METADATA:
+            return schema
+        return None
+
+    def _cached_schema(self) -> Optional[PropertySchema]:
+        """Bellekteki veya diskteki şema (API çağrısı yapmaz)"""
+        schema = self._memory_schema()
+        if schema is not None:
+            return schema
+
+        store = self._get_metadata_store()
+        schema = store.get(self.property_id) if store is not None else None
+        if schema is not None:
+            self.schemas[self.property_id] = schema
+        return schema
+
+    def _schema_fetch_due(self) -> bool:
+        """Son başarısız denemeden bu yana yeterli süre geçti mi?"""
+        failed_at = self.schema_failures.get(self.property_id)
+        return failed_at is None or time.monotonic() - failed_at >= SCHEMA_RETRY_SECONDS
+
+    def _get_metadata_store(self):
+        """Şema deposunu döndürür (atanmamışsa süreç genelindeki varsayılan)"""
+        if self.metadata_store is not None:
+            return self.metadata_store
+        return get_default_metadata_store()
+
+    def _schema_for_query(self) -> Optional[PropertySchema]:
+        """Doğrulama açıksa şemayı yükler ve keşfedilen custom dimension'ları uygular"""
+        if not self.validate_schema:
+            return None
+        schema = self.get_schema()
+        if schema is not None and schema is not self._applied_schema:
+            self._apply_schema(schema)
+        return schema
+
+    def _apply_schema(self, schema: PropertySchema):
+        """Marka custom dimension adlarını şemadaki gerçek adlarla günceller"""
+        self._applied_schema = schema
+        if not self.prefix:
+            return
+
+        discovered = schema.discover_custom_dimensions(self.prefix, GENERIC_CUSTOM_DIMENSIONS, self.custom_dims)
+        for generic, api_name in discovered.items():
+            if self.custom_dims.get(generic) not in (None, api_name):
+                print(f"[UYARI] {self.brand_name}: {generic} icin {self.custom_dims[generic]} yerine {api_name} kullaniliyor")
+        self.custom_dims = {**self.custom_dims, **discovered}
+
+    def _validate_request(self, schema: Optional[PropertySchema], request: Dict):
+        """
+        İsteği property şemasına göre yerelde doğrular - hatalı ad RPC'ye gitmez.
+
+        Raises:
+            InvalidQueryError: Şemada olmayan dimension/metric
+        """
+        if schema is None:
+            return
+        schema.validate(
+            dimensions=[d.name for d in request["dimensions"]],
+            metrics=[m.name for m in request["metrics"]],
+            dimension_filter_fields=filter_field_names(request.get("dimension_filter")),
+            metric_filter_fields=filter_field_names(request.get("metric_filter"))
+        )
 
-        # Varsayılan konum
-        return os.path.join(current_dir, "golden-imprint-441508-d8-765863a31f54.json")
+    def _find_credentials(self) -> str:
+        """Credentials dosyasını bul (dizin süreç başına bir kez taranır)"""
+        return find_credentials_path(os.path.dirname(os.path.abspath(__file__)))
 
     def _init_client(self):
-        """API Client'ı başlat"""
+        """API Client'ı başlat - credentials ve gRPC kanalı süreç genelinde paylaşılır"""
         try:
-            self.credentials = service_account.Credentials.from_service_account_file(
-                self.credentials_path
-            )
-            self.client = BetaAnalyticsDataClient(credentials=self.credentials)
+            self.credentials = get_credentials(self.credentials_path)
+            self.client = get_transport_client(self.credentials_path)
             print(f"[OK] GA4 Client basariyla baslatildi - {self.brand_name} (Property: {self.property_id})")
         except Exception as e:
             raise Exception(f"GA4 Client başlatma hatası: {str(e)}")
@@ -320,9 +585,7 @@ class GA4Client:
             return name
 
         # Marka bazlı jenerik custom dimension mı? (cat1, editor, author, vb.)
-        generic_custom_dims = ["cat1", "cat2", "cat3", "cat4", "newsid", "editor",
-                               "author", "authortype", "publisheddate",
-                               "newstype", "tag"]
+        generic_custom_dims = GENERIC_CUSTOM_DIMENSIONS
         if name in generic_custom_dims:
             return self.get_custom_dimension(name)
 
@@ -423,6 +686,55 @@ class GA4Client:
 
         return str(date_input)
 
+    def _parse_date_ranges(self, date_ranges: List) -> List[tuple]:
+        """
+        Tarih aralıklarını (start, end, name) listesine çevirir.
+
+        Args:
+            date_ranges: (start, end), (start, end, name) veya
+                {"start_date", "end_date", "name"} sözlüklerinden oluşan liste
+
+        Returns:
+            [(parsed_start, parsed_end, name), ...] - adsız aralıklar "date_range_<i>" adını alır
+        """
+        if len(date_ranges) > MAX_DATE_RANGES:
+            raise ValueError(f"En fazla {MAX_DATE_RANGES} tarih aralığı verilebilir: {len(date_ranges)}")
+
+        ranges = []
+        for i, date_range in enumerate(date_ranges):
+            if isinstance(date_range, dict):
+                start = date_range.get("start_date", "7daysAgo")
+                end = date_range.get("end_date", "yesterday")
+                name = date_range.get("name")
+            else:
+                start, end = date_range[0], date_range[1]
+                name = date_range[2] if len(date_range) > 2 else None
+
+            ranges.append((self._parse_date(start), self._parse_date(end), name or f"date_range_{i}"))
+
+        return ranges
+
+    @staticmethod
+    def previous_period(
+        start_date: str,
+        end_date: str
+    ) -> tuple:
+        """
+        Verilen aralıktan hemen önce gelen eşit uzunluktaki aralığı hesaplar.
+
+        Args:
+            start_date: Başlangıç tarihi ("7daysAgo", "yesterday", "2024-01-15" ...)
+            end_date: Bitiş tarihi
+
+        Returns:
+            (previous_start, previous_end) YYYY-MM-DD formatında
+        """
+        start = datetime.strptime(resolve_concrete_date(start_date), "%Y-%m-%d")
+        end = datetime.strptime(resolve_concrete_date(end_date), "%Y-%m-%d")
+        previous_end = start - timedelta(days=1)
+        previous_start = previous_end - (end - start)
+        return previous_start.strftime("%Y-%m-%d"), previous_end.strftime("%Y-%m-%d")
+
     def run_query(
         self,
         dimensions: List[str] = None,
@@ -433,7 +745,11 @@ class GA4Client:
         order_by: str = None,
         order_desc: bool = True,
         limit: int = 10000,
-        return_type: str = "dataframe"
+        return_type: str = "dataframe",
+        use_cache: bool = True,
+        page_size: int = None,
+        date_ranges: List = None,
+        compact: bool = None
     ) -> Union[pd.DataFrame, List[Dict], Dict]:
         """
         GA4 API'den veri çeker.
@@ -441,442 +757,1323 @@ class GA4Client:
         Args:
             dimensions: Dimension listesi (Türkçe veya API adı)
                 Örnek: ["date", "Kanal Grubu"] veya ["date", "sessionDefaultChannelGroup"]
+                None ise ["date"] (günlük kırılım); boş liste [] ise dimension'sız
+                tek bir toplam satırı döner
             metrics: Metric listesi (Türkçe veya API adı)
                 Örnek: ["totalUsers", "Sayfa Görüntüleme"]
             start_date: Başlangıç tarihi
             end_date: Bitiş tarihi
             filters: Filtre sözlüğü
                 Örnek: {"vcat1": "Spor"} veya {"sessionDefaultChannelGroup": "Organic Search"}
+                IN listesi, $or/$not grupları, metin ve sayısal aralık operatörleri de
+                desteklenir: {"editor": {"in": [...]}, "sessions": {"gte": 10}}
+                (metric koşulları metric_filter'a gider; bkz. ga4_filters)
             order_by: Sıralama yapılacak metric/dimension
             order_desc: Azalan sıralama (True) veya artan (False)
             limit: Maksimum satır sayısı
-            return_type: Dönüş tipi - "dataframe", "list", "raw"
+            return_type: Dönüş tipi - "dataframe", "list", "raw", "arrow", "iter"
+                "arrow" dimension sütunları sözlük kodlamalı bir pyarrow.Table döner
+                (pyarrow gerekir; bkz. ga4_arrow)
+                "iter" sonuçları biriktirmez; sayfa sayfa DataFrame parçaları üreten
+                bir iterator döner (bkz. stream_query)
+            use_cache: Yanıt önbelleğini kullan (False ise her zaman API'ye gider)
+                Kapanmış tarih aralıkları ayrıca disk deposunda süreçler arası paylaşılır
+            page_size: Sayfa başına satır sayısı (None ise client ayarı, en fazla MAX_PAGE_SIZE)
+            date_ranges: Birden fazla tarih aralığı (verilirse start_date/end_date yok sayılır)
+                Örnek: [("7daysAgo", "yesterday", "current"), ("14daysAgo", "8daysAgo", "previous")]
+                En fazla MAX_DATE_RANGES aralık; birden fazlaysa her satır "Tarih Aralığı"
+                sütununda aralık adını taşır
+            compact: DataFrame'i compact dtype'larla döndür (None ise client ayarı - compact_dtypes)
+                Kazanılan bellek df.attrs["memory_saved"] ve client.memory_stats'ta tutulur
 
         Returns:
             Sorgu sonuçları (belirtilen formatta)
         """
-        # Varsayılan değerler
-        dimensions = dimensions or ["date"]
-        metrics = metrics or ["totalUsers", "sessions", "screenPageViews"]
+        if return_type == "iter":
+            return self.stream_query(
+                dimensions=dimensions,
+                metrics=metrics,
+                start_date=start_date,
+                end_date=end_date,
+                filters=filters,
+                order_by=order_by,
+                order_desc=order_desc,
+                limit=limit,
+                use_cache=use_cache,
+                page_size=page_size,
+                date_ranges=date_ranges
+            )
 
-        # İsimleri API formatına çevir
-        resolved_dimensions = [self._resolve_dimension_name(d) for d in dimensions]
-        resolved_metrics = [self._resolve_metric_name(m) for m in metrics]
+        query = self._prepare_query(
+            dimensions=dimensions,
+            metrics=metrics,
+            start_date=start_date,
+            end_date=end_date,
+            filters=filters,
+            order_by=order_by,
+            order_desc=order_desc,
+            limit=limit,
+            date_ranges=date_ranges
+        )
+        query["page_size"] = page_size
+        query["compact"] = compact
+
+        collector = _query_collector.get()
+        if collector is not None:
+            return self._collect_query(collector, query, return_type, use_cache, dict(
+                dimensions=dimensions, metrics=metrics, start_date=start_date, end_date=end_date,
+                filters=filters, order_by=order_by, order_desc=order_desc, limit=limit,
+                page_size=page_size, date_ranges=date_ranges, compact=compact
+            ))
+
+        columns = self._lookup_cached(query, use_cache)
+
+        if columns is None:
+            # Aynı anda gelen özdeş sorgular tek çağrıyı bekler
+            columns = self.in_flight.do(
+                query["cache_key"], lambda: self._fetch_and_store(query, use_cache)
+            )
 
-        # Tarihleri parse et
-        parsed_start = self._parse_date(start_date)
-        parsed_end = self._parse_date(end_date)
+        return self._format_result(columns, query, return_type)
+
+    def _fetch_and_store(self, query: Dict, use_cache: bool) -> Dict[str, np.ndarray]:
+        """Sorguyu (uygunsa günlük parçalardan) API'den çeker ve önbelleğe yazar"""
+        columns = None
+        if use_cache and self._partition_eligible(query):
+            columns = self._fetch_partitioned(query)
+        if columns is None:
+            columns = self._fetch_rows(query)
+        self._store_cached(query, columns, use_cache)
+        return columns
+
+    # =========================================================================
+    # GÜNLÜK PARÇA ÖNBELLEĞİ
+    # =========================================================================
+    # Tek tarih aralıklı sorgular gün gün önbelleğe yazılır; örtüşen aralıklar
+    # ("son 7 gün", "son 30 gün") sadece eksik günleri çeker, sonuç yerelde birleşir.
+    # - date dimension'ı varsa parçalar olduğu gibi art arda eklenir (her metric uygun)
+    # - yoksa parçalar dimension'lara göre toplanır - sadece additive metric'lerle
+
+    def _partition_eligible(self, query: Dict) -> bool:
+        """Sorgu günlük parçalardan oluşturulabilir mi?"""
+        if len(query["ranges"]) != 1:
+            return False
+        if self._partition_signature(query) in self.partition_skip:
+            return False
+        # Metric filtresi toplam değerlere uygulanır; günlük parçalara bölünemez
+        if "metric_filter" in query["request"]:
+            return False
+        # Top-N sorgusu - GA4 sadece limit kadar satır döndürür, parçalar hepsini çekerdi
+        if query["limit"] < PARTITION_MIN_LIMIT and not set(query["dimensions"]) <= {"date"}:
+            return False
+        if "date" in query["dimensions"]:
+            return True
+        return all(is_additive_metric(metric) for metric in query["metrics"])
+
+    def _partition_dimensions(self, query: Dict) -> List[str]:
+        """Parçaların dimension listesi - date yoksa sona eklenir"""
+        if "date" in query["dimensions"]:
+            return list(query["dimensions"])
+        return list(query["dimensions"]) + ["date"]
+
+    def _partition_signature(self, query: Dict) -> tuple:
+        """Tarihten bağımsız parça kimliği (property, dimension'lar, metric'ler, filtre)"""
+        return (
+            self.property_id,
+            tuple(self._partition_dimensions(query)),
+            tuple(query["metrics"]),
+            query["filter_key"]
+        )
 
-        # Request oluştur
-        request = {
-            "property": f"properties/{self.property_id}",
-            "date_ranges": [DateRange(start_date=parsed_start, end_date=parsed_end)],
-            "dimensions": [Dimension(name=d) for d in resolved_dimensions],
-            "metrics": [Metric(name=m) for m in resolved_metrics],
-            "limit": limit
+    def _partition_entry(self, query: Dict, day: str) -> Dict:
+        """Bir günün parçası için _lookup_cached/_store_cached'e verilecek anahtar bilgisi"""
+        return {
+            "cache_key": ("day",) + self._partition_signature(query) + (day,),
+            "memory_cache": self.partition_cache,
+            "ttl": ttl_for_range(day, day),
+            "closed": is_closed_range(day)
         }
 
-        # Filtre ekle
-        if filters:
-            filter_expressions = []
-            for field, value in filters.items():
-                resolved_field = self._resolve_dimension_name(field)
-                filter_expressions.append(
-                    FilterExpression(
-                        filter=Filter(
-                            field_name=resolved_field,
-                            string_filter=Filter.StringFilter(
-                                value=value,
-                                match_type=Filter.StringFilter.MatchType.EXACT
-                            )
-                        )
-                    )
-                )
+    @staticmethod
+    def _partition_days(query: Dict) -> List[str]:
+        """Sorgu aralığındaki günler (YYYY-MM-DD)"""
+        start, end, _ = query["ranges"][0]
+        current = datetime.strptime(resolve_concrete_date(start), "%Y-%m-%d")
+        last = datetime.strptime(resolve_concrete_date(end), "%Y-%m-%d")
+        days = []
+        while current <= last:
+            days.append(current.strftime("%Y-%m-%d"))
+            current += timedelta(days=1)
+        return days
+
+    def _lookup_partitions(self, query: Dict) -> tuple:
+        """
+        Önbellekteki günleri ve eksik gün aralıklarını bulur.
 
-            if len(filter_expressions) == 1:
-                request["dimension_filter"] = filter_expressions[0]
-            else:
-                request["dimension_filter"] = FilterExpression(
-                    and_group=FilterExpressionList(expressions=filter_expressions)
-                )
+        Returns:
+            (gün -> sütunlar, [(başlangıç, bitiş), ...] ardışık eksik aralıklar)
+        """
+        days = self._partition_days(query)
+        parts = {}
+        for day in days:
+            columns = self._lookup_cached(self._partition_entry(query, day), True)
+            if columns is not None:
+                parts[day] = columns
+        return parts, self._missing_spans(days, parts)
 
-        # Sıralama ekle
-        if order_by:
-            resolved_order = self._resolve_metric_name(order_by) if order_by in METRICS or get_metric_info(order_by) else self._resolve_dimension_name(order_by)
-
-            # Metric mi dimension mı kontrol et
-            if resolved_order in resolved_metrics:
-                request["order_bys"] = [
-                    OrderBy(
-                        metric=OrderBy.MetricOrderBy(metric_name=resolved_order),
-                        desc=order_desc
-                    )
-                ]
+    @staticmethod
+    def _missing_spans(days: List[str], parts: Dict) -> List[tuple]:
+        """parts'ta olmayan günleri ardışık (başlangıç, bitiş) aralıklarına toplar"""
+        spans = []
+        for day in days:
+            if day in parts:
+                continue
+            if spans and spans[-1][1] == (datetime.strptime(day, "%Y-%m-%d") - timedelta(days=1)).strftime("%Y-%m-%d"):
+                spans[-1] = (spans[-1][0], day)
             else:
-                request["order_bys"] = [
-                    OrderBy(
-                        dimension=OrderBy.DimensionOrderBy(dimension_name=resolved_order),
-                        desc=order_desc
-                    )
-                ]
-
-        # Veriyi çek (sayfalama ile)
-        all_data = []
-        offset = 0
-        page_size = min(limit, 10000)
-
-        while True:
-            current_request = request.copy()
-            current_request["offset"] = offset
-            current_request["limit"] = page_size
+                spans.append((day, day))
+        return spans
 
-            try:
-                response = self.client.run_report(current_request)
-            except Exception as e:
-                raise Exception(f"GA4 API hatası: {str(e)}")
+    def _span_query(self, query: Dict, start: str, end: str) -> Dict:
+        """Eksik gün aralığını date dimension'ı ile çekecek sorgu"""
+        span_query = self._prepare_query(
+            dimensions=self._partition_dimensions(query),
+            metrics=query["metrics"],
+            start_date=start,
+            end_date=end,
+            limit=PARTITION_MAX_ROWS
+        )
+        if "dimension_filter" in query["request"]:
+            span_query["request"]["dimension_filter"] = query["request"]["dimension_filter"]
+        return span_query
 
-            if not response.rows:
-                break
+    def _span_too_large(self, query: Dict, probe) -> bool:
+        """Eksik aralık PARTITION_MAX_ROWS'u aşıyorsa bu sorgu tipi bir daha parçalanmaz"""
+        if probe.row_count <= PARTITION_MAX_ROWS:
+            return False
+        self.partition_skip.add(self._partition_signature(query))
+        return True
 
-            # Yanıtı işle
-            for row in response.rows:
-                row_data = {}
+    def _span_pages(self, span_query: Dict, probe) -> List[tuple]:
+        """
+        Tek satırlık yoklama sayfasından sonra çekilecek (offset, page_size) çiftleri.
+        Yoklamanın satırı tekrar çekilmez; aralık tek satırsa liste boştur.
+        """
+        total = min(probe.row_count, span_query["limit"])
+        page_size = self._page_size_for(span_query)
+        return [(offset, min(page_size, total - offset)) for offset in range(len(probe.rows), total, page_size)]
 
-                # Dimension değerleri
-                for i, dim in enumerate(resolved_dimensions):
-                    tr_name = get_tr_name_from_api(dim)
-                    row_data[tr_name] = row.dimension_values[i].value
+    def _store_partitions(self, query: Dict, columns: Dict[str, np.ndarray], start: str, end: str) -> Dict[str, Dict[str, np.ndarray]]:
+        """Çekilen aralığı günlere bölüp her günü önbelleğe yazar (satırı olmayan günler dahil)"""
+        parts = self._split_days(columns, start, end)
+        for day, day_columns in parts.items():
+            self._store_cached(self._partition_entry(query, day), day_columns, True)
+        return parts
 
-                # Metric değerleri
-                for i, met in enumerate(resolved_metrics):
-                    tr_name = get_tr_name_from_api(met)
-                    value = row.metric_values[i].value
+    @staticmethod
+    def _split_days(columns: Dict[str, np.ndarray], start: str, end: str) -> Dict[str, Dict[str, np.ndarray]]:
+        """date sütunlu sonucu gün -> sütunlar sözlüğüne böler (satırı olmayan günler boş)"""
+        dates = columns[get_tr_name_from_api("date")]
+        parts = {}
+        current = datetime.strptime(start, "%Y-%m-%d")
+        last = datetime.strptime(end, "%Y-%m-%d")
+        while current <= last:
+            mask = dates == current.strftime("%Y%m%d")
+            parts[current.strftime("%Y-%m-%d")] = {name: values[mask] for name, values in columns.items()}
+            current += timedelta(days=1)
+        return parts
+
+    def _assemble_partitions(self, query: Dict, parts: Dict[str, Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+        """
+        Günlük parçaları sorgunun sonucuna çevirir: gerekirse dimension'lara göre toplar,
+        sıralar ve limite göre kırpar.
+        """
+        columns = concat_columns([parts[day] for day in sorted(parts)])
 
-                    # Metric tipine göre dönüşüm
-                    metric_info = get_metric_info(met)
-                    if metric_info:
-                        if metric_info.get("type") in ["integer"]:
-                            value = int(value)
-                        elif metric_info.get("type") in ["float", "percent", "currency", "duration"]:
-                            value = float(value)
+        if "date" not in query["dimensions"]:
+            columns.pop(get_tr_name_from_api("date"))
+            columns = self._sum_by_dimensions(columns, query)
 
-                    row_data[tr_name] = value
+        # Sıralama - verilmemişse GA4 gibi ilk metric'e göre azalan
+        if query["order_key"]:
+            _, order_name, descending = query["order_key"]
+            order_column = get_tr_name_from_api(order_name)
+        else:
+            order_column, descending = query["metric_columns"][0][0], True
+        if column_length(columns):
+            order = pd.Series(columns[order_column]).sort_values(
+                ascending=not descending, kind="stable"
+            ).index.to_numpy()
+            columns = {name: values[order] for name, values in columns.items()}
 
-                all_data.append(row_data)
+        return self._merge_pages(query, [columns])
 
-            # Son sayfa mı?
-            if len(response.rows) < page_size or len(all_data) >= limit:
-                break
+    @staticmethod
+    def _sum_by_dimensions(columns: Dict[str, np.ndarray], query: Dict) -> Dict[str, np.ndarray]:
+        """Günlere yayılmış satırları dimension değerlerine göre toplar"""
+        metric_names = [name for name, _ in query["metric_columns"]]
+        if column_length(columns) == 0:
+            return columns
+
+        # Dimension'sız (toplam) sorgu - tek satır
+        if not query["dimension_columns"]:
+            return {name: columns[name].sum(keepdims=True) for name in metric_names}
+
+        codes = np.column_stack([pd.factorize(columns[name])[0] for name in query["dimension_columns"]])
+        _, first_rows, groups = np.unique(codes, axis=0, return_index=True, return_inverse=True)
+        groups = groups.reshape(-1)
+
+        summed = {}
+        for name in query["dimension_columns"]:
+            summed[name] = columns[name][first_rows]
+        for name in metric_names:
+            values = columns[name]
+            totals = np.zeros(len(first_rows), dtype=values.dtype)
+            np.add.at(totals, groups, values)
+            summed[name] = totals
+        return summed
+
+    def _fetch_partitioned(self, query: Dict) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Sorguyu günlük parçalardan oluşturur; sadece önbellekte olmayan günleri çeker.
+        Her eksik aralık önce tek satırla yoklanır (row_count); aralık çok büyükse
+        None döner ve sorgu doğrudan çalıştırılır - büyük sayfa boşa çekilmez.
+        """
+        parts, spans = self._lookup_partitions(query)
 
-            offset += page_size
+        for start, end in spans:
+            span_query = self._span_query(query, start, end)
+            probe = self._run_report_page(span_query["request"], offset=0, page_size=1)
+            if self._span_too_large(query, probe):
+                return None
+            columns = self._collect_pages(span_query, probe, pages=self._span_pages(span_query, probe))
+            parts.update(self._store_partitions(query, columns, start, end))
 
-        # Sonucu formatla
-        if return_type == "dataframe":
-            df = pd.DataFrame(all_data)
-            return df
-        elif return_type == "list":
-            return all_data
-        else:  # raw
-            return {
-                "data": all_data,
-                "dimensions": resolved_dimensions,
-                "metrics": resolved_metrics,
-                "date_range": {"start": parsed_start, "end": parsed_end},
-                "row_count": len(all_data)
-            }
+        return self._assemble_partitions(query, parts)
 
-    def quick_query(
+    def stream_query(
         self,
-        query_name: str,
+        dimensions: List[str] = None,
+        metrics: List[str] = None,
         start_date: Union[str, datetime, int] = "7daysAgo",
         end_date: Union[str, datetime, int] = "yesterday",
-        limit: int = 100
-    ) -> pd.DataFrame:
+        filters: Dict = None,
+        order_by: str = None,
+        order_desc: bool = True,
+        limit: int = 10000,
+        chunk_type: str = "dataframe",
+        use_cache: bool = True,
+        page_size: int = None,
+        date_ranges: List = None
+    ) -> Iterator[Union[pd.DataFrame, List[Dict], Dict[str, np.ndarray]]]:
         """
-        Önceden tanımlanmış hızlı sorguları çalıştırır.
+        Sorguyu sayfa sayfa çalıştırır ve her sayfayı geldiği anda parça olarak üretir.
+        Büyük raporlar (ör. 200k satırlık pagePath x pageTitle) sabit bellekle işlenebilir;
+        ilk parça son sayfa gelmeden kullanılabilir.
+
+        - Sonuç önbellekteyse önbellekten page_size'lık dilimler halinde üretilir
+        - Değilse ilk sayfadan sonra en fazla max_page_workers sayfa aynı anda havada
+          tutulur, parçalar offset sırasıyla üretilir
+        - Akış sonuçları önbelleğe yazılmaz (tüm sonucu biriktirmemek için)
 
         Args:
-            query_name: Sorgu adı (QUICK_QUERIES'den)
-                - "genel_bakis"
-                - "trafik_kaynaklari"
-                - "en_cok_okunanlar"
-                - "cihaz_dagilimi"
-                - "sehir_dagilimi"
-                - "kategori_performansi"
-                - "editor_performansi"
-                - "saatlik_trafik"
-                - "gunluk_trafik"
-                - "haber_tipi"
-            start_date: Başlangıç tarihi
-            end_date: Bitiş tarihi
-            limit: Maksimum satır sayısı
+            dimensions, metrics, start_date, end_date, filters, order_by, order_desc,
+            limit, use_cache, page_size, date_ranges: run_query ile aynı
+            chunk_type: Parça tipi - "dataframe", "list" (satır sözlükleri),
+                "arrow" (pyarrow.Table) veya "columns" (sütun adı -> numpy dizisi)
 
-        Returns:
-            Sorgu sonuçları DataFrame olarak
+        Yields:
+            Her sayfa için bir parça (belirtilen formatta)
         """
-        if query_name not in QUICK_QUERIES:
-            available = ", ".join(QUICK_QUERIES.keys())
-            raise ValueError(f"Geçersiz sorgu adı: {query_name}. Mevcut sorgular: {available}")
-
-        query = QUICK_QUERIES[query_name]
-
-        return self.run_query(
-            dimensions=query["dimensions"],
-            metrics=query["metrics"],
+        query = self._prepare_query(
+            dimensions=dimensions,
+            metrics=metrics,
             start_date=start_date,
             end_date=end_date,
+            filters=filters,
+            order_by=order_by,
+            order_desc=order_desc,
             limit=limit,
-            order_by=query["metrics"][0],
-            order_desc=True
+            date_ranges=date_ranges
         )
-
-    def get_top_pages(
+        query["page_size"] = page_size
+        page_size = self._page_size_for(query)
+
+        columns = self._lookup_cached(query, use_cache)
+        if columns is not None:
+            # Önbellekteki diziler paylaşılır - dilimlerin kopyası verilir
+            for offset in range(0, column_length(columns), page_size):
+                chunk = {name: values[offset:offset + page_size].copy() for name, values in columns.items()}
+                yield self._format_chunk(chunk, query, chunk_type)
+            return
+
+        request = query["request"]
+        first_page = self._run_report_page(request, offset=0, page_size=page_size)
+        yield self._format_chunk(self._decode_columns(first_page, query), query, chunk_type)
+
+        pages = deque(self._remaining_pages(query, first_page, page_size))
+        if not pages:
+            return
+
+        pool = ThreadPoolExecutor(max_workers=max(1, min(self.max_page_workers, len(pages))))
+        pending = deque()
+        try:
+            while pages or pending:
+                # Havadaki sayfa sayısı sınırlı - tüketici yavaşsa çekim de yavaşlar
+                while pages and len(pending) < self.max_page_workers:
+                    offset, size = pages.popleft()
+                    pending.append(pool.submit(
+                        contextvars.copy_context().run,
+                        self._run_report_page, request, offset, size
+                    ))
+                response = pending.popleft().result()
+                yield self._format_chunk(self._decode_columns(response, query), query, chunk_type)
+        finally:
+            # Tüketici erken bırakırsa başlamamış sayfalar iptal edilir
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=False)
+
+    def _format_chunk(self, columns: Dict[str, np.ndarray], query: Dict, chunk_type: str) -> Union[pd.DataFrame, List[Dict], Dict[str, np.ndarray]]:
+        """Akıştaki bir sayfayı istenen parça tipine çevirir (diziler parçaya aittir, kopyalanmaz)"""
+        if chunk_type == "dataframe":
+            return pd.DataFrame(columns, copy=False)
+        elif chunk_type == "list":
+            return columns_to_rows(columns)
+        elif chunk_type == "arrow":
+            return self._to_arrow(columns, query)
+        else:  # columns
+            return columns
+
+    def run_batch(
         self,
-        start_date: Union[str, datetime, int] = "yesterday",
-        end_date: Union[str, datetime, int] = "yesterday",
-        limit: int = 10,
-        category: str = None
-    ) -> pd.DataFrame:
+        specs: List[Dict],
+        return_type: str = "dataframe",
+        use_cache: bool = True
+    ) -> List[Union[pd.DataFrame, List[Dict], Dict]]:
         """
-        En çok görüntülenen sayfaları getirir.
-        GA4 panelindeki gibi sadece pagePath bazında.
+        Birden fazla bağımsız raporu batchRunReports ile çeker.
+        Önbellekte olmayan raporlar en az sayıda batch isteğine (her biri en fazla
+        MAX_BATCH_SIZE rapor) paketlenir ve batch'ler paralel gönderilir.
 
         Args:
-            start_date: Başlangıç tarihi
-            end_date: Bitiş tarihi
-            limit: Kaç sayfa getirileceği
-            category: Kategori filtresi (opsiyonel)
+            specs: run_query parametre sözlükleri listesi
+                Örnek: [{"metrics": ["totalUsers"], "start_date": "yesterday", "end_date": "yesterday"},
+                        {"dimensions": ["deviceCategory"], "metrics": ["sessions"]}]
+                Her sözlük kendi "return_type", "page_size" ve "compact" değerini içerebilir
+            return_type: Varsayılan dönüş tipi - "dataframe", "list", "raw"
+            use_cache: Yanıt önbelleğini kullan
 
         Returns:
-            En çok görüntülenen sayfalar
+            Her spec için bir sonuç (specs ile aynı sırada)
         """
-        filters = {}
-        if category:
-            # Jenerik cat1 kullan - marka bazli cozulecek
-            filters["cat1"] = category
+        queries = self._prepare_specs(specs)
+
+        # Önbellekten karşılananlar
+        results = [self._lookup_cached(query, use_cache) for query in queries]
+        chunks = self._pending_chunks(results)
+
+        # Kalanları batch'lere böl ve paralel gönder
+        if chunks:
+            workers = max(1, min(self.max_page_workers, len(chunks)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                chunk_results = context_map(
+                    pool,
+                    lambda chunk: self.in_flight.do(
+                        self._batch_key([queries[i] for i in chunk]),
+                        lambda: self._fetch_batch_and_store([queries[i] for i in chunk], use_cache)
+                    ),
+                    chunks
+                )
+                for chunk, chunk_data in zip(chunks, chunk_results):
+                    for i, columns in zip(chunk, chunk_data):
+                        results[i] = columns
 
-        # GA4 panelindeki gibi: pagePath, screenPageViews, totalUsers, sessions
-        return self.run_query(
-            dimensions=["pagePath"],
-            metrics=["screenPageViews", "totalUsers", "sessions"],
-            start_date=start_date,
-            end_date=end_date,
-            filters=filters if filters else None,
-            order_by="screenPageViews",
-            order_desc=True,
-            limit=limit
-        )
+        return [
+            self._format_result(columns, query, spec.get("return_type", return_type))
+            for columns, query, spec in zip(results, queries, specs)
+        ]
 
-    def get_traffic_sources(
-        self,
-        start_date: Union[str, datetime, int] = "7daysAgo",
-        end_date: Union[str, datetime, int] = "yesterday"
-    ) -> pd.DataFrame:
+    @contextmanager
+    def collect_queries(self):
         """
-        Trafik kaynaklarını getirir.
+        Blok içindeki run_query çağrılarını API'ye göndermeden toplar; çağrılar boş
+        sonuç döner. Toplanan spec'ler run_batch ile tek seferde çekilince aynı kod
+        tekrar çalıştırıldığında raporlar önbellekten gelir.
 
-        Args:
-            start_date: Başlangıç tarihi
-            end_date: Bitiş tarihi
+            with client.collect_queries() as specs:
+                handler()              # sonucu kullanılmaz
+            client.run_batch(specs)    # en az sayıda batchRunReports çağrısı
+            handler()                  # önbellekten
 
-        Returns:
-            Trafik kaynakları dağılımı
+        Yields:
+            Spec listesi (blok bitince dolar; aynı sorgu bir kez yer alır)
         """
-        return self.run_query(
-            dimensions=["sessionDefaultChannelGroup"],
-            metrics=["totalUsers", "sessions", "screenPageViews", "bounceRate", "averageSessionDuration"],
-            start_date=start_date,
-            end_date=end_date,
-            order_by="totalUsers",
-            order_desc=True
-        )
+        specs = []
+        collected = {}
+        token = _query_collector.set(collected)
+        try:
+            yield specs
+        finally:
+            _query_collector.reset(token)
+            specs.extend(collected.values())
+
+    def _collect_query(self, collector: Dict, query: Dict, return_type: str, use_cache: bool, spec: Dict):
+        """collect_queries bloğundaki run_query: spec'i kaydeder, boş sonuç döner"""
+        # Önbelleği kullanmayan sorgu ön yüklemeden faydalanmaz
+        if use_cache:
+            collector.setdefault(query["cache_key"], {k: v for k, v in spec.items() if v is not None})
+        columns = {name: np.array([], dtype=object) for name in query["dimension_columns"]}
+        columns.update({name: np.array([], dtype=np.float64) for name, _ in query["metric_columns"]})
+        return self._format_result(columns, query, return_type)
+
+    def _prepare_specs(self, specs: List[Dict]) -> List[Dict]:
+        """run_batch spec'lerini hazırlanmış sorgulara çevirir"""
+        query_keys = ["dimensions", "metrics", "start_date", "end_date", "filters",
+                      "order_by", "order_desc", "limit", "date_ranges"]
+
+        queries = []
+        for spec in specs:
+            query = self._prepare_query(**{k: spec[k] for k in query_keys if k in spec})
+            query["page_size"] = spec.get("page_size")
+            query["compact"] = spec.get("compact")
+            queries.append(query)
+        return queries
 
-    def get_category_performance(
-        self,
-        start_date: Union[str, datetime, int] = "7daysAgo",
-        end_date: Union[str, datetime, int] = "yesterday",
-        limit: int = 20
-    ) -> pd.DataFrame:
-        """
-        Kategori performansını getirir.
+    @staticmethod
+    def _batch_key(queries: List[Dict]) -> tuple:
+        """Batch isteği için single-flight anahtarı"""
+        return ("batch",) + tuple(query["cache_key"] for query in queries)
 
-        Args:
-            start_date: Başlangıç tarihi
-            end_date: Bitiş tarihi
-            limit: Maksimum kategori sayısı
+    def _fetch_batch_and_store(self, queries: List[Dict], use_cache: bool) -> List[Dict[str, np.ndarray]]:
+        """Batch'i API'den çeker ve her raporu önbelleğe yazar"""
+        results = self._fetch_batch(queries)
+        for query, columns in zip(queries, results):
+            self._store_cached(query, columns, use_cache)
+        return results
 
-        Returns:
-            Kategori bazlı performans
+    @staticmethod
+    def _pending_chunks(results: List) -> List[List[int]]:
+        """Önbellekte bulunamayan sorguların indekslerini MAX_BATCH_SIZE'lık gruplara böler"""
+        pending = [i for i, data in enumerate(results) if data is None]
+        return [pending[i:i + MAX_BATCH_SIZE] for i in range(0, len(pending), MAX_BATCH_SIZE)]
+
+    def _fetch_batch(self, queries: List[Dict]) -> List[Dict[str, np.ndarray]]:
         """
-        # Jenerik "cat1" kullan - marka bazli cozulecek
-        df = self.run_query(
-            dimensions=["cat1"],
-            metrics=["screenPageViews", "totalUsers", "sessions", "averageSessionDuration"],
-            start_date=start_date,
-            end_date=end_date,
-            order_by="screenPageViews",
-            order_desc=True,
-            limit=limit
+        En fazla MAX_BATCH_SIZE sorguyu tek batchRunReports çağrısıyla çalıştırır.
+        Tek sayfaya sığmayan raporların kalan sayfaları normal yoldan çekilir.
+        """
+        page_sizes = [self._page_size_for(query) for query in queries]
+
+        response = self._call_api("batch_run_reports", self._batch_request(queries, page_sizes))
+
+        return [
+            self._collect_pages(query, report, page_size)
+            for query, report, page_size in zip(queries, response.reports, page_sizes)
+        ]
+
+    def _batch_request(self, queries: List[Dict], page_sizes: List[int]) -> BatchRunReportsRequest:
+        """Sorguların ilk sayfalarını tek BatchRunReportsRequest'te toplar"""
+        return BatchRunReportsRequest(
+            property=f"properties/{self.property_id}",
+            requests=[
+                RunReportRequest(**self._page_request(query["request"], 0, page_size))
+                for query, page_size in zip(queries, page_sizes)
+            ]
         )
 
-        # Oturum suresi saniye cinsinden, dakikaya cevir ve birim ekle
-        if "Ortalama Oturum Suresi" in df.columns:
-            df["Ort. Oturum (dk)"] = (df["Ortalama Oturum Suresi"] / 60).round(2)
-            df = df.drop(columns=["Ortalama Oturum Suresi"])
+    def _lookup_cached(self, query: Dict, use_cache: bool) -> Optional[Dict[str, np.ndarray]]:
+        """Sorguyu önce bellek önbelleğinde (query["memory_cache"] varsa onda), kapanmış aralıksa disk deposunda arar"""
+        if not use_cache:
+            return None
 
-        return df
+        columns = query.get("memory_cache", self.response_cache).get(query["cache_key"])
+        if columns is not None or not query["closed"]:
+            return columns
 
-    def get_editor_performance(
-        self,
-        start_date: Union[str, datetime, int] = "7daysAgo",
-        end_date: Union[str, datetime, int] = "yesterday",
-        limit: int = 20
-    ) -> pd.DataFrame:
+        # Disk deposunda var mı? (başka bir süreç daha önce çekmiş olabilir)
+        return self._lookup_stored(query)
+
+    def _lookup_stored(self, query: Dict) -> Optional[Dict[str, np.ndarray]]:
+        """Kapanmış aralığı disk deposunda arar; bulunursa bellek önbelleğine de koyar"""
+        store = self._get_report_store()
+        if store is None:
+            return None
+
+        columns = None
+        try:
+            columns = store.get(self.brand_key, self.property_id, query["cache_key"])
+            if columns is not None:
+                query.get("memory_cache", self.response_cache).set(query["cache_key"], columns, ttl=query["ttl"])
+        except Exception as e:
+            print(f"[UYARI] Disk onbellegi okunamadi: {str(e)}")
+        return columns
+
+    def _store_cached(self, query: Dict, columns: Dict[str, np.ndarray], use_cache: bool):
+        """Sonucu bellek önbelleğine, kapanmış aralıksa disk deposuna da yazar"""
+        if not use_cache:
+            return
+
+        query.get("memory_cache", self.response_cache).set(query["cache_key"], columns, ttl=query["ttl"])
+
+        if query["closed"]:
+            self._write_stored(query, columns)
+
+    def _write_stored(self, query: Dict, columns: Dict[str, np.ndarray]):
+        """Kapanmış aralığın sonucunu disk deposuna yazar"""
+        store = self._get_report_store()
+        if store is not None:
+            try:
+                store.put(self.brand_key, self.property_id, query["cache_key"],
+                          columns, ttl=query["ttl"])
+            except Exception as e:
+                print(f"[UYARI] Disk onbellegine yazilamadi: {str(e)}")
+
+    def _prepare_query(
+        self,
+        dimensions: List[str] = None,
+        metrics: List[str] = None,
+        start_date: Union[str, datetime, int] = "7daysAgo",
+        end_date: Union[str, datetime, int] = "yesterday",
+        filters: Dict = None,
+        order_by: str = None,
+        order_desc: bool = True,
+        limit: int = 10000,
+        date_ranges: List = None
+    ) -> Dict:
         """
-        Editör performansını getirir.
+        Sorgu parametrelerini çözümleyip API isteğini ve önbellek anahtarını hazırlar.
 
-        Args:
-            start_date: Başlangıç tarihi
-            end_date: Bitiş tarihi
-            limit: Maksimum editör sayısı
+        Returns:
+            {"request", "dimensions", "metrics", "start", "end", "ranges",
+             "dimension_columns", "category_columns", "metric_columns", "limit",
+             "cache_key", "filter_key", "order_key", "ttl", "closed"}
+
+        Raises:
+            InvalidQueryError: Dimension/metric property şemasında yok (ga4_metadata)
+        """
+        # Varsayılan değerler - boş liste (dimensions=[]) bilerek verilmişse toplam satırı istenir
+        dimensions = ["date"] if dimensions is None else dimensions
+        metrics = metrics or ["totalUsers", "sessions", "screenPageViews"]
+
+        # Property şeması - custom dimension adları isim çözümlemeden önce güncellenir
+        schema = self._schema_for_query()
+
+        # İsimleri API formatına çevir
+        resolved_dimensions = [self._resolve_dimension_name(d) for d in dimensions]
+        resolved_metrics = [self._resolve_metric_name(m) for m in metrics]
+
+        # Tarihleri parse et
+        ranges = self._parse_date_ranges(date_ranges or [(start_date, end_date)])
+        parsed_start, parsed_end = ranges[0][0], ranges[0][1]
+
+        # Request oluştur - birden fazla aralıkta her aralık adıyla gönderilir,
+        # API satırları "dateRange" dimension'ı ile etiketler
+        if len(ranges) > 1:
+            request_ranges = [DateRange(start_date=start, end_date=end, name=name)
+                              for start, end, name in ranges]
+        else:
+            request_ranges = [DateRange(start_date=parsed_start, end_date=parsed_end)]
+
+        request = {
+            "property": f"properties/{self.property_id}",
+            "date_ranges": request_ranges,
+            "dimensions": [Dimension(name=d) for d in resolved_dimensions],
+            "metrics": [Metric(name=m) for m in resolved_metrics],
+            "limit": limit,
+            # Kalan kota her yanıtta gelsin - QuotaScheduler bununla güncellenir
+            "return_property_quota": True
+        }
+
+        # Filtre ekle
+        filter_key = self._apply_filters(request, filters)
+
+        # Sıralama ekle
+        order_key = self._order_key(order_by, order_desc, resolved_metrics)
+        if order_key:
+            request["order_bys"] = self._build_order_bys(order_key)
+
+        # Hatalı adlar API'ye gitmeden yakalanır
+        self._validate_request(schema, request)
+
+        # Önbellek anahtarı - tamamen çözümlenmiş istek
+        # Göreli tarihler ("7daysAgo") somut tarihe çevrilir ki gün dönünce eski kayıt kullanılmasın
+        concrete_ranges = tuple(
+            (resolve_concrete_date(start), resolve_concrete_date(end), name if len(ranges) > 1 else None)
+            for start, end, name in ranges
+        )
+        concrete_start = min(r[0] for r in concrete_ranges)
+        concrete_end = max(r[1] for r in concrete_ranges)
+        cache_key = (
+            self.property_id,
+            tuple(resolved_dimensions),
+            tuple(resolved_metrics),
+            concrete_ranges,
+            filter_key,
+            order_key,
+            limit
+        )
+
+        return {
+            "request": request,
+            "dimensions": resolved_dimensions,
+            "metrics": resolved_metrics,
+            "start": parsed_start,
+            "end": parsed_end,
+            "ranges": ranges,
+            "dimension_columns": [get_tr_name_from_api(d) for d in resolved_dimensions],
+            "category_columns": self._category_columns(resolved_dimensions, ranges),
+            "metric_columns": [(get_tr_name_from_api(m), self._metric_dtype(m)) for m in resolved_metrics],
+            "limit": limit,
+            "cache_key": cache_key,
+            "filter_key": filter_key,
+            "order_key": order_key,
+            "ttl": ttl_for_range(concrete_start, concrete_end),
+            "closed": is_closed_range(concrete_end)
+        }
+
+    def _apply_filters(self, request: Dict, filters: Dict) -> Optional[tuple]:
+        """
+        Filtre sözlüğünü derleyip isteğe dimension_filter / metric_filter olarak ekler.
 
         Returns:
-            Editör bazlı performans
+            Önbellek anahtarı için (dimension_filter, metric_filter) serileştirmesi;
+            filtre yoksa None
         """
-        # Jenerik "editor" kullan - marka bazli cozulecek
-        return self.run_query(
-            dimensions=["editor"],
-            metrics=["screenPageViews", "totalUsers", "sessions"],
-            start_date=start_date,
-            end_date=end_date,
-            order_by="screenPageViews",
-            order_desc=True,
-            limit=limit
+        dimension_filter, metric_filter = compile_filters(filters, self._resolve_filter_field)
+        if dimension_filter is None and metric_filter is None:
+            return None
+
+        if dimension_filter is not None:
+            request["dimension_filter"] = dimension_filter
+        if metric_filter is not None:
+            request["metric_filter"] = metric_filter
+        return (
+            FilterExpression.serialize(dimension_filter) if dimension_filter is not None else None,
+            FilterExpression.serialize(metric_filter) if metric_filter is not None else None
         )
 
-    def get_hourly_traffic(
-        self,
-        date: Union[str, datetime, int] = "yesterday"
-    ) -> pd.DataFrame:
+    def _resolve_filter_field(self, name: str) -> tuple:
+        """Filtre alanını (api_adı, metric_mi) çiftine çözer"""
+        if name in METRICS or get_metric_info(name):
+            return self._resolve_metric_name(name), True
+        return self._resolve_dimension_name(name), False
+
+    def _order_key(self, order_by: str, order_desc: bool, resolved_metrics: List[str]) -> Optional[tuple]:
+        """Sıralamayı ("metric" | "dimension", api_adı, azalan) anahtarına çözer"""
+        if not order_by:
+            return None
+
+        resolved_order = self._resolve_metric_name(order_by) if order_by in METRICS or get_metric_info(order_by) else self._resolve_dimension_name(order_by)
+
+        # Metric mi dimension mı kontrol et
+        if resolved_order in resolved_metrics:
+            return ("metric", resolved_order, order_desc)
+        return ("dimension", resolved_order, order_desc)
+
+    @staticmethod
+    def _build_order_bys(order_key: tuple) -> List[OrderBy]:
+        """Sıralama anahtarından order_bys listesini oluşturur"""
+        kind, name, descending = order_key
+        if kind == "metric":
+            return [OrderBy(metric=OrderBy.MetricOrderBy(metric_name=name), desc=descending)]
+        return [OrderBy(dimension=OrderBy.DimensionOrderBy(dimension_name=name), desc=descending)]
+
+    def _category_columns(self, resolved_dimensions: List[str], ranges: List[tuple]) -> List[str]:
+        """Compact modda "category" dtype'ı ile tutulacak dimension sütunlarının adları"""
+        low_cardinality = {self._resolve_dimension_name(name) for name in LOW_CARDINALITY_DIMENSIONS}
+        columns = [get_tr_name_from_api(d) for d in resolved_dimensions if d in low_cardinality]
+        if len(ranges) > 1:
+            columns.append(get_tr_name_from_api("dateRange"))
+        return columns
+
+    def _fetch_rows(self, query: Dict) -> Dict[str, np.ndarray]:
         """
-        Saatlik trafik dağılımını getirir.
+        Hazırlanmış sorguyu sayfalama ile çalıştırıp sütunları döndürür.
+        İlk sayfa toplam satır sayısını (row_count) verdikten sonra kalan sayfalar
+        sınırlı bir thread havuzunda paralel çekilir ve sırayla birleştirilir.
 
         Args:
-            date: Tarih
+            query: _prepare_query çıktısı
 
         Returns:
-            Saatlik trafik dağılımı
+            Sütun adı -> numpy dizisi sözlüğü
         """
-        return self.run_query(
-            dimensions=["hour"],
-            metrics=["totalUsers", "sessions", "screenPageViews"],
-            start_date=date,
-            end_date=date,
-            order_by="hour",
-            order_desc=False
-        )
+        page_size = self._page_size_for(query)
+        first_page = self._run_report_page(query["request"], offset=0, page_size=page_size)
+        return self._collect_pages(query, first_page, page_size)
 
-    def get_device_breakdown(
+    def _page_size_for(self, query: Dict) -> int:
+        """Sorgu için geçerli sayfa boyutunu belirler"""
+        return min(query["limit"], query.get("page_size") or self.page_size, MAX_PAGE_SIZE)
+
+    def _collect_pages(self, query: Dict, first_page, page_size: int = None, pages: List[tuple] = None) -> Dict[str, np.ndarray]:
+        """
+        İlk sayfayı çözer; gerekiyorsa kalan sayfaları paralel çekip sırayla ekler.
+
+        Args:
+            query: _prepare_query çıktısı
+            first_page: offset=0 için API yanıtı
+            page_size: Sayfa başına satır sayısı
+            pages: Kalan (offset, page_size) çiftleri (None ise page_size'dan hesaplanır)
+
+        Returns:
+            Sütun adı -> numpy dizisi sözlüğü
+        """
+        request = query["request"]
+        parts = [self._decode_columns(first_page, query)]
+        if pages is None:
+            pages = self._remaining_pages(query, first_page, page_size)
+
+        if pages:
+            workers = max(1, min(self.max_page_workers, len(pages)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                responses = context_map(
+                    pool,
+                    lambda page: self._run_report_page(request, offset=page[0], page_size=page[1]),
+                    pages
+                )
+                # map sırayı korur - sayfalar offset sırasıyla birleşir
+                for response in responses:
+                    parts.append(self._decode_columns(response, query))
+
+        return self._merge_pages(query, parts)
+
+    def _remaining_pages(self, query: Dict, first_page, page_size: int) -> List[tuple]:
+        """
+        İlk sayfadan sonra çekilmesi gereken (offset, page_size) çiftleri.
+        Sadece ilk sayfa doluysa ve toplam satır sayısı sayfa boyutunu aşıyorsa doludur.
+        """
+        total = min(first_page.row_count, query["limit"])
+        if len(first_page.rows) < page_size:
+            return []
+        return [(offset, min(page_size, total - offset)) for offset in range(page_size, total, page_size)]
+
+    @staticmethod
+    def _merge_pages(query: Dict, parts: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+        """Sayfaları sırayla birleştirip limite göre kırpar"""
+        columns = concat_columns(parts)
+        if column_length(columns) > query["limit"]:
+            columns = {name: values[:query["limit"]] for name, values in columns.items()}
+        return columns
+
+    def _run_report_page(self, request: Dict, offset: int, page_size: int):
+        """Tek bir sayfa için run_report çağrısı yapar"""
+        return self._call_api("run_report", self._page_request(request, offset, page_size))
+
+    def _call_api(self, method: str, request):
+        """
+        API çağrısını kota zamanlayıcısı ve yeniden deneme katmanından geçirerek yapar.
+
+        - Her deneme bağlamdaki öncelik sınıfına göre zamanlayıcıda sıraya girer;
+          yanıttaki property kotası zamanlayıcıya bildirilir
+        - Süre sınırı bağlamdaki deadline'dan (request_deadline) gelir
+        - UNAVAILABLE / DEADLINE_EXCEEDED / RESOURCE_EXHAUSTED üstel geri çekilme
+          ve jitter ile yeniden denenir; hedge açıksa p95'i aşan çağrıya yedek istek gider
+
+        Args:
+            method: Client metodu ("run_report", "batch_run_reports" ...)
+            request: İstek (dict veya proto)
+
+        Returns:
+            API yanıtı
+        """
+        tracker = self.latency_trackers.setdefault(method, LatencyTracker())
+
+        def attempt(timeout: float):
+            with self.scheduler.slot(self.property_id) as ticket:
+                started = time.monotonic()
+                # Yeniden deneme bu katmanda yapılır - client'ın kendi retry'ı kapalı
+                response = getattr(self.client, method)(request, retry=None, timeout=timeout)
+                tracker.record(time.monotonic() - started)
+                self._record_quota(ticket, response)
+            return response
+
+        try:
+            return call_with_retry(attempt, self.retry_policy, tracker)
+        except (QuotaExceededError, RequestTimeoutError):
+            raise
+        except Exception as e:
+            raise Exception(f"GA4 API hatası: {str(e)}")
+
+    def _record_quota(self, ticket: dict, response):
+        """Yanıttaki (batch ise her rapordaki) property kotasını zamanlayıcıya bildirir"""
+        reports = getattr(response, "reports", None)
+        for report in (reports if reports is not None else [response]):
+            self.scheduler.record(ticket, getattr(report, "property_quota", None))
+
+    @staticmethod
+    def _page_request(request: Dict, offset: int, page_size: int) -> Dict:
+        """İsteğin belirli bir sayfa için kopyasını döndürür"""
+        page_request = request.copy()
+        page_request["offset"] = offset
+        page_request["limit"] = page_size
+        return page_request
+
+    @staticmethod
+    def _metric_dtype(api_name: str):
+        """Metric tipine karşılık gelen numpy dtype'ı (bilinmiyorsa None - metin kalır)"""
+        metric_info = get_metric_info(api_name)
+        if metric_info:
+            if metric_info.get("type") in ["integer"]:
+                return np.int64
+            elif metric_info.get("type") in ["float", "percent", "currency", "duration"]:
+                return np.float64
+        return None
+
+    def _decode_columns(self, response, query: Dict) -> Dict[str, np.ndarray]:
+        """
+        API yanıtını sütun sütun tipli numpy dizilerine çevirir.
+        Sütun adları ve tip dönüşümleri _prepare_query'de bir kez çözülür;
+        satırlar proto-plus sarmalayıcısı olmadan ham protobuf üzerinden okunur.
+        """
+        rows = type(response).pb(response).rows
+        columns = {}
+
+        # Dimension değerleri
+        for i, tr_name in enumerate(query["dimension_columns"]):
+            columns[tr_name] = np.array([row.dimension_values[i].value for row in rows], dtype=object)
+
+        # Metric değerleri - tipine göre int64/float64
+        for i, (tr_name, dtype) in enumerate(query["metric_columns"]):
+            values = [row.metric_values[i].value for row in rows]
+            if dtype is np.int64:
+                try:
+                    columns[tr_name] = np.array(values, dtype=np.int64)
+                except ValueError:
+                    columns[tr_name] = np.array(values, dtype=np.float64).astype(np.int64)
+            elif dtype is not None:
+                columns[tr_name] = np.array(values, dtype=dtype)
+            else:
+                columns[tr_name] = np.array(values, dtype=object)
+
+        # Birden fazla tarih aralığında satırın ait olduğu aralık
+        if len(query["ranges"]) > 1:
+            header_names = [header.name for header in response.dimension_headers]
+            range_index = header_names.index("dateRange") if "dateRange" in header_names else len(query["dimensions"])
+            columns[get_tr_name_from_api("dateRange")] = np.array(
+                [row.dimension_values[range_index].value for row in rows], dtype=object
+            )
+
+        return columns
+
+    def _format_result(self, columns: Dict[str, np.ndarray], query: Dict, return_type: str) -> Union[pd.DataFrame, List[Dict], Dict]:
+        """
+        Sütunları istenen dönüş tipine çevirir.
+        Önbellekteki diziler paylaşıldığı için çağırana her zaman kopya döner.
+        """
+        if return_type == "dataframe":
+            compact = query.get("compact")
+            if compact if compact is not None else self.compact_dtypes:
+                return self._compact_dataframe(columns, query["category_columns"])
+            df = pd.DataFrame({name: values.copy() for name, values in columns.items()})
+            return df
+        elif return_type == "list":
+            return columns_to_rows(columns)
+        elif return_type == "arrow":
+            # Arrow tamponları değiştirilemez - önbellekteki diziler kopyasız paylaşılabilir
+            return self._to_arrow(columns, query)
+        else:  # raw
+            return {
+                "data": columns_to_rows(columns),
+                "dimensions": query["dimensions"],
+                "metrics": query["metrics"],
+                "date_range": {"start": query["start"], "end": query["end"]},
+                "date_ranges": [
+                    {"start": start, "end": end, "name": name} for start, end, name in query["ranges"]
+                ],
+                "row_count": column_length(columns)
+            }
+
+    def _compact_dataframe(self, columns: Dict[str, np.ndarray], category_columns: List[str]) -> pd.DataFrame:
+        """
+        Sütunlardan compact dtype'lı DataFrame oluşturur.
+        Kazanılan bellek (varsayılan DataFrame'e göre, bayt) df.attrs["memory_saved"]'a
+        yazılır ve client.memory_stats'a eklenir.
+        """
+        data = {}
+        bytes_before = 0
+        bytes_after = 0
+        for name, values in columns.items():
+            if name in category_columns:
+                compacted = pd.Categorical(values)
+            else:
+                compacted = self._downcast_metric(values)
+            if compacted is values:
+                compacted = values.copy()
+            else:
+                # Değişmeyen sütunlar tasarrufa katkı yapmaz - sadece dönüştürülenler ölçülür
+                bytes_before += pd.Series(values, copy=False).memory_usage(deep=True, index=False)
+                bytes_after += pd.Series(compacted, copy=False).memory_usage(deep=True, index=False)
+            data[name] = compacted
+
+        df = pd.DataFrame(data, copy=False)
+        df.attrs["memory_saved"] = int(bytes_before - bytes_after)
+
+        with self._memory_stats_lock:
+            self.memory_stats["frames"] += 1
+            self.memory_stats["bytes_before"] += int(bytes_before)
+            self.memory_stats["bytes_after"] += int(bytes_after)
+        return df
+
+    @staticmethod
+    def _downcast_metric(values: np.ndarray) -> np.ndarray:
+        """
+        Metric dizisini güvenli en küçük sayısal tipe indirir; indirilemiyorsa aynı diziyi döndürür.
+        - int64: tüm değerler INT32_SAFE_LIMIT içindeyse int32
+        - float64: float32'ye kayıpsız dönüşüyorsa float32 (oranlar genelde float64 kalır)
+        """
+        if len(values) == 0:
+            return values
+        if values.dtype == np.int64:
+            if np.abs(values).max() < INT32_SAFE_LIMIT:
+                return values.astype(np.int32)
+        elif values.dtype == np.float64:
+            narrowed = values.astype(np.float32)
+            if np.array_equal(narrowed, values, equal_nan=True):
+                return narrowed
+        return values
+
+    @property
+    def memory_saved(self) -> int:
+        """compact_dtypes ile bu client'ın döndürdüğü DataFrame'lerde kazanılan toplam bellek (bayt)"""
+        return self.memory_stats["bytes_before"] - self.memory_stats["bytes_after"]
+
+    @staticmethod
+    def _to_arrow(columns: Dict[str, np.ndarray], query: Dict):
+        """Sütunları dimension'ları sözlük kodlamalı pyarrow.Table'a çevirir"""
+        dictionary_columns = list(query["dimension_columns"])
+        if len(query["ranges"]) > 1:
+            dictionary_columns.append(get_tr_name_from_api("dateRange"))
+        return columns_to_arrow(columns, dictionary_columns, metadata={
+            "dimensions": query["dimensions"],
+            "metrics": query["metrics"],
+            "date_ranges": [
+                {"start": start, "end": end, "name": name} for start, end, name in query["ranges"]
+            ]
+        })
+
+    def _get_report_store(self):
+        """Disk deposunu döndürür (atanmamışsa süreç genelindeki varsayılan)"""
+        if self.report_store is not None:
+            return self.report_store
+        return get_default_report_store()
+
+    def clear_cache(self, include_disk: bool = False):
+        """
+        Yanıt önbelleğini temizler.
+
+        Args:
+            include_disk: Bu markanın disk deposundaki kayıtlarını da sil
+        """
+        self.response_cache.clear()
+        self.partition_cache.clear()
+
+        if include_disk:
+            store = self._get_report_store()
+            if store is not None:
+                store.clear(self.brand_key, self.property_id)
+
+    def quick_query(
         self,
+        query_name: str,
         start_date: Union[str, datetime, int] = "7daysAgo",
-        end_date: Union[str, datetime, int] = "yesterday"
+        end_date: Union[str, datetime, int] = "yesterday",
+        limit: int = 100
     ) -> pd.DataFrame:
         """
-        Cihaz dağılımını getirir.
+        Önceden tanımlanmış hızlı sorguları çalıştırır.
 
         Args:
+            query_name: Sorgu adı (QUICK_QUERIES'den)
+                - "genel_bakis"
+                - "trafik_kaynaklari"
+                - "en_cok_okunanlar"
+                - "cihaz_dagilimi"
+                - "sehir_dagilimi"
+                - "kategori_performansi"
+                - "editor_performansi"
+                - "saatlik_trafik"
+                - "gunluk_trafik"
+                - "haber_tipi"
             start_date: Başlangıç tarihi
             end_date: Bitiş tarihi
+            limit: Maksimum satır sayısı
 
         Returns:
-            Cihaz kategorisi bazlı dağılım
+            Sorgu sonuçları DataFrame olarak
         """
+        if query_name not in QUICK_QUERIES:
+            available = ", ".join(QUICK_QUERIES.keys())
+            raise ValueError(f"Geçersiz sorgu adı: {query_name}. Mevcut sorgular: {available}")
+
+        query = QUICK_QUERIES[query_name]
+
         return self.run_query(
-            dimensions=["deviceCategory"],
-            metrics=["totalUsers", "sessions", "screenPageViews"],
+            dimensions=query["dimensions"],
+            metrics=query["metrics"],
             start_date=start_date,
             end_date=end_date,
-            order_by="totalUsers",
+            limit=limit,
+            order_by=query["metrics"][0],
             order_desc=True
         )
 
-    def get_city_breakdown(
+    def get_top_pages(
         self,
-        start_date: Union[str, datetime, int] = "7daysAgo",
+        start_date: Union[str, datetime, int] = "yesterday",
         end_date: Union[str, datetime, int] = "yesterday",
-        country: str = "Turkey",
-        limit: int = 20
+        limit: int = 10,
+        category: str = None
     ) -> pd.DataFrame:
         """
-        Şehir dağılımını getirir.
+        En çok görüntülenen sayfaları getirir.
+        GA4 panelindeki gibi sadece pagePath bazında.
 
         Args:
             start_date: Başlangıç tarihi
             end_date: Bitiş tarihi
-            country: Ülke filtresi
-            limit: Maksimum şehir sayısı
+            limit: Kaç sayfa getirileceği
+            category: Kategori filtresi (opsiyonel)
 
         Returns:
-            Şehir bazlı dağılım
+            En çok görüntülenen sayfalar
         """
-        filters = {"country": country} if country else None
+        filters = {}
+        if category:
+            # Jenerik cat1 kullan - marka bazli cozulecek
+            filters["cat1"] = category
 
+        # GA4 panelindeki gibi: pagePath, screenPageViews, totalUsers, sessions
         return self.run_query(
-            dimensions=["city"],
-            metrics=["totalUsers", "sessions", "screenPageViews"],
+            dimensions=["pagePath"],
+            metrics=["screenPageViews", "totalUsers", "sessions"],
             start_date=start_date,
             end_date=end_date,
-            filters=filters,
-            order_by="totalUsers",
+            filters=filters if filters else None,
+            order_by="screenPageViews",
             order_desc=True,
             limit=limit
         )
 
-    def get_daily_trend(
+    def get_traffic_sources(
         self,
-        start_date: Union[str, datetime, int] = "30daysAgo",
+        start_date: Union[str, datetime, int] = "7daysAgo",
         end_date: Union[str, datetime, int] = "yesterday"
     ) -> pd.DataFrame:
         """
-        Günlük trafik trendini getirir.
+        Trafik kaynaklarını getirir.
 
         Args:
             start_date: Başlangıç tarihi
             end_date: Bitiş tarihi
 
         Returns:
-            Günlük trafik trendi
+            Trafik kaynakları dağılımı
         """
-        df = self.run_query(
-            dimensions=["date"],
-            metrics=["totalUsers", "sessions", "screenPageViews", "newUsers"],
+        return self.run_query(
+            dimensions=["sessionDefaultChannelGroup"],
+            metrics=["totalUsers", "sessions", "screenPageViews", "bounceRate", "averageSessionDuration"],
             start_date=start_date,
             end_date=end_date,
-            order_by="date",
-            order_desc=False
+            order_by="totalUsers",
+            order_desc=True
         )
 
-        # Tarih formatını düzenle
-        if "Tarih" in df.columns:
-            df["Tarih"] = pd.to_datetime(df["Tarih"], format="%Y%m%d").dt.strftime("%Y-%m-%d")
-
-        return df
-
-    def compare_periods(
+    def get_category_performance(
         self,
-        metrics: List[str] = None,
-        current_start: Union[str, datetime, int] = "7daysAgo",
-        current_end: Union[str, datetime, int] = "yesterday",
-        previous_start: Union[str, datetime, int] = "14daysAgo",
-        previous_end: Union[str, datetime, int] = "8daysAgo"
-    ) -> Dict:
+        start_date: Union[str, datetime, int] = "7daysAgo",
+        end_date: Union[str, datetime, int] = "yesterday",
+        limit: int = 20
+    ) -> pd.DataFrame:
         """
-        İki dönemi karşılaştırır.
+        Kategori performansını getirir.
 
         Args:
-            metrics: Karşılaştırılacak metrikler
-            current_start: Mevcut dönem başlangıç
-            current_end: Mevcut dönem bitiş
+            start_date: Başlangıç tarihi
+            end_date: Bitiş tarihi
+            limit: Maksimum kategori sayısı
+
+        Returns:
+            Kategori bazlı performans
+        """
+        # Jenerik "cat1" kullan - marka bazli cozulecek
+        df = self.run_query(
+            dimensions=["cat1"],
+            metrics=["screenPageViews", "totalUsers", "sessions", "averageSessionDuration"],
+            start_date=start_date,
+            end_date=end_date,
+            order_by="screenPageViews",
+            order_desc=True,
+            limit=limit
+        )
+        return self._postprocess_category_performance(df)
+
+    @staticmethod
+    def _postprocess_category_performance(df: pd.DataFrame) -> pd.DataFrame:
+        """Oturum süresini saniyeden dakikaya çevirir"""
+        # Oturum suresi saniye cinsinden, dakikaya cevir ve birim ekle
+        if "Ortalama Oturum Suresi" in df.columns:
+            df["Ort. Oturum (dk)"] = (df["Ortalama Oturum Suresi"] / 60).round(2)
+            df = df.drop(columns=["Ortalama Oturum Suresi"])
+
+        return df
+
+    def get_editor_performance(
+        self,
+        start_date: Union[str, datetime, int] = "7daysAgo",
+        end_date: Union[str, datetime, int] = "yesterday",
+        limit: int = 20
+    ) -> pd.DataFrame:
+        """
+        Editör performansını getirir.
+
+        Args:
+            start_date: Başlangıç tarihi
+            end_date: Bitiş tarihi
+            limit: Maksimum editör sayısı
+
+        Returns:
+            Editör bazlı performans
+        """
+        # Jenerik "editor" kullan - marka bazli cozulecek
+        return self.run_query(
+            dimensions=["editor"],
+            metrics=["screenPageViews", "totalUsers", "sessions"],
+            start_date=start_date,
+            end_date=end_date,
+            order_by="screenPageViews",
+            order_desc=True,
+            limit=limit
+        )
+
+    def get_hourly_traffic(
+        self,
+        date: Union[str, datetime, int] = "yesterday"
+    ) -> pd.DataFrame:
+        """
+        Saatlik trafik dağılımını getirir.
+
+        Args:
+            date: Tarih
+
+        Returns:
+            Saatlik trafik dağılımı
+        """
+        return self.run_query(
+            dimensions=["hour"],
+            metrics=["totalUsers", "sessions", "screenPageViews"],
+            start_date=date,
+            end_date=date,
+            order_by="hour",
+            order_desc=False
+        )
+
+    def get_device_breakdown(
+        self,
+        start_date: Union[str, datetime, int] = "7daysAgo",
+        end_date: Union[str, datetime, int] = "yesterday"
+    ) -> pd.DataFrame:
+        """
+        Cihaz dağılımını getirir.
+
+        Args:
+            start_date: Başlangıç tarihi
+            end_date: Bitiş tarihi
+
+        Returns:
+            Cihaz kategorisi bazlı dağılım
+        """
+        return self.run_query(
+            dimensions=["deviceCategory"],
+            metrics=["totalUsers", "sessions", "screenPageViews"],
+            start_date=start_date,
+            end_date=end_date,
+            order_by="totalUsers",
+            order_desc=True
+        )
+
+    def get_city_breakdown(
+        self,
+        start_date: Union[str, datetime, int] = "7daysAgo",
+        end_date: Union[str, datetime, int] = "yesterday",
+        country: str = "Turkey",
+        limit: int = 20
+    ) -> pd.DataFrame:
+        """
+        Şehir dağılımını getirir.
+
+        Args:
+            start_date: Başlangıç tarihi
+            end_date: Bitiş tarihi
+            country: Ülke filtresi
+            limit: Maksimum şehir sayısı
+
+        Returns:
+            Şehir bazlı dağılım
+        """
+        filters = {"country": country} if country else None
+
+        return self.run_query(
+            dimensions=["city"],
+            metrics=["totalUsers", "sessions", "screenPageViews"],
+            start_date=start_date,
+            end_date=end_date,
+            filters=filters,
+            order_by="totalUsers",
+            order_desc=True,
+            limit=limit
+        )
+
+    def get_daily_trend(
+        self,
+        start_date: Union[str, datetime, int] = "30daysAgo",
+        end_date: Union[str, datetime, int] = "yesterday"
+    ) -> pd.DataFrame:
+        """
+        Günlük trafik trendini getirir.
+
+        Args:
+            start_date: Başlangıç tarihi
+            end_date: Bitiş tarihi
+
+        Returns:
+            Günlük trafik trendi
+        """
+        df = self.run_query(
+            dimensions=["date"],
+            metrics=["totalUsers", "sessions", "screenPageViews", "newUsers"],
+            start_date=start_date,
+            end_date=end_date,
+            order_by="date",
+            order_desc=False
+        )
+        return self._postprocess_daily_trend(df)
+
+    @staticmethod
+    def _postprocess_daily_trend(df: pd.DataFrame) -> pd.DataFrame:
+        """YYYYMMDD tarihlerini YYYY-MM-DD formatına çevirir"""
+        # Tarih formatını düzenle
+        if "Tarih" in df.columns:
+            df["Tarih"] = pd.to_datetime(df["Tarih"], format="%Y%m%d").dt.strftime("%Y-%m-%d")
+
+        return df
+
+    def compare_periods(
+        self,
+        metrics: List[str] = None,
+        current_start: Union[str, datetime, int] = "7daysAgo",
+        current_end: Union[str, datetime, int] = "yesterday",
+        previous_start: Union[str, datetime, int] = "14daysAgo",
+        previous_end: Union[str, datetime, int] = "8daysAgo"
+    ) -> Dict:
+        """
+        İki dönemi tek istekte (iki tarih aralığıyla) karşılaştırır.
+
+        Args:
+            metrics: Karşılaştırılacak metrikler
+            current_start: Mevcut dönem başlangıç
+            current_end: Mevcut dönem bitiş
             previous_start: Önceki dönem başlangıç
             previous_end: Önceki dönem bitiş
 
@@ -885,70 +2082,983 @@ class GA4Client:
         """
         metrics = metrics or ["totalUsers", "sessions", "screenPageViews"]
 
-        # Mevcut dönem
-        current = self.run_query(
+        # Mevcut ve önceki dönem - iki tarih aralığıyla tek istekte
+        rows = self.run_query(
             dimensions=[],
             metrics=metrics,
-            start_date=current_start,
-            end_date=current_end,
+            date_ranges=[
+                (current_start, current_end, "current"),
+                (previous_start, previous_end, "previous"),
+            ],
             return_type="list"
         )
 
-        # Önceki dönem
-        previous = self.run_query(
-            dimensions=[],
-            metrics=metrics,
-            start_date=previous_start,
-            end_date=previous_end,
-            return_type="list"
-        )
+        return self._build_comparison(rows, metrics)
+
+    def _build_comparison(self, rows: List[Dict], metrics: List[str]) -> Dict:
+        """compare_periods satırlarından metrik bazlı karşılaştırma sözlüğü üretir"""
+        range_col = get_tr_name_from_api("dateRange")
+        by_range = {row.get(range_col): row for row in rows}
+        current_data = by_range.get("current")
+        previous_data = by_range.get("previous")
 
         # Karşılaştırma hesapla
         comparison = {}
-        if current and previous:
-            current_data = current[0]
-            previous_data = previous[0]
-
+        if current_data and previous_data:
             for metric in metrics:
-                tr_name = get_tr_name_from_api(metric)
+                tr_name = get_tr_name_from_api(self._resolve_metric_name(metric))
                 curr_val = current_data.get(tr_name, 0)
                 prev_val = previous_data.get(tr_name, 0)
 
-                if prev_val > 0:
-                    change_pct = ((curr_val - prev_val) / prev_val) * 100
-                else:
-                    change_pct = 100 if curr_val > 0 else 0
-
                 comparison[tr_name] = {
                     "current": curr_val,
                     "previous": prev_val,
                     "change": curr_val - prev_val,
-                    "change_percent": round(change_pct, 2)
+                    "change_percent": self._change_percent(curr_val, prev_val)
                 }
 
         return comparison
 
+    @staticmethod
+    def _change_percent(current, previous) -> float:
+        """Önceki değere göre yüzde değişim"""
+        if previous > 0:
+            change_pct = ((current - previous) / previous) * 100
+        else:
+            change_pct = 100 if current > 0 else 0
+        return round(change_pct, 2)
+
+    def compare_ranked(
+        self,
+        dimensions: List[str],
+        metrics: List[str] = None,
+        current_start: Union[str, datetime, int] = "7daysAgo",
+        current_end: Union[str, datetime, int] = "yesterday",
+        previous_start: Union[str, datetime, int] = None,
+        previous_end: Union[str, datetime, int] = None,
+        order_by: str = None,
+        limit: int = 10,
+        filters: Dict = None
+    ) -> pd.DataFrame:
+        """
+        Sıralı bir tabloyu (en çok okunanlar, editörler ...) önceki döneme göre
+        değişimleriyle birlikte tek istekte getirir.
+
+        Args:
+            dimensions: Gruplanacak dimension'lar
+            metrics: Metrikler (ilk metrik varsayılan sıralama metriği)
+            current_start: Mevcut dönem başlangıç
+            current_end: Mevcut dönem bitiş
+            previous_start: Önceki dönem başlangıç (None ise eşit uzunlukta bir önceki dönem)
+            previous_end: Önceki dönem bitiş
+            order_by: Sıralama metriği
+            limit: Mevcut dönemdeki ilk kaç satır
+            filters: Filtre sözlüğü
+
+        Returns:
+            Dimension sütunları, her metrik için "<metrik>", "<metrik> (Önceki)" ve
+            "<metrik> Değişim %" sütunları; mevcut döneme göre sıralı
+        """
+        metrics = metrics or ["screenPageViews", "totalUsers", "sessions"]
+        order_by = order_by or metrics[0]
+
+        df = self.run_query(**self._ranked_comparison_query(
+            dimensions, metrics, current_start, current_end,
+            previous_start, previous_end, order_by, limit, filters
+        ))
+        return self._build_ranked_comparison(df, dimensions, metrics, order_by, limit)
+
+    def _ranked_comparison_query(
+        self,
+        dimensions: List[str],
+        metrics: List[str],
+        current_start,
+        current_end,
+        previous_start,
+        previous_end,
+        order_by: str,
+        limit: int,
+        filters: Dict
+    ) -> Dict:
+        """compare_ranked için run_query parametrelerini hazırlar"""
+        current_start = self._parse_date(current_start)
+        current_end = self._parse_date(current_end)
+        if previous_start is None or previous_end is None:
+            previous_start, previous_end = self.previous_period(current_start, current_end)
+
+        # Her iki dönemin satırları aynı yanıtta gelir; önceki dönemde sıralaması
+        # düşük olan satırlar da eşleşsin diye limit geniş tutulur
+        return {
+            "dimensions": dimensions,
+            "metrics": metrics,
+            "date_ranges": [
+                (current_start, current_end, "current"),
+                (previous_start, previous_end, "previous"),
+            ],
+            "filters": filters,
+            "order_by": order_by,
+            "order_desc": True,
+            "limit": max(limit * 20, 1000)
+        }
+
+    def _build_ranked_comparison(
+        self,
+        df: pd.DataFrame,
+        dimensions: List[str],
+        metrics: List[str],
+        order_by: str,
+        limit: int
+    ) -> pd.DataFrame:
+        """İki aralıklı sonucu mevcut/önceki/değişim sütunlarına açar"""
+        dim_cols = [get_tr_name_from_api(self._resolve_dimension_name(d)) for d in dimensions]
+        met_cols = [get_tr_name_from_api(self._resolve_metric_name(m)) for m in metrics]
+        range_col = get_tr_name_from_api("dateRange")
+
+        if df.empty:
+            return pd.DataFrame(columns=dim_cols + met_cols)
+
+        current = df[df[range_col] == "current"].drop(columns=[range_col])
+        previous = df[df[range_col] == "previous"].drop(columns=[range_col])
+
+        sort_col = get_tr_name_from_api(self._resolve_metric_name(order_by))
+        current = current.sort_values(sort_col, ascending=False).head(limit)
+
+        merged = current.merge(previous, on=dim_cols, how="left", suffixes=("", " (Önceki)"))
+
+        result = merged[dim_cols].copy()
+        for col in met_cols:
+            prev_col = f"{col} (Önceki)"
+            merged[prev_col] = merged[prev_col].fillna(0)
+            result[col] = merged[col]
+            result[prev_col] = merged[prev_col]
+            result[f"{col} Değişim %"] = [
+                self._change_percent(curr, prev) for curr, prev in zip(merged[col], merged[prev_col])
+            ]
+
+        return result.reset_index(drop=True)
+
+    # =========================================================================
+    # PİVOT RAPOR
+    # =========================================================================
+
+    def run_pivot(
+        self,
+        rows: List[str],
+        columns: List[str],
+        metrics: List[str] = None,
+        start_date: Union[str, datetime, int] = "7daysAgo",
+        end_date: Union[str, datetime, int] = "yesterday",
+        filters: Dict = None,
+        row_limit: int = 20,
+        column_limit: int = 10,
+        row_order_by: str = None,
+        column_order_by: str = None,
+        order_desc: bool = True,
+        return_type: str = "dataframe",
+        use_cache: bool = True
+    ) -> Union[pd.DataFrame, List[Dict], Dict]:
+        """
+        Çapraz tablo (ör. editör x kategori, kanal x cihaz) için run_pivot_report çağırır.
+        Satır ve sütun pivotlarının ilk N değeri GA4 tarafında seçilir; sonuç geniş
+        (wide) tablo olarak döner: satır dimension'ları + her sütun değeri için bir sütun.
+
+        Args:
+            rows: Satır dimension'ları (Türkçe veya API adı) - Örnek: ["editor"]
+            columns: Sütun dimension'ları - Örnek: ["cat1"]
+            metrics: Metric listesi (varsayılan screenPageViews)
+                Birden fazla metric'te sütun adları "<değer> - <metric>" olur
+            start_date: Başlangıç tarihi
+            end_date: Bitiş tarihi
+            filters: Filtre sözlüğü (run_query ile aynı)
+            row_limit: Satır pivotundaki maksimum değer sayısı
+            column_limit: Sütun pivotundaki maksimum değer sayısı
+            row_order_by: Satırların sıralanacağı metric/dimension (None ise ilk metric)
+            column_order_by: Sütunların sıralanacağı metric/dimension (None ise ilk metric)
+            order_desc: Azalan sıralama (True) veya artan (False)
+            return_type: Dönüş tipi - "dataframe", "list", "raw", "arrow"
+            use_cache: Yanıt önbelleğini kullan
+
+        Returns:
+            Geniş tablo (belirtilen formatta); olmayan kombinasyonlar 0
+        """
+        query = self._prepare_pivot_query(
+            rows, columns, metrics, start_date, end_date, filters,
+            row_limit, column_limit, row_order_by, column_order_by, order_desc
+        )
+
+        wide = self._lookup_cached(query, use_cache)
+        if wide is None:
+            wide = self.in_flight.do(
+                query["cache_key"], lambda: self._fetch_pivot_and_store(query, use_cache)
+            )
+
+        return self._format_result(wide, query, return_type)
+
+    def _prepare_pivot_query(
+        self,
+        rows: List[str],
+        columns: List[str],
+        metrics: List[str],
+        start_date: Union[str, datetime, int],
+        end_date: Union[str, datetime, int],
+        filters: Dict,
+        row_limit: int,
+        column_limit: int,
+        row_order_by: str,
+        column_order_by: str,
+        order_desc: bool
+    ) -> Dict:
+        """
+        Pivot isteğini hazırlar. Tarih, filtre ve isim çözümleme _prepare_query'den gelir;
+        sonuç sütunları satır dimension'ları ve pivot hücreleridir.
+        """
+        metrics = metrics or ["screenPageViews"]
+        query = self._prepare_query(
+            dimensions=list(rows) + list(columns),
+            metrics=metrics,
+            start_date=start_date,
+            end_date=end_date,
+            filters=filters,
+            limit=row_limit
+        )
+
+        row_dimensions = query["dimensions"][:len(rows)]
+        column_dimensions = query["dimensions"][len(rows):]
+        row_order = self._order_key(row_order_by or metrics[0], order_desc, query["metrics"])
+        column_order = self._order_key(column_order_by or metrics[0], order_desc, query["metrics"])
+
+        request = query["request"]
+        del request["limit"]
+        request["pivots"] = [
+            Pivot(field_names=row_dimensions, limit=row_limit, order_bys=self._build_order_bys(row_order)),
+            Pivot(field_names=column_dimensions, limit=column_limit, order_bys=self._build_order_bys(column_order))
+        ]
+
+        query.update({
+            "row_dimensions": row_dimensions,
+            "column_dimensions": column_dimensions,
+            "dimension_columns": query["dimension_columns"][:len(rows)],
+            "category_columns": self._category_columns(row_dimensions, query["ranges"]),
+            "cache_key": ("pivot",) + query["cache_key"] + (
+                len(rows), column_limit, row_order, column_order
+            )
+        })
+        return query
+
+    def _fetch_pivot_and_store(self, query: Dict, use_cache: bool) -> Dict[str, np.ndarray]:
+        """Pivot raporunu çeker, geniş tabloya çevirir ve önbelleğe yazar"""
+        response = self._call_api("run_pivot_report", query["request"])
+        wide = self._decode_pivot(response, query)
+        self._store_cached(query, wide, use_cache)
+        return wide
+
+    def _decode_pivot(self, response, query: Dict) -> Dict[str, np.ndarray]:
+        """
+        Pivot yanıtını geniş sütunlara çevirir.
+        Satır ve sütun sırası GA4'ün pivot başlıklarındaki (sıralanmış, limitlenmiş) sıradır.
+        """
+        pivot_headers = type(response).pb(response).pivot_headers
+        row_keys = [tuple(value.value for value in header.dimension_values)
+                    for header in pivot_headers[0].pivot_dimension_headers]
+        column_keys = [tuple(value.value for value in header.dimension_values)
+                       for header in pivot_headers[1].pivot_dimension_headers]
+        row_index = {key: i for i, key in enumerate(row_keys)}
+
+        header_names = [header.name for header in response.dimension_headers]
+        row_positions = [header_names.index(d) for d in query["row_dimensions"]]
+        column_positions = [header_names.index(d) for d in query["column_dimensions"]]
+
+        wide = {}
+        for i, tr_name in enumerate(query["dimension_columns"]):
+            wide[tr_name] = np.array([key[i] for key in row_keys], dtype=object)
+
+        # Her (sütun değeri, metric) çifti için bir hücre sütunu - olmayan kombinasyonlar 0
+        multiple_metrics = len(query["metric_columns"]) > 1
+        cells = {}
+        for column_key in column_keys:
+            label = " / ".join(column_key)
+            for j, (metric_name, dtype) in enumerate(query["metric_columns"]):
+                name = f"{label} - {metric_name}" if multiple_metrics else label
+                cells[(column_key, j)] = np.zeros(len(row_keys), dtype=dtype or np.float64)
+                wide[name] = cells[(column_key, j)]
+
+        for row in type(response).pb(response).rows:
+            values = row.dimension_values
+            i = row_index.get(tuple(values[p].value for p in row_positions))
+            column_key = tuple(values[p].value for p in column_positions)
+            if i is None or (column_key, 0) not in cells:
+                continue
+            for j, metric_value in enumerate(row.metric_values):
+                cells[(column_key, j)][i] = float(metric_value.value)
+
+        return wide
+
+    # =========================================================================
+    # GERÇEK ZAMANLI RAPOR
+    # =========================================================================
+
+    def run_realtime_report(
+        self,
+        dimensions: List[str] = None,
+        metrics: List[str] = None,
+        minutes_ago: int = REALTIME_MAX_MINUTES,
+        filters: Dict = None,
+        order_by: str = None,
+        order_desc: bool = True,
+        limit: int = 100,
+        return_type: str = "dataframe",
+        use_cache: bool = True
+    ) -> Union[pd.DataFrame, List[Dict], Dict]:
+        """
+        GA4 Realtime API'den son dakikaların verisini çeker.
+        Sonuç TTL_REALTIME saniye boyunca süreç genelinde paylaşılır; aynı anda gelen
+        özdeş istekler tek çağrıyı bekler.
+
+        Args:
+            dimensions: Dimension listesi (None veya [] ise toplam satırı)
+                Gerçek zamanlı dimension'lar: unifiedScreenName, minutesAgo, deviceCategory,
+                country, city, platform, eventName ... (customEvent:* desteklenmez)
+            metrics: Metric listesi (varsayılan activeUsers)
+                Gerçek zamanlı metric'ler: activeUsers, screenPageViews, eventCount, keyEvents
+            minutes_ago: Kaç dakika geriye bakılacağı (en fazla REALTIME_MAX_MINUTES)
+            filters: Filtre sözlüğü (run_query ile aynı)
+            order_by: Sıralama yapılacak metric/dimension
+            order_desc: Azalan sıralama (True) veya artan (False)
+            limit: Maksimum satır sayısı
+            return_type: Dönüş tipi - "dataframe", "list", "raw", "arrow"
+            use_cache: Kısa süreli gerçek zamanlı önbelleği kullan
+
+        Returns:
+            Sorgu sonuçları (belirtilen formatta)
+        """
+        query = self._prepare_realtime_query(dimensions, metrics, minutes_ago, filters, order_by, order_desc, limit)
+
+        columns = self.realtime_cache.get(query["cache_key"]) if use_cache else None
+        if columns is None:
+            columns = self.in_flight.do(
+                query["cache_key"], lambda: self._fetch_realtime(query, use_cache)
+            )
+
+        return self._format_result(columns, query, return_type)
+
+    def _prepare_realtime_query(
+        self,
+        dimensions: List[str],
+        metrics: List[str],
+        minutes_ago: int,
+        filters: Dict,
+        order_by: str,
+        order_desc: bool,
+        limit: int
+    ) -> Dict:
+        """Gerçek zamanlı isteği _prepare_query çıktısıyla aynı biçimde hazırlar"""
+        resolved_dimensions = [self._resolve_dimension_name(d) for d in (dimensions or [])]
+        resolved_metrics = [self._resolve_metric_name(m) for m in (metrics or ["activeUsers"])]
+        minutes_ago = max(1, min(int(minutes_ago), REALTIME_MAX_MINUTES))
+
+        request = {
+            "property": f"properties/{self.property_id}",
+            "dimensions": [Dimension(name=d) for d in resolved_dimensions],
+            "metrics": [Metric(name=m) for m in resolved_metrics],
+            "minute_ranges": [MinuteRange(start_minutes_ago=minutes_ago - 1, end_minutes_ago=0)],
+            "limit": limit,
+            "return_property_quota": True
+        }
+
+        filter_key = self._apply_filters(request, filters)
+
+        order_key = self._order_key(order_by, order_desc, resolved_metrics)
+        if order_key:
+            request["order_bys"] = self._build_order_bys(order_key)
+
+        ranges = [(f"{minutes_ago - 1}minutesAgo", "0minutesAgo", None)]
+        return {
+            "request": request,
+            "dimensions": resolved_dimensions,
+            "metrics": resolved_metrics,
+            "start": ranges[0][0],
+            "end": ranges[0][1],
+            "ranges": ranges,
+            "dimension_columns": [get_tr_name_from_api(d) for d in resolved_dimensions],
+            "category_columns": self._category_columns(resolved_dimensions, ranges),
+            "metric_columns": [(get_tr_name_from_api(m), self._metric_dtype(m)) for m in resolved_metrics],
+            "limit": limit,
+            "cache_key": ("realtime", self.property_id, tuple(resolved_dimensions), tuple(resolved_metrics),
+                          minutes_ago, filter_key, order_key, limit),
+            "filter_key": filter_key,
+            "order_key": order_key
+        }
+
+    def _fetch_realtime(self, query: Dict, use_cache: bool) -> Dict[str, np.ndarray]:
+        """Gerçek zamanlı raporu çeker ve kısa süreli önbelleğe yazar"""
+        response = self._call_api("run_realtime_report", query["request"])
+        columns = self._decode_columns(response, query)
+        if use_cache:
+            self.realtime_cache.set(query["cache_key"], columns, ttl=TTL_REALTIME)
+        return columns
+
     def get_realtime_summary(self) -> Dict:
         """
-        Not: GA4 Data API'de gerçek zamanlı veri için ayrı bir endpoint var.
-        Bu metot şimdilik bugünün verisini döndürür.
+        Son 30 dakikanın özeti (GA4 Realtime API).
 
         Returns:
-            Bugünün özet verileri
+            {"Aktif Kullanıcı": ..., "Sayfa Görüntüleme": ..., "Etkinlik Sayısı": ...}
         """
-        today_data = self.run_query(
+        rows = self.run_realtime_report(
             dimensions=[],
-            metrics=["activeUsers", "sessions", "screenPageViews"],
-            start_date="today",
-            end_date="today",
+            metrics=["activeUsers", "screenPageViews", "eventCount"],
             return_type="list"
         )
 
-        if today_data:
-            return today_data[0]
+        if rows:
+            return rows[0]
         return {}
 
 
+class AsyncGA4Client(GA4Client):
+    """
+    GA4Client'ın asyncio sürümü - BetaAnalyticsDataAsyncClient üzerinde çalışır.
+
+    İsim çözümleme, sorgu hazırlama, sütun bazlı çözme ve önbellekler GA4Client ile
+    ortaktır; sadece API çağrıları coroutine'dir. Sorgu metotları (run_query,
+    run_batch, compare_periods, compare_ranked ve get_* yardımcıları) await edilir:
+
+        client = AsyncGA4Client(brand="hurriyet")
+        top, sources = await asyncio.gather(
+            client.get_top_pages(limit=10),
+            client.get_traffic_sources()
+        )
+    """
+
+    # Aynı event loop'taki eşzamanlı özdeş istekleri birleştiren katman
+    async_in_flight = AsyncSingleFlight()
+
+    def _init_client(self):
+        """
+        Credentials'ı yükler. gRPC asyncio kanalı çalışan event loop'a bağlı
+        olduğu için async client ilk çağrıda (_get_client) loop başına alınır.
+        """
+        try:
+            self.credentials = get_credentials(self.credentials_path)
+            self.client = None
+            print(f"[OK] GA4 Async Client basariyla baslatildi - {self.brand_name} (Property: {self.property_id})")
+        except Exception as e:
+            raise Exception(f"GA4 Client başlatma hatası: {str(e)}")
+
+    def _get_client(self):
+        """Çalışan event loop için süreç genelinde paylaşılan async API client'ı döndürür"""
+        self.client = get_async_transport_client(self.credentials_path, asyncio.get_running_loop())
+        return self.client
+
+    async def get_schema(self, force_refresh: bool = False) -> Optional[PropertySchema]:
+        """GA4Client.get_schema ile aynı; disk okuması thread'de, getMetadata çağrısı await edilir"""
+        if not force_refresh:
+            schema = self._memory_schema() or await asyncio.to_thread(self._cached_schema)
+            if schema is not None or not self._schema_fetch_due():
+                return schema
+
+        async def fetch():
+            response = await self._call_api("get_metadata", {"name": f"properties/{self.property_id}/metadata"})
+            schema = PropertySchema.from_response(self.property_id, response)
+            self._store_schema(schema)
+            return schema
+
+        try:
+            return await self.async_in_flight.do(("metadata", self.property_id), fetch)
+        except Exception as e:
+            self.schema_failures[self.property_id] = time.monotonic()
+            print(f"[UYARI] Property semasi alinamadi ({self.property_id}): {str(e)}")
+            return None
+
+    async def _load_schema(self):
+        """Şema bellekte yoksa diskteki şemayı event loop'u bloklamadan belleğe yükler"""
+        if self.validate_schema and self._memory_schema() is None:
+            await asyncio.to_thread(self._cached_schema)
+
+    def _schema_for_query(self) -> Optional[PropertySchema]:
+        """
+        Sorgu hazırlama senkron olduğu için sadece bellekteki şema kullanılır (diskteki
+        şema önceden _load_schema ile yüklenir); şema yoksa doğrulama atlanır
+        (await client.get_schema() ile önceden yüklenebilir)
+        """
+        if not self.validate_schema:
+            return None
+        schema = self._memory_schema()
+        if schema is not None and schema is not self._applied_schema:
+            self._apply_schema(schema)
+        return schema
+
+    async def run_query(
+        self,
+        dimensions: List[str] = None,
+        metrics: List[str] = None,
+        start_date: Union[str, datetime, int] = "7daysAgo",
+        end_date: Union[str, datetime, int] = "yesterday",
+        filters: Dict = None,
+        order_by: str = None,
+        order_desc: bool = True,
+        limit: int = 10000,
+        return_type: str = "dataframe",
+        use_cache: bool = True,
+        page_size: int = None,
+        date_ranges: List = None,
+        compact: bool = None
+    ) -> Union[pd.DataFrame, List[Dict], Dict]:
+        """GA4Client.run_query ile aynı; sayfalar eşzamanlı await edilir ("iter" async iterator döner)"""
+        if return_type == "iter":
+            return self.stream_query(
+                dimensions=dimensions,
+                metrics=metrics,
+                start_date=start_date,
+                end_date=end_date,
+                filters=filters,
+                order_by=order_by,
+                order_desc=order_desc,
+                limit=limit,
+                use_cache=use_cache,
+                page_size=page_size,
+                date_ranges=date_ranges
+            )
+
+        await self._load_schema()
+        query = self._prepare_query(
+            dimensions=dimensions,
+            metrics=metrics,
+            start_date=start_date,
+            end_date=end_date,
+            filters=filters,
+            order_by=order_by,
+            order_desc=order_desc,
+            limit=limit,
+            date_ranges=date_ranges
+        )
+        query["page_size"] = page_size
+        query["compact"] = compact
+
+        collector = _query_collector.get()
+        if collector is not None:
+            return self._collect_query(collector, query, return_type, use_cache, dict(
+                dimensions=dimensions, metrics=metrics, start_date=start_date, end_date=end_date,
+                filters=filters, order_by=order_by, order_desc=order_desc, limit=limit,
+                page_size=page_size, date_ranges=date_ranges, compact=compact
+            ))
+
+        columns = await self._lookup_cached(query, use_cache)
+
+        if columns is None:
+            # Aynı loop'ta aynı anda gelen özdeş sorgular tek çağrıyı bekler
+            columns = await self.async_in_flight.do(
+                query["cache_key"], lambda: self._fetch_and_store(query, use_cache)
+            )
+
+        return self._format_result(columns, query, return_type)
+
+    async def _fetch_and_store(self, query: Dict, use_cache: bool) -> Dict[str, np.ndarray]:
+        """Sorguyu (uygunsa günlük parçalardan) API'den çeker ve önbelleğe yazar"""
+        columns = None
+        if use_cache and self._partition_eligible(query):
+            columns = await self._fetch_partitioned(query)
+        if columns is None:
+            columns = await self._fetch_rows(query)
+        await self._store_cached(query, columns, use_cache)
+        return columns
+
+    async def _lookup_cached(self, query: Dict, use_cache: bool) -> Optional[Dict[str, np.ndarray]]:
+        """GA4Client._lookup_cached ile aynı; disk deposu okuması thread'de yapılır (loop bloklanmaz)"""
+        if not use_cache:
+            return None
+
+        columns = query.get("memory_cache", self.response_cache).get(query["cache_key"])
+        if columns is not None or not query["closed"]:
+            return columns
+        return await asyncio.to_thread(self._lookup_stored, query)
+
+    async def _store_cached(self, query: Dict, columns: Dict[str, np.ndarray], use_cache: bool):
+        """GA4Client._store_cached ile aynı; disk deposu yazması thread'de yapılır"""
+        if not use_cache:
+            return
+
+        query.get("memory_cache", self.response_cache).set(query["cache_key"], columns, ttl=query["ttl"])
+        if query["closed"]:
+            await asyncio.to_thread(self._write_stored, query, columns)
+
+    async def _lookup_partitions(self, query: Dict) -> tuple:
+        """GA4Client._lookup_partitions ile aynı; bellekte olmayan kapanmış günler diskten tek thread çağrısıyla okunur"""
+        days = self._partition_days(query)
+        parts = {}
+        stored = []
+        for day in days:
+            entry = self._partition_entry(query, day)
+            columns = entry["memory_cache"].get(entry["cache_key"])
+            if columns is not None:
+                parts[day] = columns
+            elif entry["closed"]:
+                stored.append((day, entry))
+
+        if stored:
+            found = await asyncio.to_thread(lambda: [self._lookup_stored(entry) for _, entry in stored])
+            for (day, _), columns in zip(stored, found):
+                if columns is not None:
+                    parts[day] = columns
+
+        return parts, self._missing_spans(days, parts)
+
+    async def _store_partitions(self, query: Dict, columns: Dict[str, np.ndarray], start: str, end: str) -> Dict[str, Dict[str, np.ndarray]]:
+        """GA4Client._store_partitions ile aynı; kapanmış günler diske tek thread çağrısıyla yazılır"""
+        parts = self._split_days(columns, start, end)
+        stored = []
+        for day, day_columns in parts.items():
+            entry = self._partition_entry(query, day)
+            entry["memory_cache"].set(entry["cache_key"], day_columns, ttl=entry["ttl"])
+            if entry["closed"]:
+                stored.append((entry, day_columns))
+
+        if stored:
+            await asyncio.to_thread(lambda: [self._write_stored(entry, day_columns) for entry, day_columns in stored])
+        return parts
+
+    async def _fetch_partitioned(self, query: Dict) -> Optional[Dict[str, np.ndarray]]:
+        """GA4Client._fetch_partitioned ile aynı; eksik gün aralıkları eşzamanlı çekilir"""
+        parts, spans = await self._lookup_partitions(query)
+
+        async def fetch_span(start: str, end: str):
+            span_query = self._span_query(query, start, end)
+            probe = await self._run_report_page(span_query["request"], offset=0, page_size=1)
+            if self._span_too_large(query, probe):
+                return None
+            return await self._collect_pages(span_query, probe, pages=self._span_pages(span_query, probe))
+
+        results = await self._gather_limited([fetch_span(start, end) for start, end in spans])
+        # Çekilen aralıklar, biri çok büyük çıksa da önbelleğe yazılır
+        for (start, end), columns in zip(spans, results):
+            if columns is not None:
+                parts.update(await self._store_partitions(query, columns, start, end))
+        if any(columns is None for columns in results):
+            return None
+
+        return self._assemble_partitions(query, parts)
+
+    async def stream_query(
+        self,
+        dimensions: List[str] = None,
+        metrics: List[str] = None,
+        start_date: Union[str, datetime, int] = "7daysAgo",
+        end_date: Union[str, datetime, int] = "yesterday",
+        filters: Dict = None,
+        order_by: str = None,
+        order_desc: bool = True,
+        limit: int = 10000,
+        chunk_type: str = "dataframe",
+        use_cache: bool = True,
+        page_size: int = None,
+        date_ranges: List = None
+    ) -> AsyncIterator[Union[pd.DataFrame, List[Dict], Dict[str, np.ndarray]]]:
+        """GA4Client.stream_query ile aynı; en fazla max_page_workers sayfa task olarak havada tutulur"""
+        await self._load_schema()
+        query = self._prepare_query(
+            dimensions=dimensions,
+            metrics=metrics,
+            start_date=start_date,
+            end_date=end_date,
+            filters=filters,
+            order_by=order_by,
+            order_desc=order_desc,
+            limit=limit,
+            date_ranges=date_ranges
+        )
+        query["page_size"] = page_size
+        page_size = self._page_size_for(query)
+
+        columns = await self._lookup_cached(query, use_cache)
+        if columns is not None:
+            for offset in range(0, column_length(columns), page_size):
+                chunk = {name: values[offset:offset + page_size].copy() for name, values in columns.items()}
+                yield self._format_chunk(chunk, query, chunk_type)
+            return
+
+        request = query["request"]
+        first_page = await self._run_report_page(request, offset=0, page_size=page_size)
+        yield self._format_chunk(self._decode_columns(first_page, query), query, chunk_type)
+
+        pages = deque(self._remaining_pages(query, first_page, page_size))
+        pending = deque()
+        try:
+            while pages or pending:
+                while pages and len(pending) < self.max_page_workers:
+                    offset, size = pages.popleft()
+                    pending.append(asyncio.ensure_future(self._run_report_page(request, offset, size)))
+                response = await pending.popleft()
+                yield self._format_chunk(self._decode_columns(response, query), query, chunk_type)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def run_batch(
+        self,
+        specs: List[Dict],
+        return_type: str = "dataframe",
+        use_cache: bool = True
+    ) -> List[Union[pd.DataFrame, List[Dict], Dict]]:
+        """GA4Client.run_batch ile aynı; batch istekleri eşzamanlı await edilir"""
+        await self._load_schema()
+        queries = self._prepare_specs(specs)
+
+        # Önbellekten karşılananlar
+        results = list(await asyncio.gather(*(self._lookup_cached(query, use_cache) for query in queries)))
+        chunks = self._pending_chunks(results)
+
+        chunk_queries = [[queries[i] for i in chunk] for chunk in chunks]
+        chunk_results = await self._gather_limited([
+            self.async_in_flight.do(
+                self._batch_key(batch),
+                lambda batch=batch: self._fetch_batch_and_store(batch, use_cache)
+            )
+            for batch in chunk_queries
+        ])
+        for chunk, chunk_data in zip(chunks, chunk_results):
+            for i, columns in zip(chunk, chunk_data):
+                results[i] = columns
+
+        return [
+            self._format_result(columns, query, spec.get("return_type", return_type))
+            for columns, query, spec in zip(results, queries, specs)
+        ]
+
+    async def _gather_limited(self, coroutines: List) -> List:
+        """Coroutine'leri en fazla max_page_workers eşzamanlılıkla çalıştırır, sırayı korur"""
+        semaphore = asyncio.Semaphore(self.max_page_workers)
+
+        async def limited(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(*(limited(coroutine) for coroutine in coroutines))
+
+    async def _fetch_rows(self, query: Dict) -> Dict[str, np.ndarray]:
+        """İlk sayfayı, ardından kalan sayfaları eşzamanlı çeker"""
+        page_size = self._page_size_for(query)
+        first_page = await self._run_report_page(query["request"], offset=0, page_size=page_size)
+        return await self._collect_pages(query, first_page, page_size)
+
+    async def _collect_pages(self, query: Dict, first_page, page_size: int = None, pages: List[tuple] = None) -> Dict[str, np.ndarray]:
+        """İlk sayfayı çözer; kalan sayfaları eşzamanlı çekip offset sırasıyla ekler"""
+        request = query["request"]
+        parts = [self._decode_columns(first_page, query)]
+        if pages is None:
+            pages = self._remaining_pages(query, first_page, page_size)
+
+        responses = await self._gather_limited([
+            self._run_report_page(request, offset=offset, page_size=size)
+            for offset, size in pages
+        ])
+        parts.extend(self._decode_columns(response, query) for response in responses)
+
+        return self._merge_pages(query, parts)
+
+    async def _run_report_page(self, request: Dict, offset: int, page_size: int):
+        """Tek bir sayfa için run_report çağrısı yapar"""
+        return await self._call_api("run_report", self._page_request(request, offset, page_size))
+
+    async def _call_api(self, method: str, request):
+        """GA4Client._call_api ile aynı; kuyrukta bekleme event loop'u bloklamaz"""
+        tracker = self.latency_trackers.setdefault(f"async:{method}", LatencyTracker())
+
+        async def attempt(timeout: float):
+            async with self.scheduler.async_slot(self.property_id) as ticket:
+                started = time.monotonic()
+                response = await getattr(self._get_client(), method)(request, retry=None, timeout=timeout)
+                tracker.record(time.monotonic() - started)
+                self._record_quota(ticket, response)
+            return response
+
+        try:
+            return await async_call_with_retry(attempt, self.retry_policy, tracker)
+        except (QuotaExceededError, RequestTimeoutError):
+            raise
+        except Exception as e:
+            raise Exception(f"GA4 API hatası: {str(e)}")
+
+    async def _fetch_batch_and_store(self, queries: List[Dict], use_cache: bool) -> List[Dict[str, np.ndarray]]:
+        """Batch'i API'den çeker ve her raporu önbelleğe yazar"""
+        results = await self._fetch_batch(queries)
+        for query, columns in zip(queries, results):
+            await self._store_cached(query, columns, use_cache)
+        return results
+
+    async def _fetch_batch(self, queries: List[Dict]) -> List[Dict[str, np.ndarray]]:
+        """En fazla MAX_BATCH_SIZE sorguyu tek batchRunReports çağrısıyla çalıştırır"""
+        page_sizes = [self._page_size_for(query) for query in queries]
+
+        response = await self._call_api("batch_run_reports", self._batch_request(queries, page_sizes))
+
+        return list(await asyncio.gather(*(
+            self._collect_pages(query, report, page_size)
+            for query, report, page_size in zip(queries, response.reports, page_sizes)
+        )))
+
+    async def compare_periods(
+        self,
+        metrics: List[str] = None,
+        current_start: Union[str, datetime, int] = "7daysAgo",
+        current_end: Union[str, datetime, int] = "yesterday",
+        previous_start: Union[str, datetime, int] = "14daysAgo",
+        previous_end: Union[str, datetime, int] = "8daysAgo"
+    ) -> Dict:
+        """GA4Client.compare_periods ile aynı"""
+        metrics = metrics or ["totalUsers", "sessions", "screenPageViews"]
+
+        rows = await self.run_query(
+            dimensions=[],
+            metrics=metrics,
+            date_ranges=[
+                (current_start, current_end, "current"),
+                (previous_start, previous_end, "previous"),
+            ],
+            return_type="list"
+        )
+        return self._build_comparison(rows, metrics)
+
+    async def compare_ranked(
+        self,
+        dimensions: List[str],
+        metrics: List[str] = None,
+        current_start: Union[str, datetime, int] = "7daysAgo",
+        current_end: Union[str, datetime, int] = "yesterday",
+        previous_start: Union[str, datetime, int] = None,
+        previous_end: Union[str, datetime, int] = None,
+        order_by: str = None,
+        limit: int = 10,
+        filters: Dict = None
+    ) -> pd.DataFrame:
+        """GA4Client.compare_ranked ile aynı"""
+        metrics = metrics or ["screenPageViews", "totalUsers", "sessions"]
+        order_by = order_by or metrics[0]
+
+        df = await self.run_query(**self._ranked_comparison_query(
+            dimensions, metrics, current_start, current_end,
+            previous_start, previous_end, order_by, limit, filters
+        ))
+        return self._build_ranked_comparison(df, dimensions, metrics, order_by, limit)
+
+    async def get_category_performance(
+        self,
+        start_date: Union[str, datetime, int] = "7daysAgo",
+        end_date: Union[str, datetime, int] = "yesterday",
+        limit: int = 20
+    ) -> pd.DataFrame:
+        """GA4Client.get_category_performance ile aynı"""
+        df = await self.run_query(
+            dimensions=["cat1"],
+            metrics=["screenPageViews", "totalUsers", "sessions", "averageSessionDuration"],
+            start_date=start_date,
+            end_date=end_date,
+            order_by="screenPageViews",
+            order_desc=True,
+            limit=limit
+        )
+        return self._postprocess_category_performance(df)
+
+    async def get_daily_trend(
+        self,
+        start_date: Union[str, datetime, int] = "30daysAgo",
+        end_date: Union[str, datetime, int] = "yesterday"
+    ) -> pd.DataFrame:
+        """GA4Client.get_daily_trend ile aynı"""
+        df = await self.run_query(
+            dimensions=["date"],
+            metrics=["totalUsers", "sessions", "screenPageViews", "newUsers"],
+            start_date=start_date,
+            end_date=end_date,
+            order_by="date",
+            order_desc=False
+        )
+        return self._postprocess_daily_trend(df)
+
+    async def run_pivot(
+        self,
+        rows: List[str],
+        columns: List[str],
+        metrics: List[str] = None,
+        start_date: Union[str, datetime, int] = "7daysAgo",
+        end_date: Union[str, datetime, int] = "yesterday",
+        filters: Dict = None,
+        row_limit: int = 20,
+        column_limit: int = 10,
+        row_order_by: str = None,
+        column_order_by: str = None,
+        order_desc: bool = True,
+        return_type: str = "dataframe",
+        use_cache: bool = True
+    ) -> Union[pd.DataFrame, List[Dict], Dict]:
+        """GA4Client.run_pivot ile aynı"""
+        await self._load_schema()
+        query = self._prepare_pivot_query(
+            rows, columns, metrics, start_date, end_date, filters,
+            row_limit, column_limit, row_order_by, column_order_by, order_desc
+        )
+
+        wide = await self._lookup_cached(query, use_cache)
+        if wide is None:
+            wide = await self.async_in_flight.do(
+                query["cache_key"], lambda: self._fetch_pivot_and_store(query, use_cache)
+            )
+
+        return self._format_result(wide, query, return_type)
+
+    async def _fetch_pivot_and_store(self, query: Dict, use_cache: bool) -> Dict[str, np.ndarray]:
+        """Pivot raporunu çeker, geniş tabloya çevirir ve önbelleğe yazar"""
+        response = await self._call_api("run_pivot_report", query["request"])
+        wide = self._decode_pivot(response, query)
+        await self._store_cached(query, wide, use_cache)
+        return wide
+
+    async def run_realtime_report(
+        self,
+        dimensions: List[str] = None,
+        metrics: List[str] = None,
+        minutes_ago: int = REALTIME_MAX_MINUTES,
+        filters: Dict = None,
+        order_by: str = None,
+        order_desc: bool = True,
+        limit: int = 100,
+        return_type: str = "dataframe",
+        use_cache: bool = True
+    ) -> Union[pd.DataFrame, List[Dict], Dict]:
+        """GA4Client.run_realtime_report ile aynı"""
+        query = self._prepare_realtime_query(dimensions, metrics, minutes_ago, filters, order_by, order_desc, limit)
+
+        columns = self.realtime_cache.get(query["cache_key"]) if use_cache else None
+        if columns is None:
+            columns = await self.async_in_flight.do(
+                query["cache_key"], lambda: self._fetch_realtime(query, use_cache)
+            )
+
+        return self._format_result(columns, query, return_type)
+
+    async def _fetch_realtime(self, query: Dict, use_cache: bool) -> Dict[str, np.ndarray]:
+        """Gerçek zamanlı raporu çeker ve kısa süreli önbelleğe yazar"""
+        response = await self._call_api("run_realtime_report", query["request"])
+        columns = self._decode_columns(response, query)
+        if use_cache:
+            self.realtime_cache.set(query["cache_key"], columns, ttl=TTL_REALTIME)
+        return columns
+
+    async def get_realtime_summary(self) -> Dict:
+        """GA4Client.get_realtime_summary ile aynı"""
+        rows = await self.run_realtime_report(
+            dimensions=[],
+            metrics=["activeUsers", "screenPageViews", "eventCount"],
+            return_type="list"
+        )
+
+        if rows:
+            return rows[0]
+        return {}
+
+    # Diğer get_* yardımcıları ve quick_query doğrudan run_query sonucunu döndürdüğü
+    # için miras alınan sürümleri bu sınıfta await edilebilir coroutine döndürür
+
+
 # =============================================================================
 # TEST
 # =============================================================================
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""
+Google Analytics 4 - Filtre İfadeleri
+run_query'nin filters sözlüğünü GA4 FilterExpression'larına derler.
+Dimension koşulları dimension_filter'a, metric koşulları metric_filter'a gider.
+
+Sözlük yapısı (üst seviyedeki anahtarlar AND ile birleşir):
+    {"newstype": "video"}                              # EXACT (eski kullanım)
+    {"editor": ["o.yenilmez", "oyenilmez"]}             # IN listesi (kısa yazım)
+    {"editor": {"in": ["o.yenilmez", "oyenilmez"]}}     # IN listesi
+    {"pagePath": {"begins_with": "/spor"}}              # BEGINS_WITH
+    {"pagePath": {"ends_with": ".html"}}                # ENDS_WITH
+    {"pageTitle": {"contains": "Seçim", "case_sensitive": True}}
+    {"pagePath": {"regex": "^/gundem/.*"}}              # FULL_REGEXP
+    {"pagePath": {"partial_regex": "galeri"}}           # PARTIAL_REGEXP
+    {"screenPageViews": {"between": [100, 1000]}}       # Sayısal aralık (metric)
+    {"sessions": {"gte": 10}}                           # eq / gt / gte / lt / lte
+    {"$or": [{"cat1": "Spor"}, {"cat1": "Ekonomi"}]}    # OR grubu
+    {"$and": [...]}                                     # AND grubu
+    {"$not": {"newstype": "video"}}                     # NOT
+
+Bir alan sözlüğünde birden fazla operatör varsa AND ile birleşir:
+    {"sessions": {"gte": 10, "lt": 100}}
+
+Kullanım:
+    from ga4_filters import compile_filters, date_range_values, filter_field_names
+
+    dimension_filter, metric_filter = compile_filters(filters, resolve_field)
+    fields = filter_field_names(dimension_filter)
+    filters = {"publisheddate": {"in": date_range_values("20251201", "20251207")}}
+"""
+
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from google.analytics.data_v1beta.types import (
+    Filter,
+    FilterExpression,
+    FilterExpressionList,
+    NumericValue
+)
+
+
+STRING_OPERATORS = {
+    "eq": Filter.StringFilter.MatchType.EXACT,
+    "begins_with": Filter.StringFilter.MatchType.BEGINS_WITH,
+    "ends_with": Filter.StringFilter.MatchType.ENDS_WITH,
+    "contains": Filter.StringFilter.MatchType.CONTAINS,
+    "regex": Filter.StringFilter.MatchType.FULL_REGEXP,
+    "partial_regex": Filter.StringFilter.MatchType.PARTIAL_REGEXP,
+}
+
+NUMERIC_OPERATORS = {
+    "eq": Filter.NumericFilter.Operation.EQUAL,
+    "gt": Filter.NumericFilter.Operation.GREATER_THAN,
+    "gte": Filter.NumericFilter.Operation.GREATER_THAN_OR_EQUAL,
+    "lt": Filter.NumericFilter.Operation.LESS_THAN,
+    "lte": Filter.NumericFilter.Operation.LESS_THAN_OR_EQUAL,
+}
+
+# Operatör sözlüğünde operatör olmayan seçenekler
+OPTION_KEYS = {"case_sensitive"}
+
+
+def compile_filters(
+    filters: Optional[Dict],
+    resolve_field: Callable[[str], Tuple[str, bool]]
+) -> Tuple[Optional[FilterExpression], Optional[FilterExpression]]:
+    """
+    Filtre sözlüğünü (dimension_filter, metric_filter) çiftine derler.
+
+    Args:
+        filters: Filtre sözlüğü (yapısı için modül açıklamasına bakın)
+        resolve_field: Alan adını (api_adı, metric_mi) çiftine çeviren fonksiyon
+
+    Returns:
+        (dimension_filter, metric_filter) - koşul yoksa None
+
+    Raises:
+        ValueError: Bilinmeyen operatör, hatalı değer veya aynı grupta
+            hem dimension hem metric koşulu (GA4 bunları ayrı filtrelerde ister)
+    """
+    if not filters:
+        return None, None
+
+    dimension_expressions = []
+    metric_expressions = []
+    for key, value in filters.items():
+        expression, is_metric = _compile_entry(key, value, resolve_field)
+        (metric_expressions if is_metric else dimension_expressions).append(expression)
+
+    return _and(dimension_expressions), _and(metric_expressions)
+
+
+def filter_field_names(expression: Optional[FilterExpression]) -> List[str]:
+    """Derlenmiş ifadedeki tüm alan adlarını (gruplar dahil) döndürür"""
+    if expression is None:
+        return []
+    kind = FilterExpression.pb(expression).WhichOneof("expr")
+    if kind == "filter":
+        return [expression.filter.field_name]
+    if kind == "not_expression":
+        return filter_field_names(expression.not_expression)
+    if kind in ("and_group", "or_group"):
+        group = getattr(expression, kind)
+        return [name for child in group.expressions for name in filter_field_names(child)]
+    return []
+
+
+def date_range_values(start: str, end: str) -> List[str]:
+    """
+    İki tarih arasındaki günleri YYYYMMDD listesi olarak döndürür (uçlar dahil).
+    Yayın tarihi gibi tarih içeren string dimension'larda aralık filtresi için
+    {"in": date_range_values(...)} şeklinde kullanılır.
+
+    Args:
+        start: Başlangıç tarihi (YYYYMMDD veya YYYY-MM-DD)
+        end: Bitiş tarihi (YYYYMMDD veya YYYY-MM-DD)
+
+    Returns:
+        ["20251201", "20251202", ...]
+    """
+    current = _parse_day(start)
+    last = _parse_day(end)
+    values = []
+    while current <= last:
+        values.append(current.strftime("%Y%m%d"))
+        current += timedelta(days=1)
+    return values
+
+
+def _parse_day(value: str) -> datetime:
+    """YYYYMMDD veya YYYY-MM-DD tarihini datetime'a çevirir"""
+    value = str(value)
+    return datetime.strptime(value, "%Y-%m-%d" if "-" in value else "%Y%m%d")
+
+
+def _compile_entry(key: str, value, resolve_field) -> Tuple[FilterExpression, bool]:
+    """Tek bir (anahtar, değer) girdisini ifadeye derler; (ifade, metric_mi) döndürür"""
+    if key == "$or":
+        return _compile_group(value, resolve_field, "or_group")
+    if key == "$and":
+        return _compile_group(value, resolve_field, "and_group")
+    if key == "$not":
+        expression, is_metric = _compile_nested(value, resolve_field)
+        return FilterExpression(not_expression=expression), is_metric
+    if key.startswith("$"):
+        raise ValueError(f"Bilinmeyen filtre grubu: {key}")
+
+    field_name, is_metric = resolve_field(key)
+    return _compile_field(field_name, value), is_metric
+
+
+def _compile_nested(filters: Dict, resolve_field) -> Tuple[FilterExpression, bool]:
+    """Alt sözlüğü tek ifadeye derler - tüm koşullar aynı türde (dimension/metric) olmalı"""
+    if not isinstance(filters, dict) or not filters:
+        raise ValueError(f"Filtre grubu boş olmayan bir sözlük olmalı: {filters!r}")
+
+    dimension_filter, metric_filter = compile_filters(filters, resolve_field)
+    if dimension_filter is not None and metric_filter is not None:
+        raise ValueError("Aynı filtre grubunda dimension ve metric koşulları birlikte kullanılamaz")
+    if metric_filter is not None:
+        return metric_filter, True
+    return dimension_filter, False
+
+
+def _compile_group(items: List[Dict], resolve_field, group: str) -> Tuple[FilterExpression, bool]:
+    """$or / $and listesini and_group / or_group ifadesine derler"""
+    if not isinstance(items, (list, tuple)) or not items:
+        raise ValueError(f"Filtre grubu boş olmayan bir liste olmalı: {items!r}")
+
+    compiled = [_compile_nested(item, resolve_field) for item in items]
+    kinds = {is_metric for _, is_metric in compiled}
+    if len(kinds) > 1:
+        raise ValueError("Aynı filtre grubunda dimension ve metric koşulları birlikte kullanılamaz")
+
+    expressions = [expression for expression, _ in compiled]
+    if len(expressions) == 1:
+        return expressions[0], kinds.pop()
+    return FilterExpression(**{group: FilterExpressionList(expressions=expressions)}), kinds.pop()
+
+
+def _compile_field(field_name: str, value) -> FilterExpression:
+    """Bir alanın koşulunu (değer, liste veya operatör sözlüğü) ifadeye derler"""
+    if isinstance(value, (list, tuple)):
+        return _in_list(field_name, value, case_sensitive=False)
+    if not isinstance(value, dict):
+        return _field_expression(field_name, "eq", value, case_sensitive=False)
+
+    case_sensitive = bool(value.get("case_sensitive", False))
+    expressions = [
+        _field_expression(field_name, operator, operand, case_sensitive)
+        for operator, operand in value.items() if operator not in OPTION_KEYS
+    ]
+    if not expressions:
+        raise ValueError(f"'{field_name}' için operatör belirtilmemiş: {value!r}")
+    return _and(expressions)
+
+
+def _field_expression(field_name: str, operator: str, operand, case_sensitive: bool) -> FilterExpression:
+    """Tek operatörlü koşul"""
+    if operator == "in":
+        return _in_list(field_name, operand, case_sensitive)
+
+    if operator == "between":
+        if not isinstance(operand, (list, tuple)) or len(operand) != 2:
+            raise ValueError(f"'{field_name}' between için [alt, üst] verilmeli: {operand!r}")
+        return FilterExpression(filter=Filter(
+            field_name=field_name,
+            between_filter=Filter.BetweenFilter(
+                from_value=_numeric_value(operand[0]),
+                to_value=_numeric_value(operand[1])
+            )
+        ))
+
+    # Sayısal değerlerde eq dahil sayısal karşılaştırma
+    if operator in NUMERIC_OPERATORS and (operator != "eq" or _is_number(operand)):
+        return FilterExpression(filter=Filter(
+            field_name=field_name,
+            numeric_filter=Filter.NumericFilter(
+                operation=NUMERIC_OPERATORS[operator],
+                value=_numeric_value(operand)
+            )
+        ))
+
+    if operator in STRING_OPERATORS:
+        return FilterExpression(filter=Filter(
+            field_name=field_name,
+            string_filter=Filter.StringFilter(
+                value=str(operand),
+                match_type=STRING_OPERATORS[operator],
+                case_sensitive=case_sensitive
+            )
+        ))
+
+    raise ValueError(f"Bilinmeyen filtre operatörü: {operator}")
+
+
+def _in_list(field_name: str, values, case_sensitive: bool) -> FilterExpression:
+    """IN listesi koşulu"""
+    if isinstance(values, str) or not values:
+        raise ValueError(f"'{field_name}' in için boş olmayan bir liste verilmeli: {values!r}")
+    return FilterExpression(filter=Filter(
+        field_name=field_name,
+        in_list_filter=Filter.InListFilter(
+            values=[str(v) for v in values],
+            case_sensitive=case_sensitive
+        )
+    ))
+
+
+def _is_number(value) -> bool:
+    """bool hariç int/float mı?"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _numeric_value(value) -> NumericValue:
+    """Sayıyı NumericValue'ya çevirir (tam sayılar int64_value)"""
+    if not _is_number(value):
+        raise ValueError(f"Sayısal filtre değeri bekleniyordu: {value!r}")
+    if isinstance(value, int) or float(value).is_integer():
+        return NumericValue(int64_value=int(value))
+    return NumericValue(double_value=float(value))
+
+
+def _and(expressions: List[FilterExpression]) -> Optional[FilterExpression]:
+    """İfadeleri AND ile birleştirir (tek ifade olduğu gibi döner)"""
+    if not expressions:
+        return None
+    if len(expressions) == 1:
+        return expressions[0]
+    return FilterExpression(and_group=FilterExpressionList(expressions=expressions))
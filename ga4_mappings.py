@@ -263,6 +263,13 @@ DIMENSIONS = {
         "category": "Sayfa",
         "weight": 9
     },
+    "unifiedScreenName": {
+        "api_name": "unifiedScreenName",
+        "tr_name": "Sayfa/Ekran Adı",
+        "description": "Web'de sayfa başlığı, uygulamada ekran adı (gerçek zamanlı raporlarda sayfa yerine kullanılır)",
+        "category": "Sayfa",
+        "weight": 5
+    },
     "pageReferrer": {
         "api_name": "pageReferrer",
         "tr_name": "Referrer URL",
@@ -506,6 +513,20 @@ DIMENSIONS = {
         "category": "Zaman",
         "weight": 10
     },
+    "dateRange": {
+        "api_name": "dateRange",
+        "tr_name": "Tarih Aralığı",
+        "description": "Birden fazla tarih aralığı istendiğinde satırın ait olduğu aralık adı",
+        "category": "Zaman",
+        "weight": 3
+    },
+    "minutesAgo": {
+        "api_name": "minutesAgo",
+        "tr_name": "Dakika Önce",
+        "description": "Gerçek zamanlı raporda olayın kaç dakika önce gerçekleştiği (0-29)",
+        "category": "Zaman",
+        "weight": 3
+    },
     "dateHour": {
         "api_name": "dateHour",
         "tr_name": "Tarih ve Saat",
@@ -1004,6 +1025,12 @@ DIMENSIONS = {
 # =============================================================================
 # METRICS (Metrikler)
 # =============================================================================
+# Dimension alanlarına ek olarak her metric için:
+# - type: Değer tipi (integer, float, percent, currency, duration)
+# - additive: Günlük değerlerin toplamı aralığın değerine eşit mi?
+#   True: sayaçlar (sessions, screenPageViews, eventCount ...) - gün gün toplanabilir
+#   False: tekil kullanıcı sayıları, oranlar ve ortalamalar (totalUsers, bounceRate ...)
+#   Günlük önbellek parçaları sadece additive metric'ler için birleştirilir
 
 METRICS = {
     # -------------------------------------------------------------------------
@@ -1015,6 +1042,7 @@ METRICS = {
         "description": "Toplam benzersiz kullanıcı sayısı",
         "category": "Kullanıcı",
         "type": "integer",
+        "additive": False,
         "weight": 10
     },
     "newUsers": {
@@ -1023,6 +1051,7 @@ METRICS = {
         "description": "İlk kez gelen kullanıcı sayısı",
         "category": "Kullanıcı",
         "type": "integer",
+        "additive": True,
         "weight": 9
     },
     "activeUsers": {
@@ -1031,6 +1060,7 @@ METRICS = {
         "description": "Aktif kullanıcı sayısı",
         "category": "Kullanıcı",
         "type": "integer",
+        "additive": False,
         "weight": 9
     },
     "dauPerMau": {
@@ -1039,6 +1069,7 @@ METRICS = {
         "description": "Günlük aktif kullanıcı / Aylık aktif kullanıcı oranı",
         "category": "Kullanıcı",
         "type": "float",
+        "additive": False,
         "weight": 5
     },
     "dauPerWau": {
@@ -1047,6 +1078,7 @@ METRICS = {
         "description": "Günlük aktif kullanıcı / Haftalık aktif kullanıcı oranı",
         "category": "Kullanıcı",
         "type": "float",
+        "additive": False,
         "weight": 5
     },
     "wauPerMau": {
@@ -1055,6 +1087,7 @@ METRICS = {
         "description": "Haftalık aktif kullanıcı / Aylık aktif kullanıcı oranı",
         "category": "Kullanıcı",
         "type": "float",
+        "additive": False,
         "weight": 5
     },
     "userEngagementDuration": {
@@ -1063,6 +1096,7 @@ METRICS = {
         "description": "Toplam kullanıcı etkileşim süresi (saniye)",
         "category": "Kullanıcı",
         "type": "float",
+        "additive": True,
         "weight": 7
     },
     "engagedSessions": {
@@ -1071,6 +1105,7 @@ METRICS = {
         "description": "10 saniyeden uzun veya dönüşüm içeren oturum sayısı",
         "category": "Kullanıcı",
         "type": "integer",
+        "additive": True,
         "weight": 8
     },
     "engagementRate": {
@@ -1079,6 +1114,7 @@ METRICS = {
         "description": "Etkileşimli oturum yüzdesi",
         "category": "Kullanıcı",
         "type": "percent",
+        "additive": False,
         "weight": 8
     },
     "bounceRate": {
@@ -1087,6 +1123,7 @@ METRICS = {
         "description": "Tek sayfa oturumların yüzdesi",
         "category": "Kullanıcı",
         "type": "percent",
+        "additive": False,
         "weight": 9
     },
 
@@ -1099,6 +1136,7 @@ METRICS = {
         "description": "Toplam oturum sayısı",
         "category": "Oturum",
         "type": "integer",
+        "additive": True,
         "weight": 10
     },
     "sessionsPerUser": {
@@ -1107,6 +1145,7 @@ METRICS = {
         "description": "Kullanıcı başına ortalama oturum sayısı",
         "category": "Oturum",
         "type": "float",
+        "additive": False,
         "weight": 7
     },
     "averageSessionDuration": {
@@ -1115,6 +1154,7 @@ METRICS = {
         "description": "Ortalama oturum süresi (saniye)",
         "category": "Oturum",
         "type": "duration",
+        "additive": False,
         "weight": 9
     },
     "screenPageViewsPerSession": {
@@ -1123,6 +1163,7 @@ METRICS = {
         "description": "Oturum başına ortalama sayfa görüntüleme",
         "category": "Oturum",
         "type": "float",
+        "additive": False,
         "weight": 8
     },
 
@@ -1135,6 +1176,7 @@ METRICS = {
         "description": "Toplam sayfa görüntüleme sayısı",
         "category": "Sayfa",
         "type": "integer",
+        "additive": True,
         "weight": 10
     },
     "screenPageViewsPerUser": {
@@ -1143,6 +1185,7 @@ METRICS = {
         "description": "Kullanıcı başına ortalama sayfa görüntüleme",
         "category": "Sayfa",
         "type": "float",
+        "additive": False,
         "weight": 7
     },
     "entrances": {
@@ -1151,6 +1194,7 @@ METRICS = {
         "description": "Sayfaya giriş sayısı",
         "category": "Sayfa",
         "type": "integer",
+        "additive": True,
         "weight": 7
     },
     "exits": {
@@ -1159,6 +1203,7 @@ METRICS = {
         "description": "Sayfadan çıkış sayısı",
         "category": "Sayfa",
         "type": "integer",
+        "additive": True,
         "weight": 7
     },
     "viewsPerSession": {
@@ -1167,6 +1212,7 @@ METRICS = {
         "description": "Oturum başına sayfa görüntüleme",
         "category": "Sayfa",
         "type": "float",
+        "additive": False,
         "weight": 6
     },
 
@@ -1179,6 +1225,7 @@ METRICS = {
         "description": "Toplam etkinlik sayısı",
         "category": "Etkinlik",
         "type": "integer",
+        "additive": True,
         "weight": 7
     },
     "eventCountPerUser": {
@@ -1187,6 +1234,7 @@ METRICS = {
         "description": "Kullanıcı başına ortalama etkinlik sayısı",
         "category": "Etkinlik",
         "type": "float",
+        "additive": False,
         "weight": 6
     },
     "eventValue": {
@@ -1195,6 +1243,7 @@ METRICS = {
         "description": "Etkinliklerin toplam değeri",
         "category": "Etkinlik",
         "type": "currency",
+        "additive": True,
         "weight": 4
     },
     "eventsPerSession": {
@@ -1203,6 +1252,7 @@ METRICS = {
         "description": "Oturum başına ortalama etkinlik sayısı",
         "category": "Etkinlik",
         "type": "float",
+        "additive": False,
         "weight": 6
     },
 
@@ -1215,6 +1265,7 @@ METRICS = {
         "description": "Toplam dönüşüm sayısı",
         "category": "Dönüşüm",
         "type": "integer",
+        "additive": True,
         "weight": 6
     },
     "sessionConversionRate": {
@@ -1223,6 +1274,7 @@ METRICS = {
         "description": "Dönüşüm içeren oturum yüzdesi",
         "category": "Dönüşüm",
         "type": "percent",
+        "additive": False,
         "weight": 6
     },
     "userConversionRate": {
@@ -1231,6 +1283,7 @@ METRICS = {
         "description": "Dönüşüm gerçekleştiren kullanıcı yüzdesi",
         "category": "Dönüşüm",
         "type": "percent",
+        "additive": False,
         "weight": 6
     },
 
@@ -1243,6 +1296,7 @@ METRICS = {
         "description": "Toplam e-ticaret işlem sayısı",
         "category": "E-Ticaret",
         "type": "integer",
+        "additive": True,
         "weight": 2
     },
     "ecommercePurchases": {
@@ -1251,6 +1305,7 @@ METRICS = {
         "description": "Toplam satın alma sayısı",
         "category": "E-Ticaret",
         "type": "integer",
+        "additive": True,
         "weight": 2
     },
     "purchaseRevenue": {
@@ -1259,6 +1314,7 @@ METRICS = {
         "description": "Satın almalardan elde edilen toplam gelir",
         "category": "E-Ticaret",
         "type": "currency",
+        "additive": True,
         "weight": 2
     },
     "totalRevenue": {
@@ -1267,6 +1323,7 @@ METRICS = {
         "description": "Tüm kaynaklardan toplam gelir",
         "category": "E-Ticaret",
         "type": "currency",
+        "additive": True,
         "weight": 3
     },
     "averageRevenuePerUser": {
@@ -1275,6 +1332,7 @@ METRICS = {
         "description": "Kullanıcı başına ortalama gelir (ARPU)",
         "category": "E-Ticaret",
         "type": "currency",
+        "additive": False,
         "weight": 2
     },
     "averagePurchaseRevenue": {
@@ -1283,6 +1341,7 @@ METRICS = {
         "description": "Satın alma başına ortalama gelir",
         "category": "E-Ticaret",
         "type": "currency",
+        "additive": False,
         "weight": 2
     },
     "averagePurchaseRevenuePerUser": {
@@ -1291,6 +1350,7 @@ METRICS = {
         "description": "Kullanıcı başına ortalama satın alma geliri",
         "category": "E-Ticaret",
         "type": "currency",
+        "additive": False,
         "weight": 2
     },
     "itemsViewed": {
@@ -1299,6 +1359,7 @@ METRICS = {
         "description": "Görüntülenen ürün sayısı",
         "category": "E-Ticaret",
         "type": "integer",
+        "additive": True,
         "weight": 2
     },
     "itemsAddedToCart": {
@@ -1307,6 +1368,7 @@ METRICS = {
         "description": "Sepete eklenen ürün sayısı",
         "category": "E-Ticaret",
         "type": "integer",
+        "additive": True,
         "weight": 2
     },
     "itemsCheckedOut": {
@@ -1315,6 +1377,7 @@ METRICS = {
         "description": "Ödeme sürecine geçilen ürün sayısı",
         "category": "E-Ticaret",
         "type": "integer",
+        "additive": True,
         "weight": 2
     },
     "itemsPurchased": {
@@ -1323,6 +1386,7 @@ METRICS = {
         "description": "Satın alınan ürün sayısı",
         "category": "E-Ticaret",
         "type": "integer",
+        "additive": True,
         "weight": 2
     },
     "itemRevenue": {
@@ -1331,6 +1395,7 @@ METRICS = {
         "description": "Ürünlerden elde edilen gelir",
         "category": "E-Ticaret",
         "type": "currency",
+        "additive": True,
         "weight": 2
     },
     "itemQuantity": {
@@ -1339,6 +1404,7 @@ METRICS = {
         "description": "Satın alınan ürün adedi",
         "category": "E-Ticaret",
         "type": "integer",
+        "additive": True,
         "weight": 2
     },
     "cartToViewRate": {
@@ -1347,6 +1413,7 @@ METRICS = {
         "description": "Görüntülenen ürünlerin sepete eklenme oranı",
         "category": "E-Ticaret",
         "type": "percent",
+        "additive": False,
         "weight": 2
     },
     "purchaseToViewRate": {
@@ -1355,6 +1422,7 @@ METRICS = {
         "description": "Görüntülenen ürünlerin satın alınma oranı",
         "category": "E-Ticaret",
         "type": "percent",
+        "additive": False,
         "weight": 2
     },
     "refundAmount": {
@@ -1363,6 +1431,7 @@ METRICS = {
         "description": "Toplam iade tutarı",
         "category": "E-Ticaret",
         "type": "currency",
+        "additive": True,
         "weight": 1
     },
     "shippingAmount": {
@@ -1371,6 +1440,7 @@ METRICS = {
         "description": "Toplam kargo tutarı",
         "category": "E-Ticaret",
         "type": "currency",
+        "additive": True,
         "weight": 1
     },
     "taxAmount": {
@@ -1379,6 +1449,7 @@ METRICS = {
         "description": "Toplam vergi tutarı",
         "category": "E-Ticaret",
         "type": "currency",
+        "additive": True,
         "weight": 1
     },
     "transactionsPerPurchaser": {
@@ -1387,6 +1458,7 @@ METRICS = {
         "description": "Satın alan kullanıcı başına işlem sayısı",
         "category": "E-Ticaret",
         "type": "float",
+        "additive": False,
         "weight": 2
     },
 
@@ -1399,6 +1471,7 @@ METRICS = {
         "description": "Yayıncı reklam tıklama sayısı",
         "category": "Yayıncı",
         "type": "integer",
+        "additive": True,
         "weight": 4
     },
     "publisherAdImpressions": {
@@ -1407,6 +1480,7 @@ METRICS = {
         "description": "Yayıncı reklam gösterim sayısı",
         "category": "Yayıncı",
         "type": "integer",
+        "additive": True,
         "weight": 4
     },
     "totalAdRevenue": {
@@ -1415,6 +1489,7 @@ METRICS = {
         "description": "Reklamlardan elde edilen toplam gelir",
         "category": "Yayıncı",
         "type": "currency",
+        "additive": True,
         "weight": 4
     },
 
@@ -1427,6 +1502,7 @@ METRICS = {
         "description": "Sayfayı kaydıran kullanıcı sayısı",
         "category": "Etkileşim",
         "type": "integer",
+        "additive": False,
         "weight": 6
     },
 
@@ -1439,6 +1515,7 @@ METRICS = {
         "description": "Uygulama çökmesi yaşayan kullanıcı sayısı",
         "category": "Teknik",
         "type": "integer",
+        "additive": False,
         "weight": 3
     },
     "crashFreeUsersRate": {
@@ -1447,6 +1524,7 @@ METRICS = {
         "description": "Çökme yaşamayan kullanıcı yüzdesi",
         "category": "Teknik",
         "type": "percent",
+        "additive": False,
         "weight": 3
     },
     "firstTimePurchasers": {
@@ -1455,6 +1533,7 @@ METRICS = {
         "description": "İlk kez satın alma yapan kullanıcı sayısı",
         "category": "E-Ticaret",
         "type": "integer",
+        "additive": True,
         "weight": 2
     },
     "firstTimePurchasersPerNewUser": {
@@ -1463,6 +1542,7 @@ METRICS = {
         "description": "Yeni kullanıcıların ilk satın alma oranı",
         "category": "E-Ticaret",
         "type": "float",
+        "additive": False,
         "weight": 2
     },
     "totalPurchasers": {
@@ -1471,6 +1551,7 @@ METRICS = {
         "description": "Satın alma yapan toplam kullanıcı sayısı",
         "category": "E-Ticaret",
         "type": "integer",
+        "additive": False,
         "weight": 2
     },
     "organicGoogleSearchAveragePosition": {
@@ -1479,6 +1560,7 @@ METRICS = {
         "description": "Google organik aramada ortalama pozisyon",
         "category": "SEO",
         "type": "float",
+        "additive": False,
         "weight": 5
     },
     "organicGoogleSearchClicks": {
@@ -1487,6 +1569,7 @@ METRICS = {
         "description": "Google organik aramadan gelen tıklama sayısı",
         "category": "SEO",
         "type": "integer",
+        "additive": True,
         "weight": 5
     },
     "organicGoogleSearchClickThroughRate": {
@@ -1495,6 +1578,7 @@ METRICS = {
         "description": "Google organik arama tıklama oranı",
         "category": "SEO",
         "type": "percent",
+        "additive": False,
         "weight": 5
     },
     "organicGoogleSearchImpressions": {
@@ -1503,6 +1587,7 @@ METRICS = {
         "description": "Google organik aramada gösterim sayısı",
         "category": "SEO",
         "type": "integer",
+        "additive": True,
         "weight": 5
     },
 }
@@ -1802,6 +1887,7 @@ CUSTOM_METRICS = {
         "description": "Ortalama okuma/izleme süresi",
         "category": "Etkileşim",
         "type": "float",
+        "additive": False,
         "weight": 8
     },
     "maxScroll": {
@@ -1810,6 +1896,7 @@ CUSTOM_METRICS = {
         "description": "Maksimum kaydırma yüzdesi",
         "category": "Etkileşim",
         "type": "float",
+        "additive": False,
         "weight": 7
     },
     "r_Duration": {
@@ -1818,6 +1905,7 @@ CUSTOM_METRICS = {
         "description": "Gerçek okuma süresi",
         "category": "Etkileşim",
         "type": "float",
+        "additive": False,
         "weight": 8
     },
     "r_Scroll": {
@@ -1826,6 +1914,7 @@ CUSTOM_METRICS = {
         "description": "Okuma kaydırma yüzdesi",
         "category": "Etkileşim",
         "type": "float",
+        "additive": False,
         "weight": 7
     },
 }
@@ -1835,6 +1924,49 @@ CUSTOM_METRICS = {
 # HELPER FUNCTIONS (Yardımcı Fonksiyonlar)
 # =============================================================================
 
+# -----------------------------------------------------------------------------
+# Arama indeksleri
+# Yardımcı fonksiyonlar sorgu başına (satır/sütun başına) çağrıldığı için sözlükler
+# her çağrıda taranmaz; import sırasında bir kez ters indeksler kurulur.
+# Her indeks, eski doğrusal taramanın ilk eşleşmesini verecek şekilde
+# sözlük sırasıyla setdefault ile doldurulur.
+# -----------------------------------------------------------------------------
+
+_DIMENSION_INDEX = {}     # key / api_name / tr_name -> dimension bilgisi
+_METRIC_INDEX = {}        # key / api_name / tr_name -> metric bilgisi
+_TR_TO_API_INDEX = {}     # tr_name.lower() -> api_name
+_API_TO_TR_INDEX = {}     # api_name -> (sıra, tr_name)
+_KEY_TO_TR_INDEX = {}     # key (customEvent: öneksiz) -> (sıra, tr_name)
+
+
+def rebuild_indexes():
+    """
+    Arama indekslerini DIMENSIONS, CUSTOM_DIMENSIONS, METRICS ve CUSTOM_METRICS
+    sözlüklerinden yeniden kurar. Sözlükler çalışma anında değiştirilirse çağrılmalıdır.
+    """
+    for index in (_DIMENSION_INDEX, _METRIC_INDEX, _TR_TO_API_INDEX, _API_TO_TR_INDEX, _KEY_TO_TR_INDEX):
+        index.clear()
+
+    for source, index in ((DIMENSIONS, _DIMENSION_INDEX), (CUSTOM_DIMENSIONS, _DIMENSION_INDEX),
+                          (METRICS, _METRIC_INDEX), (CUSTOM_METRICS, _METRIC_INDEX)):
+        for key, value in source.items():
+            index.setdefault(key, value)
+            index.setdefault(value["api_name"], value)
+            index.setdefault(value["tr_name"], value)
+
+    # get_api_name_from_tr / get_tr_name_from_api arama sırası: D, CD, M, CM
+    position = 0
+    for source in (DIMENSIONS, CUSTOM_DIMENSIONS, METRICS, CUSTOM_METRICS):
+        for key, value in source.items():
+            _TR_TO_API_INDEX.setdefault(value["tr_name"].lower(), value["api_name"])
+            _API_TO_TR_INDEX.setdefault(value["api_name"], (position, value["tr_name"]))
+            _KEY_TO_TR_INDEX.setdefault(key, (position, value["tr_name"]))
+            position += 1
+
+
+rebuild_indexes()
+
+
 def get_dimension_info(api_name_or_tr_name: str) -> dict:
     """
     Dimension bilgisini API adı veya Türkçe adıyla getirir.
@@ -1845,17 +1977,7 @@ def get_dimension_info(api_name_or_tr_name: str) -> dict:
     Returns:
         Dimension bilgi sözlüğü veya None
     """
-    # Önce standart dimension'larda ara
-    for key, value in DIMENSIONS.items():
-        if key == api_name_or_tr_name or value["api_name"] == api_name_or_tr_name or value["tr_name"] == api_name_or_tr_name:
-            return value
-
-    # Custom dimension'larda ara
-    for key, value in CUSTOM_DIMENSIONS.items():
-        if key == api_name_or_tr_name or value["api_name"] == api_name_or_tr_name or value["tr_name"] == api_name_or_tr_name:
-            return value
-
-    return None
+    return _DIMENSION_INDEX.get(api_name_or_tr_name)
 
 
 def get_metric_info(api_name_or_tr_name: str) -> dict:
@@ -1868,22 +1990,27 @@ def get_metric_info(api_name_or_tr_name: str) -> dict:
     Returns:
         Metric bilgi sözlüğü veya None
     """
-    # Standart metric'lerde ara
-    for key, value in METRICS.items():
-        if key == api_name_or_tr_name or value["api_name"] == api_name_or_tr_name or value["tr_name"] == api_name_or_tr_name:
-            return value
+    return _METRIC_INDEX.get(api_name_or_tr_name)
 
-    # Custom metric'lerde ara
-    for key, value in CUSTOM_METRICS.items():
-        if key == api_name_or_tr_name or value["api_name"] == api_name_or_tr_name or value["tr_name"] == api_name_or_tr_name:
-            return value
 
-    return None
+def is_additive_metric(api_name_or_tr_name: str) -> bool:
+    """
+    Metric'in günlük değerleri toplanarak aralık değeri elde edilebilir mi?
+    Bilinmeyen metric'ler için False (güvenli taraf).
+
+    Args:
+        api_name_or_tr_name: API adı (ör: "sessions") veya Türkçe adı (ör: "Oturum Sayısı")
+
+    Returns:
+        True ise metric gün gün toplanabilir
+    """
+    metric_info = get_metric_info(api_name_or_tr_name)
+    return bool(metric_info and metric_info.get("additive", False))
 
 
 def get_api_name_from_tr(tr_name: str) -> str:
     """
-    Türkçe isimden API adını bulur.
+    Türkçe isimden API adını bulur (büyük/küçük harf duyarsız).
 
     Args:
         tr_name: Türkçe isim (ör: "Sayfa Görüntüleme")
@@ -1891,27 +2018,7 @@ def get_api_name_from_tr(tr_name: str) -> str:
     Returns:
         API adı (ör: "screenPageViews") veya None
     """
-    # Dimension'larda ara
-    for key, value in DIMENSIONS.items():
-        if value["tr_name"].lower() == tr_name.lower():
-            return value["api_name"]
-
-    # Custom dimension'larda ara
-    for key, value in CUSTOM_DIMENSIONS.items():
-        if value["tr_name"].lower() == tr_name.lower():
-            return value["api_name"]
-
-    # Metric'lerde ara
-    for key, value in METRICS.items():
-        if value["tr_name"].lower() == tr_name.lower():
-            return value["api_name"]
-
-    # Custom metric'lerde ara
-    for key, value in CUSTOM_METRICS.items():
-        if value["tr_name"].lower() == tr_name.lower():
-            return value["api_name"]
-
-    return None
+    return _TR_TO_API_INDEX.get(tr_name.lower())
 
 
 def get_tr_name_from_api(api_name: str) -> str:
@@ -1927,25 +2034,14 @@ def get_tr_name_from_api(api_name: str) -> str:
     # Custom event prefix'ini temizle
     clean_api_name = api_name.replace("customEvent:", "")
 
-    # Dimension'larda ara
-    for key, value in DIMENSIONS.items():
-        if value["api_name"] == api_name or key == clean_api_name:
-            return value["tr_name"]
-
-    # Custom dimension'larda ara
-    for key, value in CUSTOM_DIMENSIONS.items():
-        if value["api_name"] == api_name or key == clean_api_name:
-            return value["tr_name"]
+    # API adı veya anahtar eşleşmesi - sözlük sırasında önce gelen kazanır
+    by_api = _API_TO_TR_INDEX.get(api_name)
+    by_key = _KEY_TO_TR_INDEX.get(clean_api_name)
 
-    # Metric'lerde ara
-    for key, value in METRICS.items():
-        if value["api_name"] == api_name or key == clean_api_name:
-            return value["tr_name"]
-
-    # Custom metric'lerde ara
-    for key, value in CUSTOM_METRICS.items():
-        if value["api_name"] == api_name or key == clean_api_name:
-            return value["tr_name"]
+    if by_api and by_key:
+        return min(by_api, by_key)[1]
+    if by_api or by_key:
+        return (by_api or by_key)[1]
 
     return api_name  # Bulunamazsa orijinal adı döndür
 
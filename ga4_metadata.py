@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""
+Google Analytics 4 - Property Şeması (Metadata)
+Property başına getMetadata yanıtını (dimension / metric / custom tanımlar) tutan
+şema, şemanın diskteki JSON önbelleği ve isteklerin API'ye gitmeden doğrulanması
+
+Şema property başına günde bir kez çekilir; hatalı bir dimension/metric adı
+(ör. Hürriyet'te "customEvent:vauthor") RPC ve kota harcanmadan yerelde yakalanır.
+
+Kullanım:
+    from ga4_metadata import PropertySchema, MetadataStore, InvalidQueryError
+
+    schema = PropertySchema.from_response("297156524", client.get_metadata(...))
+    store = MetadataStore("/tmp/ga4_cache/metadata")
+    store.put(schema)
+    schema = store.get("297156524")          # süresi geçmişse None
+
+    schema.validate(["pagePath", "customEvent:hcat1"], ["screenPageViews"])
+    custom = schema.discover_custom_dimensions("h", ["cat1", "editor", "publisheddate"])
+"""
+
+import difflib
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from ga4_cache import DEFAULT_CACHE_DIR, TTL_METADATA
+
+
+# getMetadata'da bulunmayan ama istekte geçerli olan dimension'lar
+# (dateRange birden fazla tarih aralığında API tarafından eklenir)
+IMPLICIT_DIMENSIONS = {"dateRange"}
+
+# Custom dimension adı eşleştirmesinde kabul edilen minimum benzerlik
+# (ör. "publisheddate" -> "customEvent:hpublishdate")
+DISCOVERY_MIN_SIMILARITY = 0.8
+
+
+class InvalidQueryError(ValueError):
+    """Sorgu property şemasında olmayan bir dimension/metric içeriyor"""
+    pass
+
+
+class PropertySchema:
+    """Bir property'nin getMetadata yanıtından çıkarılan dimension/metric şeması"""
+
+    def __init__(
+        self,
+        property_id: str,
+        dimensions: Dict[str, Dict],
+        metrics: Dict[str, Dict],
+        fetched_at: float = None
+    ):
+        """
+        Args:
+            property_id: GA4 Property ID
+            dimensions: API adı -> {"ui_name", "custom", "category"}
+            metrics: API adı -> {"ui_name", "custom", "category", "type"}
+            fetched_at: Şemanın çekildiği zaman (epoch saniye)
+        """
+        self.property_id = str(property_id)
+        self.dimensions = dimensions
+        self.metrics = metrics
+        self.fetched_at = fetched_at or time.time()
+
+        # Eski (deprecated) adlar da istekte geçerli
+        self._dimension_names = set(dimensions) | IMPLICIT_DIMENSIONS
+        self._metric_names = set(metrics)
+        for info in dimensions.values():
+            self._dimension_names.update(info.get("deprecated", []))
+        for info in metrics.values():
+            self._metric_names.update(info.get("deprecated", []))
+
+    @classmethod
+    def from_response(cls, property_id: str, response) -> "PropertySchema":
+        """getMetadata yanıtından (Metadata proto) şema oluşturur"""
+        dimensions = {
+            d.api_name: {
+                "ui_name": d.ui_name,
+                "custom": bool(d.custom_definition),
+                "category": d.category,
+                "deprecated": list(d.deprecated_api_names)
+            }
+            for d in response.dimensions
+        }
+        metrics = {
+            m.api_name: {
+                "ui_name": m.ui_name,
+                "custom": bool(m.custom_definition),
+                "category": m.category,
+                "type": m.type_.name,
+                "deprecated": list(m.deprecated_api_names)
+            }
+            for m in response.metrics
+        }
+        return cls(property_id, dimensions, metrics)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PropertySchema":
+        """to_dict çıktısından şemayı geri oluşturur"""
+        return cls(data["property_id"], data["dimensions"], data["metrics"], data["fetched_at"])
+
+    def to_dict(self) -> Dict:
+        """JSON'a yazılabilir sözlük"""
+        return {
+            "property_id": self.property_id,
+            "fetched_at": self.fetched_at,
+            "dimensions": self.dimensions,
+            "metrics": self.metrics
+        }
+
+    def has_dimension(self, api_name: str) -> bool:
+        return api_name in self._dimension_names
+
+    def has_metric(self, api_name: str) -> bool:
+        return api_name in self._metric_names
+
+    def custom_dimensions(self) -> List[str]:
+        """Property'de tanımlı custom dimension API adları"""
+        return [name for name, info in self.dimensions.items() if info.get("custom")]
+
+    def discover_custom_dimensions(
+        self,
+        prefix: str,
+        generic_names: Iterable[str],
+        known: Dict[str, str] = None
+    ) -> Dict[str, str]:
+        """
+        Jenerik custom dimension adlarını bu property'deki gerçek API adlarına eşler.
+
+        Sıra: bilinen (BRAND_PROPERTIES) ad property'de varsa o, yoksa
+        "customEvent:{prefix}{ad}", o da yoksa aynı prefix'li custom dimension'lar
+        arasında en benzer ad (ör. publisheddate -> customEvent:hpublishdate).
+
+        Args:
+            prefix: Marka prefix'i ("h", "v" ...)
+            generic_names: Jenerik adlar ("cat1", "editor", "author" ...)
+            known: Elle tanımlanmış eşleşmeler (jenerik ad -> API adı)
+
+        Returns:
+            Bulunan eşleşmeler (property'de karşılığı olmayan adlar dahil edilmez)
+        """
+        known = known or {}
+        custom = self.custom_dimensions()
+        candidates = {}
+        for name in custom:
+            suffix = name.split(":", 1)[-1]
+            if prefix and suffix.startswith(prefix):
+                candidates[suffix[len(prefix):]] = name
+
+        discovered = {}
+        for generic in generic_names:
+            if known.get(generic) and self.has_dimension(known[generic]):
+                discovered[generic] = known[generic]
+            elif self.has_dimension(f"customEvent:{prefix}{generic}"):
+                discovered[generic] = f"customEvent:{prefix}{generic}"
+            else:
+                close = difflib.get_close_matches(generic, list(candidates), n=1, cutoff=DISCOVERY_MIN_SIMILARITY)
+                if close:
+                    discovered[generic] = candidates[close[0]]
+        return discovered
+
+    def validate(
+        self,
+        dimensions: Iterable[str] = (),
+        metrics: Iterable[str] = (),
+        dimension_filter_fields: Iterable[str] = (),
+        metric_filter_fields: Iterable[str] = ()
+    ):
+        """
+        İstekteki API adlarını şemaya göre doğrular.
+
+        Raises:
+            InvalidQueryError: Şemada olmayan ad varsa (benzer ad önerileriyle)
+        """
+        problems = []
+        for name in list(dimensions) + list(dimension_filter_fields):
+            if not self.has_dimension(name):
+                problems.append(self._describe("dimension", name, self._dimension_names))
+        for name in list(metrics) + list(metric_filter_fields):
+            if not self.has_metric(name):
+                problems.append(self._describe("metric", name, self._metric_names))
+
+        if problems:
+            raise InvalidQueryError(
+                f"Property {self.property_id} şemasında bulunmayan alanlar: " + "; ".join(dict.fromkeys(problems))
+            )
+
+    @staticmethod
+    def _describe(kind: str, name: str, valid: set) -> str:
+        """Geçersiz ad için benzer ad önerili açıklama"""
+        suggestions = difflib.get_close_matches(name, list(valid), n=3, cutoff=0.6)
+        if suggestions:
+            return f"{kind} '{name}' (öneri: {', '.join(suggestions)})"
+        return f"{kind} '{name}'"
+
+
+class MetadataStore:
+    """
+    Property şemalarını dizinde property başına bir JSON dosyası olarak tutar.
+    Dosyalar atomik yazılır (geçici dosya + rename); süreçler arası paylaşılabilir.
+    """
+
+    def __init__(self, directory: str, ttl: int = TTL_METADATA):
+        """
+        Args:
+            directory: JSON dosyalarının dizini
+            ttl: Şemanın geçerli sayılacağı süre (saniye)
+        """
+        self.directory = directory
+        self.ttl = ttl
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, property_id: str) -> str:
+        return os.path.join(self.directory, f"metadata_{property_id}.json")
+
+    def get(self, property_id: str) -> Optional[PropertySchema]:
+        """Süresi geçmemiş şemayı döndürür (yoksa, eskiyse veya bozuksa None)"""
+        try:
+            with open(self._path(property_id), "r", encoding="utf-8") as f:
+                schema = PropertySchema.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError):
+            return None
+
+        if time.time() - schema.fetched_at > self.ttl:
+            return None
+        return schema
+
+    def put(self, schema: PropertySchema):
+        """Şemayı diske yazar"""
+        path = self._path(schema.property_id)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(schema.to_dict(), f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    def clear(self, property_id: str = None):
+        """Bir property'nin (verilmezse tüm property'lerin) şemasını siler"""
+        names = [os.path.basename(self._path(property_id))] if property_id else os.listdir(self.directory)
+        for name in names:
+            if name.startswith("metadata_") and name.endswith(".json"):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+
+_default_metadata_store: Optional[MetadataStore] = None
+_default_metadata_store_lock = threading.Lock()
+
+
+def get_default_metadata_store() -> Optional[MetadataStore]:
+    """
+    Süreç genelinde varsayılan şema deposunu döndürür (ilk kullanımda oluşturulur).
+
+    Returns:
+        MetadataStore veya None (GA4_DISK_CACHE=0 ise ya da dizin yazılamıyorsa)
+    """
+    global _default_metadata_store
+
+    if os.environ.get("GA4_DISK_CACHE", "1") == "0":
+        return None
+
+    with _default_metadata_store_lock:
+        if _default_metadata_store is None:
+            try:
+                _default_metadata_store = MetadataStore(os.path.join(DEFAULT_CACHE_DIR, "metadata"))
+            except Exception as e:
+                print(f"[UYARI] Sema onbellegi acilamadi: {str(e)}")
+                return None
+        return _default_metadata_store
@@ -0,0 +1,807 @@
+# -*- coding: utf-8 -*-
+"""
+Google Analytics 4 - Paylaşılan Transport
+Süreç genelinde tek credentials nesnesi ve tek kimliği doğrulanmış API client'ı
+(gRPC kanalı) tutan kayıt. GA4Client örnekleri bu kanalın üzerinde marka bazlı
+hafif görünümlerdir; oturum başlatma ve marka değiştirme yeni kanal/TLS el
+sıkışması gerektirmez.
+
+Ayrıca property kotasını yanıtlardan takip eden ve istekleri öncelik sınıfına
+göre (interaktif > dashboard > arka plan) sıraya koyan QuotaScheduler ile geçici
+hatalarda yeniden deneme, deadline ve hedge (yedek istek) desteği burada.
+
+Kullanım:
+    from ga4_transport import find_credentials_path, get_transport_client
+
+    path = find_credentials_path()
+    client = get_transport_client(path)   # aynı path için her zaman aynı client
+
+    # Arka plan ısıtma işleri canlı kullanıcıların kotasını yemesin
+    with request_priority(PRIORITY_PREFETCH):
+        ga4.run_query(...)
+
+    # Blok içindeki tüm çağrılar (yeniden denemeler dahil) 30 sn içinde bitmeli
+    with request_deadline(30):
+        ga4.run_query(...)
+"""
+
+import asyncio
+import contextvars
+import itertools
+import json
+import os
+import random
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from google.analytics.data_v1beta import BetaAnalyticsDataClient, BetaAnalyticsDataAsyncClient
+from google.api_core import exceptions as google_exceptions
+from google.oauth2 import service_account
+
+
+# Credentials dosyası bulunamazsa kullanılacak varsayılan dosya adı
+DEFAULT_CREDENTIALS_FILE = "golden-imprint-441508-d8-765863a31f54.json"
+
+_lock = threading.Lock()
+_credentials_paths: Dict[str, str] = {}          # arama dizini -> credentials yolu
+_credentials: Dict[str, object] = {}             # credentials yolu -> Credentials
+_clients: Dict[str, BetaAnalyticsDataClient] = {}  # credentials yolu -> sync client
+_async_clients: Dict[str, "weakref.WeakKeyDictionary"] = {}  # yol -> {event loop: async client}
+
+
+def find_credentials_path(search_dir: str = None) -> str:
+    """
+    Dizindeki service account JSON dosyasını bulur (dizin başına bir kez taranır).
+
+    Args:
+        search_dir: Aranacak dizin (varsayılan: bu modülün dizini)
+
+    Returns:
+        Credentials dosyasının yolu (bulunamazsa varsayılan dosya yolu)
+    """
+    search_dir = search_dir or os.path.dirname(os.path.abspath(__file__))
+
+    with _lock:
+        if search_dir in _credentials_paths:
+            return _credentials_paths[search_dir]
+
+    path = os.path.join(search_dir, DEFAULT_CREDENTIALS_FILE)
+    for file in sorted(os.listdir(search_dir)):
+        if file.endswith('.json') and 'service' not in file.lower():
+            # JSON dosyasını kontrol et
+            try:
+                with open(os.path.join(search_dir, file), 'r') as f:
+                    data = json.load(f)
+                if isinstance(data, dict) and data.get('type') == 'service_account':
+                    path = os.path.join(search_dir, file)
+                    break
+            except Exception:
+                continue
+
+    with _lock:
+        return _credentials_paths.setdefault(search_dir, path)
+
+
+def get_credentials(credentials_path: str):
+    """
+    Credentials nesnesini döndürür (yol başına bir kez yüklenir).
+
+    Args:
+        credentials_path: Service account JSON dosyasının yolu
+
+    Returns:
+        google.oauth2.service_account.Credentials
+    """
+    with _lock:
+        credentials = _credentials.get(credentials_path)
+        if credentials is None:
+            credentials = service_account.Credentials.from_service_account_file(credentials_path)
+            _credentials[credentials_path] = credentials
+        return credentials
+
+
+def get_transport_client(credentials_path: str) -> BetaAnalyticsDataClient:
+    """
+    Paylaşılan sync API client'ını döndürür (yol başına tek gRPC kanalı).
+    Client property'den bağımsızdır; tüm markalar aynı kanalı kullanır.
+
+    Args:
+        credentials_path: Service account JSON dosyasının yolu
+
+    Returns:
+        BetaAnalyticsDataClient
+    """
+    credentials = get_credentials(credentials_path)
+
+    with _lock:
+        client = _clients.get(credentials_path)
+        if client is None:
+            client = BetaAnalyticsDataClient(credentials=credentials)
+            _clients[credentials_path] = client
+        return client
+
+
+def get_async_transport_client(credentials_path: str, loop) -> BetaAnalyticsDataAsyncClient:
+    """
+    Event loop başına paylaşılan async API client'ını döndürür.
+    gRPC asyncio kanalı oluşturulduğu loop'a bağlı olduğundan loop başına bir client tutulur;
+    loop kapanıp çöp toplandığında kaydı da silinir.
+
+    Args:
+        credentials_path: Service account JSON dosyasının yolu
+        loop: Çalışan event loop
+
+    Returns:
+        BetaAnalyticsDataAsyncClient
+    """
+    credentials = get_credentials(credentials_path)
+
+    with _lock:
+        per_loop = _async_clients.setdefault(credentials_path, weakref.WeakKeyDictionary())
+        client = per_loop.get(loop)
+        if client is None:
+            client = BetaAnalyticsDataAsyncClient(credentials=credentials)
+            per_loop[loop] = client
+        return client
+
+
+def clear_registry(credentials_path: Optional[str] = None):
+    """
+    Kayıtlı credentials ve client'ları unutur (credentials dosyası değiştiyse).
+
+    Args:
+        credentials_path: Sadece bu yolun kayıtlarını sil (None ise tümü)
+    """
+    with _lock:
+        if credentials_path is None:
+            _credentials_paths.clear()
+            _credentials.clear()
+            _clients.clear()
+            _async_clients.clear()
+        else:
+            _credentials.pop(credentials_path, None)
+            _clients.pop(credentials_path, None)
+            _async_clients.pop(credentials_path, None)
+
+
+# =============================================================================
+# KOTA ZAMANLAYICI
+# =============================================================================
+
+# Öncelik sınıfları - küçük değer önce çalışır
+PRIORITY_INTERACTIVE = 0   # Canlı chat sorguları
+PRIORITY_DASHBOARD = 1     # Dashboard / rapor görünümleri
+PRIORITY_PREFETCH = 2      # Arka plan ön yükleme, önbellek ısıtma
+
+# Sınıf politikaları
+# - token_reserve: Saatlik/günlük kapasitenin bu oranı üst sınıflar için ayrılır
+# - concurrency_share: Property'nin eşzamanlı istek limitinin kullanılabilecek oranı
+PRIORITY_POLICY = {
+    PRIORITY_INTERACTIVE: {"token_reserve": 0.0, "concurrency_share": 1.0},
+    PRIORITY_DASHBOARD: {"token_reserve": 0.10, "concurrency_share": 0.8},
+    PRIORITY_PREFETCH: {"token_reserve": 0.30, "concurrency_share": 0.4},
+}
+
+# Standart (360 olmayan) property kotaları - yanıtlarda daha yüksek değer görülürse büyütülür
+DEFAULT_TOKENS_PER_HOUR = 40000
+DEFAULT_TOKENS_PER_DAY = 200000
+DEFAULT_CONCURRENT_REQUESTS = 10
+
+# Tahmini istek maliyeti (token) - yanıtlardaki gerçek tüketimle güncellenir
+DEFAULT_REQUEST_COST = 10
+
+_priority_var = contextvars.ContextVar("ga4_request_priority", default=PRIORITY_INTERACTIVE)
+
+
+@contextmanager
+def request_priority(priority: int):
+    """
+    Blok içinde yapılan GA4 isteklerinin öncelik sınıfını belirler.
+
+    Args:
+        priority: PRIORITY_INTERACTIVE, PRIORITY_DASHBOARD veya PRIORITY_PREFETCH
+    """
+    token = _priority_var.set(priority)
+    try:
+        yield
+    finally:
+        _priority_var.reset(token)
+
+
+def current_priority() -> int:
+    """Geçerli bağlamın öncelik sınıfı (varsayılan: interaktif)"""
+    return _priority_var.get()
+
+
+def context_map(pool, fn, items):
+    """
+    pool.map gibi çalışır ama her görev çağıranın contextvars bağlamının bir
+    kopyasında çalışır (öncelik ve deadline thread havuzuna taşınır).
+    """
+    items = list(items)
+    contexts = [contextvars.copy_context() for _ in items]
+    return pool.map(lambda pair: pair[0].run(fn, pair[1]), zip(contexts, items))
+
+
+def _quota_window_keys(now: datetime = None) -> tuple:
+    """
+    GA4 kota pencereleri Pasifik saatine göre sıfırlanır.
+    (saat anahtarı, gün anahtarı) döndürür.
+    """
+    if now is None:
+        try:
+            from zoneinfo import ZoneInfo
+            now = datetime.now(ZoneInfo("America/Los_Angeles"))
+        except Exception:
+            now = datetime.now(timezone(timedelta(hours=-8)))
+    return now.strftime("%Y%m%d%H"), now.strftime("%Y%m%d")
+
+
+class QuotaExceededError(Exception):
+    """Property kotası tükendiğinde veya kuyrukta bekleme süresi dolduğunda"""
+
+
+class QuotaScheduler:
+    """
+    Property bazında token kovaları ve öncelik kuyruğu tutan zamanlayıcı.
+
+    - Her yanıtın property_quota alanından kalan saatlik/günlük token okunur
+    - Devam eden isteklerin tahmini maliyeti kalan tokenlardan düşülür
+    - Eşzamanlı istek sayısı property limitinin sınıf payıyla sınırlanır
+    - Bekleyen daha yüksek öncelikli istek varsa düşük öncelikliler başlayamaz;
+      düşük sınıflar ayrıca kapasitenin bir kısmını üst sınıflara bırakır
+    """
+
+    def __init__(
+        self,
+        tokens_per_hour: int = DEFAULT_TOKENS_PER_HOUR,
+        tokens_per_day: int = DEFAULT_TOKENS_PER_DAY,
+        concurrent_requests: int = DEFAULT_CONCURRENT_REQUESTS,
+        queue_timeout: float = 60.0
+    ):
+        """
+        Zamanlayıcıyı başlatır.
+
+        Args:
+            tokens_per_hour: Varsayılan saatlik token kapasitesi
+            tokens_per_day: Varsayılan günlük token kapasitesi
+            concurrent_requests: Property başına eşzamanlı istek limiti
+            queue_timeout: Kuyrukta en fazla bekleme süresi (saniye)
+        """
+        self.tokens_per_hour = tokens_per_hour
+        self.tokens_per_day = tokens_per_day
+        self.concurrent_requests = concurrent_requests
+        self.queue_timeout = queue_timeout
+        self._cond = threading.Condition()
+        self._buckets: Dict[str, dict] = {}
+        self._seq = itertools.count()
+
+    def _bucket(self, property_id: str) -> dict:
+        """Property kovasını döndürür; kota penceresi değiştiyse sıfırlar"""
+        hour_key, day_key = _quota_window_keys()
+        bucket = self._buckets.get(property_id)
+        if bucket is None:
+            bucket = {
+                "hour_key": hour_key, "day_key": day_key,
+                "hour_remaining": None, "day_remaining": None,   # None: henüz yanıt görülmedi
+                "hour_capacity": self.tokens_per_hour, "day_capacity": self.tokens_per_day,
+                "concurrent_limit": self.concurrent_requests,
+                "in_flight": 0, "reserved": 0, "cost": DEFAULT_REQUEST_COST,
+                "waiting": [], "requests": 0
+            }
+            self._buckets[property_id] = bucket
+        if bucket["hour_key"] != hour_key:
+            bucket["hour_key"] = hour_key
+            bucket["hour_remaining"] = None
+        if bucket["day_key"] != day_key:
+            bucket["day_key"] = day_key
+            bucket["day_remaining"] = None
+        return bucket
+
+    @staticmethod
+    def _available(bucket: dict, window: str) -> float:
+        """Penceredeki kullanılabilir token tahmini (devam eden istekler düşülmüş)"""
+        remaining = bucket[f"{window}_remaining"]
+        if remaining is None:
+            remaining = bucket[f"{window}_capacity"]
+        return remaining - bucket["reserved"]
+
+    def _can_start(self, bucket: dict, priority: int, seq: int) -> bool:
+        """Verilen öncelikteki istek şimdi başlayabilir mi"""
+        # Daha yüksek öncelikli (veya aynı sınıfta önce gelen) bekleyen varsa sıra onda
+        if any((p, s) < (priority, seq) for p, s in bucket["waiting"]):
+            return False
+
+        policy = PRIORITY_POLICY.get(priority, PRIORITY_POLICY[PRIORITY_PREFETCH])
+        if bucket["in_flight"] >= max(1, int(bucket["concurrent_limit"] * policy["concurrency_share"])):
+            return False
+
+        for window in ("hour", "day"):
+            reserve = bucket[f"{window}_capacity"] * policy["token_reserve"]
+            if self._available(bucket, window) - bucket["cost"] < reserve:
+                return False
+        return True
+
+    def acquire(self, property_id: str, priority: int = None, timeout: float = None) -> dict:
+        """
+        İstek için sıra bekler ve slot ayırır.
+
+        Args:
+            property_id: GA4 Property ID
+            priority: Öncelik sınıfı (None ise bağlamdaki öncelik)
+            timeout: Kuyrukta bekleme sınırı (None ise queue_timeout ve kalan deadline'dan küçüğü)
+
+        Returns:
+            release/record'a verilecek bilet
+
+        Raises:
+            QuotaExceededError: Kota tükenmişse veya bekleme süresi dolduysa
+        """
+        priority = current_priority() if priority is None else priority
+        if timeout is None:
+            # Kuyrukta bekleme isteğin deadline'ını aşmasın
+            timeout = self.queue_timeout
+            remaining = remaining_time()
+            if remaining is not None:
+                timeout = min(timeout, remaining)
+        deadline = time.monotonic() + timeout
+
+        with self._cond:
+            entry = (priority, next(self._seq))
+            bucket = self._bucket(property_id)
+            bucket["waiting"].append(entry)
+            try:
+                while True:
+                    bucket = self._bucket(property_id)
+                    if bucket["hour_remaining"] == 0 or bucket["day_remaining"] == 0:
+                        raise QuotaExceededError(
+                            f"GA4 kota sınırına ulaşıldı (Property: {property_id}) - "
+                            f"saatlik kalan: {bucket['hour_remaining']}, günlük kalan: {bucket['day_remaining']}"
+                        )
+                    if self._can_start(bucket, *entry):
+                        break
+
+                    wait = deadline - time.monotonic()
+                    if wait <= 0:
+                        raise QuotaExceededError(
+                            f"GA4 istek kuyruğunda bekleme süresi doldu (Property: {property_id})"
+                        )
+                    # Kota penceresi dönebileceği için süresiz beklenmez
+                    self._cond.wait(min(wait, 1.0))
+            finally:
+                bucket["waiting"].remove(entry)
+                self._cond.notify_all()
+
+            ticket = {"property_id": property_id, "cost": bucket["cost"], "priority": priority}
+            bucket["in_flight"] += 1
+            bucket["reserved"] += ticket["cost"]
+            bucket["requests"] += 1
+            return ticket
+
+    def release(self, ticket: dict):
+        """Slotu ve ayrılmış token tahminini serbest bırakır"""
+        with self._cond:
+            bucket = self._bucket(ticket["property_id"])
+            bucket["in_flight"] -= 1
+            bucket["reserved"] -= ticket["cost"]
+            self._cond.notify_all()
+
+    def record(self, ticket: dict, property_quota):
+        """
+        Yanıttaki property_quota ile kovayı günceller.
+
+        Args:
+            ticket: acquire'dan dönen bilet
+            property_quota: Yanıtın property_quota alanı (return_property_quota=True)
+        """
+        if property_quota is None:
+            return
+
+        with self._cond:
+            bucket = self._bucket(ticket["property_id"])
+            for window, field in (("hour", "tokens_per_hour"), ("day", "tokens_per_day")):
+                status = getattr(property_quota, field, None)
+                if status is None or (status.consumed == 0 and status.remaining == 0):
+                    continue
+                # Paralel yanıtlar sırasız gelebilir - pencere içinde en düşük kalan doğrudur
+                current = bucket[f"{window}_remaining"]
+                bucket[f"{window}_remaining"] = status.remaining if current is None else min(current, status.remaining)
+                bucket[f"{window}_capacity"] = max(bucket[f"{window}_capacity"], status.remaining + status.consumed)
+                if window == "hour" and status.consumed > 0:
+                    # Tahmini maliyet - üstel hareketli ortalama
+                    bucket["cost"] = max(1, round(0.8 * bucket["cost"] + 0.2 * status.consumed))
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, property_id: str, priority: int = None):
+        """
+        acquire/release çifti.
+
+            with scheduler.slot(property_id) as ticket:
+                response = client.run_report(request)
+                scheduler.record(ticket, response.property_quota)
+        """
+        ticket = self.acquire(property_id, priority)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    @asynccontextmanager
+    async def async_slot(self, property_id: str, priority: int = None):
+        """
+        slot'un asyncio sürümü - bekleme event loop'u bloklamadan thread'de yapılır.
+
+        Görev kuyruktayken iptal edilirse (wait_for, hedge kaybedeni) thread beklemeye
+        devam eder; aldığı bilet hemen geri verilir, slot sızmaz.
+        """
+        waiter = asyncio.ensure_future(asyncio.to_thread(self.acquire, property_id, priority))
+        try:
+            ticket = await asyncio.shield(waiter)
+        except asyncio.CancelledError:
+            waiter.add_done_callback(self._release_abandoned)
+            raise
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def _release_abandoned(self, waiter: asyncio.Future):
+        """İptal edilen async_slot'un thread'de aldığı bileti serbest bırakır"""
+        if not waiter.cancelled() and waiter.exception() is None:
+            self.release(waiter.result())
+
+    def stats(self, property_id: str = None) -> Dict:
+        """
+        Kota durumunu döndürür.
+
+        Args:
+            property_id: Sadece bu property (None ise tümü)
+        """
+        with self._cond:
+            ids = [property_id] if property_id else list(self._buckets.keys())
+            result = {}
+            for pid in ids:
+                bucket = self._bucket(pid)
+                result[pid] = {
+                    "hour_remaining": bucket["hour_remaining"],
+                    "day_remaining": bucket["day_remaining"],
+                    "hour_capacity": bucket["hour_capacity"],
+                    "day_capacity": bucket["day_capacity"],
+                    "in_flight": bucket["in_flight"],
+                    "waiting": len(bucket["waiting"]),
+                    "request_cost": bucket["cost"],
+                    "requests": bucket["requests"]
+                }
+            return result
+
+
+# =============================================================================
+# YENİDEN DENEME, DEADLINE VE HEDGE
+# =============================================================================
+
+# Deadline yoksa tek bir API çağrısı için üst sınır (saniye)
+DEFAULT_CALL_TIMEOUT = 60.0
+
+# Geçici hatalar - UNAVAILABLE, DEADLINE_EXCEEDED, RESOURCE_EXHAUSTED
+RETRYABLE_ERRORS = (
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.ResourceExhausted,
+)
+
+_deadline_var = contextvars.ContextVar("ga4_request_deadline", default=None)
+
+# Hedge (yedek) istekleri için paylaşılan thread havuzu
+_hedge_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="ga4-hedge")
+
+
+class RequestTimeoutError(Exception):
+    """İsteğin deadline'ı dolduğunda"""
+
+
+@contextmanager
+def request_deadline(seconds: float):
+    """
+    Blok içindeki tüm GA4 çağrıları için mutlak bir deadline belirler.
+    İç içe kullanımda daha erken olan deadline geçerlidir.
+
+    Args:
+        seconds: Şu andan itibaren kalan süre
+    """
+    deadline = time.monotonic() + seconds
+    current = _deadline_var.get()
+    if current is not None:
+        deadline = min(deadline, current)
+
+    token = _deadline_var.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline_var.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Geçerli deadline'a kalan süre (deadline yoksa None)"""
+    deadline = _deadline_var.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+class LatencyTracker:
+    """Son başarılı çağrıların sürelerinden yüzdelik (p95 vb.) hesaplar"""
+
+    def __init__(self, window: int = 200):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def quantile(self, q: float, min_samples: int = 20) -> Optional[float]:
+        """q yüzdeliğindeki süre (yeterli örnek yoksa None)"""
+        with self._lock:
+            if len(self._samples) < min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class RetryPolicy:
+    """Geçici hatalarda üstel geri çekilme + jitter ile yeniden deneme ve opsiyonel hedge ayarları"""
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        initial_backoff: float = 0.5,
+        max_backoff: float = 8.0,
+        multiplier: float = 2.0,
+        call_timeout: float = DEFAULT_CALL_TIMEOUT,
+        hedge: bool = False,
+        hedge_quantile: float = 0.95,
+        hedge_min_samples: int = 20
+    ):
+        """
+        Args:
+            max_attempts: Toplam deneme sayısı (ilk deneme dahil)
+            initial_backoff: İlk bekleme üst sınırı (saniye)
+            max_backoff: Bekleme üst sınırı (saniye)
+            multiplier: Her denemede bekleme sınırı çarpanı
+            call_timeout: Deadline yoksa çağrı başına süre sınırı
+            hedge: Yavaş çağrılarda ikinci (yedek) istek gönder
+            hedge_quantile: Yedek isteğin gönderileceği gecikme yüzdeliği (0.95 = p95)
+            hedge_min_samples: Hedge için gereken minimum gecikme örneği
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.multiplier = multiplier
+        self.call_timeout = call_timeout
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+
+    def backoff(self, attempt: int) -> float:
+        """attempt. hatadan sonra beklenecek süre - full jitter"""
+        cap = min(self.max_backoff, self.initial_backoff * (self.multiplier ** attempt))
+        return random.uniform(0, cap)
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        return isinstance(error, RETRYABLE_ERRORS)
+
+    def attempt_timeout(self) -> float:
+        """
+        Bu deneme için süre sınırı - deadline varsa kalan süre.
+
+        Raises:
+            RequestTimeoutError: Deadline dolmuşsa
+        """
+        remaining = remaining_time()
+        if remaining is None:
+            return self.call_timeout
+        if remaining <= 0:
+            raise RequestTimeoutError("GA4 isteği zaman aşımına uğradı (deadline doldu)")
+        return min(remaining, self.call_timeout)
+
+    def hedge_delay(self, tracker: Optional[LatencyTracker], timeout: float) -> Optional[float]:
+        """Yedek isteğin gönderileceği gecikme (hedge kapalıysa veya anlamsızsa None)"""
+        if not self.hedge or tracker is None:
+            return None
+        delay = tracker.quantile(self.hedge_quantile, self.hedge_min_samples)
+        if delay is None or delay >= timeout:
+            return None
+        return delay
+
+
+def call_with_retry(fn, policy: RetryPolicy = None, tracker: LatencyTracker = None):
+    """
+    fn(timeout) çağrısını geçici hatalarda yeniden dener.
+
+    Args:
+        fn: Süre sınırını (saniye) alıp API çağrısı yapan fonksiyon
+        policy: Yeniden deneme ayarları
+        tracker: Gecikme takipçisi - hedge eşiği (p95) buradan okunur;
+            başarılı çağrı sürelerini fn kaydeder (kuyrukta bekleme sayılmasın diye)
+
+    Returns:
+        fn sonucu
+
+    Raises:
+        RequestTimeoutError: Deadline dolduysa
+        Exception: Geçici olmayan hata veya denemeler tükendiyse son hata
+    """
+    policy = policy or RetryPolicy()
+
+    for attempt in range(policy.max_attempts):
+        timeout = policy.attempt_timeout()
+        try:
+            return _hedged_call(fn, timeout, policy, tracker)
+        except Exception as e:
+            if not policy.is_retryable(e) or attempt == policy.max_attempts - 1:
+                raise
+            delay = policy.backoff(attempt)
+            remaining = remaining_time()
+            if remaining is not None and delay >= remaining:
+                raise RequestTimeoutError(f"GA4 isteği zaman aşımına uğradı: {str(e)}")
+            print(f"[UYARI] GA4 gecici hata, {delay:.2f} sn sonra tekrar denenecek ({attempt + 1}/{policy.max_attempts}): {str(e)}")
+            time.sleep(delay)
+
+
+def _hedged_call(fn, timeout: float, policy: RetryPolicy, tracker: Optional[LatencyTracker]):
+    """
+    Çağrıyı yapar; hedge açıksa ve çağrı p95 eşiğini aşarsa ikinci bir istek
+    gönderir, önce başarıyla biteni döndürür.
+    """
+    delay = policy.hedge_delay(tracker, timeout)
+    if delay is None:
+        return fn(timeout)
+
+    started = time.monotonic()
+    primary = _hedge_pool.submit(contextvars.copy_context().run, fn, timeout)
+    done, _ = wait([primary], timeout=delay)
+    if done:
+        return primary.result()
+
+    remaining = max(0.001, timeout - (time.monotonic() - started))
+    secondary = _hedge_pool.submit(contextvars.copy_context().run, fn, remaining)
+    pending = {primary, secondary}
+    error = None
+    while pending:
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        if not done:
+            break
+        for future in done:
+            if future.exception() is None:
+                return future.result()
+            error = future.exception()
+        remaining = max(0.001, timeout - (time.monotonic() - started))
+
+    if error is not None:
+        raise error
+    raise google_exceptions.DeadlineExceeded("GA4 isteği süre sınırını aştı")
+
+
+async def async_call_with_retry(fn, policy: RetryPolicy = None, tracker: LatencyTracker = None):
+    """call_with_retry'ın asyncio sürümü - fn(timeout) awaitable döndürür"""
+    policy = policy or RetryPolicy()
+
+    for attempt in range(policy.max_attempts):
+        timeout = policy.attempt_timeout()
+        try:
+            return await _async_hedged_call(fn, timeout, policy, tracker)
+        except Exception as e:
+            if not policy.is_retryable(e) or attempt == policy.max_attempts - 1:
+                raise
+            delay = policy.backoff(attempt)
+            remaining = remaining_time()
+            if remaining is not None and delay >= remaining:
+                raise RequestTimeoutError(f"GA4 isteği zaman aşımına uğradı: {str(e)}")
+            print(f"[UYARI] GA4 gecici hata, {delay:.2f} sn sonra tekrar denenecek ({attempt + 1}/{policy.max_attempts}): {str(e)}")
+            await asyncio.sleep(delay)
+
+
+async def _async_timed(fn, timeout: float):
+    """fn(timeout) awaitable'ını süre sınırıyla bekler"""
+    return await asyncio.wait_for(fn(timeout), timeout)
+
+
+async def _async_hedged_call(fn, timeout: float, policy: RetryPolicy, tracker: Optional[LatencyTracker]):
+    """_hedged_call'ın asyncio sürümü"""
+    delay = policy.hedge_delay(tracker, timeout)
+    if delay is None:
+        try:
+            return await _async_timed(fn, timeout)
+        except asyncio.TimeoutError:
+            raise google_exceptions.DeadlineExceeded("GA4 isteği süre sınırını aştı")
+
+    started = time.monotonic()
+    tasks = {asyncio.ensure_future(_async_timed(fn, timeout))}
+    done, _ = await asyncio.wait(tasks, timeout=delay)
+    if not done:
+        remaining = max(0.001, timeout - (time.monotonic() - started))
+        tasks.add(asyncio.ensure_future(_async_timed(fn, remaining)))
+
+    error = None
+    pending = tasks
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+    finally:
+        for task in pending:
+            task.cancel()
+
+    if isinstance(error, asyncio.TimeoutError):
+        raise google_exceptions.DeadlineExceeded("GA4 isteği süre sınırını aştı")
+    raise error
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("GA4 TRANSPORT TEST")
+    print("=" * 60)
+
+    async def _cancel_queued_slot():
+        """Dolu zamanlayıcıda kuyruktaki async_slot iptal edilince slot sızmamalı"""
+        scheduler = QuotaScheduler(concurrent_requests=2, queue_timeout=5.0)
+        holders = [scheduler.acquire("p", PRIORITY_INTERACTIVE) for _ in range(2)]
+
+        async def use_slot():
+            async with scheduler.async_slot("p", PRIORITY_INTERACTIVE):
+                await asyncio.sleep(0)
+
+        try:
+            await asyncio.wait_for(use_slot(), 0.1)
+        except asyncio.TimeoutError:
+            pass
+
+        for ticket in holders:
+            scheduler.release(ticket)
+        # Thread slotu alıp geri verene kadar bekle
+        for _ in range(100):
+            stats = scheduler.stats("p")["p"]
+            if stats["waiting"] == 0 and stats["in_flight"] == 0:
+                break
+            await asyncio.sleep(0.02)
+        return scheduler.stats("p")["p"]
+
+    print("\n--- Test: Kuyruktaki async_slot iptali ---")
+    stats = asyncio.run(_cancel_queued_slot())
+    assert stats["in_flight"] == 0 and stats["waiting"] == 0, stats
+    print(f"  [OK] in_flight={stats['in_flight']}, waiting={stats['waiting']}")
+
+    async def _cancel_singleflight_leader():
+        """Lider iptal edilince (wait_for) aynı çağrıyı bekleyen diğer istek sonucu almalı"""
+        from ga4_cache import AsyncSingleFlight
+
+        flight = AsyncSingleFlight()
+
+        async def report():
+            await asyncio.sleep(0.2)
+            return "rapor"
+
+        leader = asyncio.ensure_future(asyncio.wait_for(flight.do("k", report), 0.05))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("k", report))
+        try:
+            await leader
+        except asyncio.TimeoutError:
+            pass
+        return await follower, flight.stats()
+
+    print("\n--- Test: AsyncSingleFlight liderinin iptali ---")
+    result, flight_stats = asyncio.run(_cancel_singleflight_leader())
+    assert result == "rapor" and flight_stats["in_flight"] == 0, (result, flight_stats)
+    print(f"  [OK] takipci sonucu={result!r}, {flight_stats}")